@@ -111,6 +111,28 @@ def _confirm_with_timeout(
     return False
 
 
+def print_worker_results(
+    future: Any, service: str, task: str, richconsole: Console, stats: dict
+) -> None:
+    """Print one line for each worker that returned job results since last call."""
+    time_format = "%d-%b-%Y %H:%M:%S.%f"
+    for worker, result in future.iter_results(block=False):
+        failed = isinstance(result, dict) and result.get("failed") is True
+        stats["workers"].add(worker)
+        print_event(
+            {
+                "service": service,
+                "worker": worker,
+                "task": task,
+                "timestamp": datetime.now().strftime(time_format)[:-3],
+                "message": "job results received",
+                "severity": "ERROR" if failed else "INFO",
+                "status": "failed" if failed else "completed",
+            },
+            richconsole,
+        )
+
+
 def collect_input_request(
     future: Any, event: dict, richconsole: Console = None, outputter: callable = None
 ) -> None:
@@ -228,6 +250,8 @@ def run_future_job(
         worker = "" if worker is None else str(worker).strip()
         if worker:
             stats["workers"].add(worker)
+        print_worker_results(future, service, task, richconsole, stats)
+    print_worker_results(future, service, task, richconsole, stats)
 
     elapsed = round(time.time() - start_time, 3)
     result = future.result(markdown=markdown)
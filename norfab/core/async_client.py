@@ -0,0 +1,630 @@
+"""
+Asyncio NorFab client built on ``zmq.asyncio``.
+
+``AsyncNFPClient`` speaks the same NFP protocol as ``NFPClient`` but runs
+entirely within asyncio event loop - single receiver task reads broker
+socket and resolves jobs, while callers await job results instead of
+blocking a thread per job. Jobs state kept in memory, use ``NFPClient`` for
+jobs that need to survive client restart or for files download.
+"""
+
+import asyncio
+import logging
+import os
+import time
+from typing import Any, AsyncIterator, List, Optional, Tuple, Union
+from uuid import uuid4
+
+import orjson
+import zmq
+import zmq.asyncio
+import zmq.auth
+
+from norfab.core import NFP
+from norfab.core.inventory import NorFabInventory
+from norfab.core.security import generate_certificates
+from norfab.models import InputResponseModel
+from norfab.utils.markdown_results import markdown_results
+
+log = logging.getLogger(__name__)
+
+
+class AsyncNFPJob:
+    """
+    Awaitable handle for one job submitted by ``AsyncNFPClient``.
+
+    Args:
+        client: Client that submitted the job.
+        uuid: Job UUID.
+        service: Service name.
+        task: Task name.
+        workers: Workers job requested to run on.
+        args: Task positional arguments.
+        kwargs: Task keyword arguments.
+        timeout: Job timeout in seconds.
+    """
+
+    def __init__(
+        self,
+        client: "AsyncNFPClient",
+        uuid: str,
+        service: str,
+        task: str,
+        workers: Union[str, list],
+        args: list,
+        kwargs: dict,
+        timeout: int,
+    ) -> None:
+        self.client = client
+        self.uuid = uuid
+        self.service = service
+        self.task = task
+        self.workers = workers
+        self.args = args
+        self.kwargs = kwargs
+        self.timeout = timeout
+        self.deadline = time.time() + timeout
+        self.status = "SUBMITTING"
+        self.errors = []
+        self.workers_dispatched = set()
+        self.workers_started = set()
+        self.workers_completed = set()
+        self.result_data = {}
+        self.last_poll = time.time()
+        self.created_at = time.strftime("%Y-%m-%d %H:%M:%S")
+        self.completed_timestamp = None
+        self.completed_time = None
+        self.history = []
+        self.subscribers = []
+        self.done_event = asyncio.Event()
+
+    def as_dict(self) -> dict:
+        """Return job details in the same format as NFPClient jobs database."""
+        return {
+            "uuid": self.uuid,
+            "service": self.service,
+            "task": self.task,
+            "args": self.args,
+            "kwargs": self.kwargs,
+            "status": self.status,
+            "workers_requested": self.workers,
+            "workers_dispatched": sorted(self.workers_dispatched),
+            "workers_started": sorted(self.workers_started),
+            "workers_completed": sorted(self.workers_completed),
+            "result_data": self.result_data,
+            "errors": self.errors,
+            "created_at": self.created_at,
+            "completed_timestamp": self.completed_timestamp,
+        }
+
+    def mark_done(self, status: str) -> None:
+        if not self.done_event.is_set():
+            self.status = status
+            self.completed_timestamp = time.ctime()
+            self.completed_time = time.time()
+            self.done_event.set()
+            for queue in self.subscribers:
+                queue.put_nowait(None)
+            self.subscribers.clear()
+
+    def publish(self, kind: str, item: Any) -> None:
+        """
+        Record job event or result in job history and send it to subscribers.
+
+        Args:
+            kind: ``event`` or ``result``
+            item: Event dictionary or ``(worker_name, result)`` tuple
+        """
+        self.history.append((kind, item))
+        for queue in self.subscribers:
+            queue.put_nowait((kind, item))
+
+    def subscribe(self) -> asyncio.Queue:
+        """
+        Return queue with job events and results history followed by new
+        events and results, ``None`` put in queue once job completes.
+        """
+        queue = asyncio.Queue()
+        for item in self.history:
+            queue.put_nowait(item)
+        if self.done_event.is_set():
+            queue.put_nowait(None)
+        else:
+            self.subscribers.append(queue)
+        return queue
+
+    def unsubscribe(self, queue: asyncio.Queue) -> None:
+        """Stop sending job events and results to subscriber queue."""
+        if queue in self.subscribers:
+            self.subscribers.remove(queue)
+
+    def add_results(self, results: dict) -> None:
+        for worker, result in results.items():
+            if worker in self.workers_completed:
+                continue
+            self.workers_completed.add(worker)
+            self.result_data[worker] = result
+            self.publish("result", (worker, result))
+        self.check_completed()
+
+    def check_completed(self) -> None:
+        """Mark job completed once all dispatched workers returned results."""
+        if self.workers_dispatched and self.workers_completed >= (
+            self.workers_dispatched
+        ):
+            log.debug(f"{self.client.name} - job {self.uuid} completed")
+            self.mark_done("COMPLETED")
+
+    async def result(
+        self, timeout: Optional[float] = None, markdown: bool = False
+    ) -> Any:
+        """
+        Wait for job to complete and return workers results.
+
+        Args:
+            timeout: Seconds to wait for, waits until job completes or
+                reaches its deadline by default
+            markdown: If True, return results markdown representation
+
+        Returns:
+            Results keyed by worker name or None if job failed or timed out.
+        """
+        try:
+            await asyncio.wait_for(self.done_event.wait(), timeout)
+        except asyncio.TimeoutError:
+            return None
+        if markdown:
+            return markdown_results(
+                self.as_dict(), self.service, self.task, self.kwargs
+            )
+        return self.result_data if self.status == "COMPLETED" else None
+
+    async def events(self) -> AsyncIterator[dict]:
+        """Asynchronously yield job events since job start until job completes."""
+        queue = self.subscribe()
+        try:
+            while True:
+                item = await queue.get()
+                if item is None:
+                    return
+                kind, event = item
+                if kind == "event":
+                    yield event
+        finally:
+            self.unsubscribe(queue)
+
+    async def iter_results(
+        self, timeout: Optional[float] = None
+    ) -> AsyncIterator[Tuple[str, Any]]:
+        """
+        Asynchronously yield ``(worker_name, result)`` tuples as each worker
+        completes the job.
+
+        Args:
+            timeout: Maximum seconds to wait for all results
+        """
+        deadline = None if timeout is None else time.time() + timeout
+        queue = self.subscribe()
+        try:
+            while True:
+                remaining = None if deadline is None else deadline - time.time()
+                if remaining is not None and remaining <= 0:
+                    return
+                try:
+                    item = await asyncio.wait_for(queue.get(), remaining)
+                except asyncio.TimeoutError:
+                    return
+                if item is None:
+                    return
+                kind, result = item
+                if kind == "result":
+                    yield result
+        finally:
+            self.unsubscribe(queue)
+
+    async def send_response(
+        self,
+        input_id: str,
+        value: Any,
+        worker: str = None,
+        cancel: bool = False,
+        metadata: dict = None,
+    ) -> None:
+        """Send response to the worker input request."""
+        payload = InputResponseModel(
+            input_id=input_id,
+            value=value,
+            cancel=cancel,
+            metadata=metadata or {},
+        ).model_dump()
+        await self.client.send_to_broker(
+            NFP.PUT,
+            self.service,
+            worker or sorted(self.workers_dispatched) or self.workers,
+            self.uuid,
+            payload,
+        )
+
+
+class AsyncNFPClient:
+    """
+    Asyncio NorFab client.
+
+    Broker connection and receiver task started on first use within running
+    event loop, all client coroutines must be awaited from that same loop.
+
+    Args:
+        inventory: NorFab inventory object.
+        broker: Broker endpoint URL.
+        name: Client name, must be unique within NorFab deployment.
+        exit_event: Event to signal client to stop.
+    """
+
+    def __init__(
+        self,
+        inventory: NorFabInventory,
+        broker: str,
+        name: str,
+        exit_event: Any = None,
+    ) -> None:
+        self.inventory = inventory
+        self.name = name
+        self.broker = broker
+        self.exit_event = exit_event
+        self.zmq_auth = self.inventory.broker.get("zmq_auth", True)
+        self.poll_interval = self.inventory.client.get("poll_interval", 5)
+        self.build_message = NFP.MessageBuilder()
+        self.base_dir = os.path.join(
+            self.inventory.base_dir, "__norfab__", "files", "client", self.name
+        )
+        os.makedirs(self.base_dir, exist_ok=True)
+        self.ctx = None
+        self.broker_socket = None
+        self.jobs = {}  # job uuid -> AsyncNFPJob
+        self.mmi_requests = {}  # request uuid -> asyncio.Future
+        self.tasks = []
+        self.stats_send_to_broker = 0
+        self.stats_recv_from_broker = 0
+        self.stats_recv_event_from_broker = 0
+
+        if self.zmq_auth is not False:
+            generate_certificates(
+                self.base_dir,
+                cert_name=self.name,
+                broker_keys_dir=os.path.join(
+                    self.inventory.base_dir,
+                    "__norfab__",
+                    "files",
+                    "broker",
+                    "public_keys",
+                ),
+                inventory=self.inventory,
+            )
+
+    @staticmethod
+    def ensure_bytes(value: Any) -> bytes:
+        if isinstance(value, bytes):
+            return value
+        if isinstance(value, str):
+            return value.encode("utf-8")
+        return orjson.dumps(value)
+
+    async def start(self) -> None:
+        """Connect to broker and start receiver and poller tasks."""
+        if self.broker_socket is not None:
+            return
+        self.ctx = zmq.asyncio.Context()
+        self.broker_socket = self.ctx.socket(zmq.DEALER)
+        self.broker_socket.setsockopt_unicode(zmq.IDENTITY, self.name, "utf8")
+        self.broker_socket.linger = 0
+
+        if self.zmq_auth is not False:
+            client_public, client_secret = zmq.auth.load_certificate(
+                os.path.join(self.base_dir, "private_keys", f"{self.name}.key_secret")
+            )
+            self.broker_socket.curve_secretkey = client_secret
+            self.broker_socket.curve_publickey = client_public
+            server_public, _ = zmq.auth.load_certificate(
+                os.path.join(self.base_dir, "public_keys", "broker.key")
+            )
+            self.broker_socket.curve_serverkey = server_public
+
+        self.broker_socket.connect(self.broker)
+        self.tasks = [
+            asyncio.create_task(self._recv(), name=f"{self.name}_recv"),
+            asyncio.create_task(self._poll(), name=f"{self.name}_poll"),
+        ]
+        log.debug(f"{self.name} - async client connected to broker at '{self.broker}'")
+
+    async def close(self) -> None:
+        """Stop client tasks, fail pending jobs and close broker connection."""
+        for task in self.tasks:
+            task.cancel()
+        await asyncio.gather(*self.tasks, return_exceptions=True)
+        self.tasks = []
+        for job in self.jobs.values():
+            job.mark_done("FAILED")
+        self.jobs.clear()
+        if self.broker_socket is not None:
+            self.broker_socket.close()
+            self.ctx.term()
+            self.broker_socket = None
+
+    async def send_to_broker(
+        self, command: bytes, service: Any, workers: Any, uuid: Any, request: Any
+    ) -> None:
+        """
+        Send a command to the broker.
+
+        Args:
+            command: One of NFP.POST, NFP.GET, NFP.PUT or NFP.MMI.
+            service: The service to which the command is related.
+            workers: The workers involved in the command.
+            uuid: The unique identifier for the request.
+            request: The request payload to be sent.
+        """
+        builders = {
+            NFP.POST: self.build_message.client_to_broker_post,
+            NFP.GET: self.build_message.client_to_broker_get,
+            NFP.PUT: self.build_message.client_to_broker_put,
+            NFP.MMI: self.build_message.client_to_broker_mmi,
+        }
+        msg = builders[command](
+            command=command,
+            service=self.ensure_bytes(service),
+            workers=self.ensure_bytes(workers),
+            uuid=self.ensure_bytes(uuid),
+            request=self.ensure_bytes(request),
+        )
+        log.debug(f"{self.name} - sending '{msg}'")
+        await self.broker_socket.send_multipart(msg)
+        self.stats_send_to_broker += 1
+
+    async def _recv(self) -> None:
+        """Receiver task - reads broker socket and updates jobs state."""
+        while True:
+            msg = await self.broker_socket.recv_multipart()
+            self.stats_recv_from_broker += 1
+            # Message format: [empty, header, command, service, uuid, status, payload]
+            if len(msg) < 7:
+                log.error(f"{self.name} - received malformed message: {msg}")
+                continue
+            command = msg[2]
+            uuid = msg[4].decode("utf-8")
+            status = msg[5].decode("utf-8")
+            try:
+                payload = orjson.loads(msg[6])
+            except Exception as e:
+                log.error(f"{self.name} - failed to parse message, error '{e}'")
+                continue
+
+            if command == NFP.MMI:
+                future = self.mmi_requests.pop(uuid, None)
+                if future and not future.done():
+                    future.set_result((status, payload))
+                continue
+
+            job = self.jobs.get(uuid)
+            if job is None:
+                log.debug(f"{self.name} - received message for unknown job {uuid}")
+                continue
+            try:
+                if command == NFP.EVENT:
+                    events = payload if isinstance(payload, list) else [payload]
+                    self.stats_recv_event_from_broker += len(events)
+                    for event in events:
+                        job.publish("event", event)
+                elif command == NFP.RESPONSE:
+                    await self._handle_response(job, status, payload)
+            except Exception as e:
+                log.error(
+                    f"{self.name} - failed to process job {uuid} message: {e}",
+                    exc_info=True,
+                )
+            if job.done_event.is_set():
+                self.jobs.pop(uuid, None)
+
+    async def _handle_response(self, job: AsyncNFPJob, status: str, payload) -> None:
+        """Update job state based on RESPONSE status, mirrors NFPClient logic."""
+        if status == "202":
+            job.status = "DISPATCHED"
+            job.workers_dispatched = set(payload["workers"])
+            # worker results may arrive ahead of broker dispatch response
+            job.check_completed()
+        elif status in ["201", "300"]:
+            job.status = "STARTED"
+            job.workers_started.add(payload.get("worker"))
+        elif status in ["200", "429"]:
+            job.status = "STARTED"
+            if isinstance(payload, dict):
+                job.add_results(payload)
+        elif status == "102":
+            input_request = payload.get("input_request")
+            job.status = "WAITING_CLIENT_INPUT"
+            if input_request:
+                job.publish(
+                    "event",
+                    {
+                        "event_type": "input_request",
+                        "worker": payload.get("worker"),
+                        "service": job.service,
+                        "uuid": job.uuid,
+                        "task": job.task,
+                        "timestamp": time.strftime("%d-%b-%Y %H:%M:%S"),
+                        "message": input_request.get(
+                            "question", "Worker is waiting for client input"
+                        ),
+                        "severity": "INFO",
+                        "status": "waiting_client_input",
+                        "timeout": input_request.get("timeout"),
+                        "extras": {"input_request": input_request},
+                    },
+                )
+        elif status == "303":
+            await self._get(job, [payload.get("worker")])
+        elif status.startswith("4") or status.startswith("5"):
+            error = payload.get("error", payload.get("status", f"Error {status}"))
+            job.errors.append(error)
+            log.error(
+                f"{self.name} - Job {job.uuid} failed with status {status}: {error}"
+            )
+            job.mark_done("FAILED")
+
+    async def _get(self, job: AsyncNFPJob, workers: List[str]) -> None:
+        job.last_poll = time.time()
+        await self.send_to_broker(
+            NFP.GET,
+            job.service,
+            workers,
+            job.uuid,
+            {"task": job.task, "kwargs": job.kwargs, "args": job.args},
+        )
+
+    async def _poll(self) -> None:
+        """
+        Poller task - expires jobs that reached their deadline and sends GET
+        requests for jobs results as a fallback to results pushed by workers.
+        """
+        while True:
+            await asyncio.sleep(1)
+            now = time.time()
+            for job in list(self.jobs.values()):
+                if now >= job.deadline:
+                    job.errors.append("Job deadline reached without completion")
+                    job.mark_done("STALE")
+                    self.jobs.pop(job.uuid, None)
+                elif job.workers_dispatched and (
+                    now - job.last_poll >= self.poll_interval
+                ):
+                    pending = job.workers_dispatched - job.workers_completed
+                    await self._get(job, sorted(pending))
+
+    async def submit_job(
+        self,
+        service: str,
+        task: str,
+        uuid: str = None,
+        args: list = None,
+        kwargs: dict = None,
+        workers: Union[str, list] = "all",
+        timeout: int = 600,
+        priority: int = 0,
+    ) -> AsyncNFPJob:
+        """
+        Submit a job and return job handle without waiting for results.
+
+        Args:
+            service: The name of the service to run the job on.
+            task: The task to be executed.
+            uuid: A unique identifier for the job, generated if not provided.
+            args: A list of positional arguments to pass to the task.
+            kwargs: A dictionary of keyword arguments to pass to the task.
+            workers: The workers to run the job on.
+            timeout: The maximum time in seconds for the job to complete.
+            priority: Job priority, workers run higher priority jobs first.
+
+        Returns:
+            AsyncNFPJob: Job handle to await job events and results.
+        """
+        await self.start()
+        job = AsyncNFPJob(
+            client=self,
+            uuid=uuid or uuid4().hex,
+            service=service,
+            task=task,
+            workers=workers,
+            args=args or [],
+            kwargs=kwargs or {},
+            timeout=timeout,
+        )
+        self.jobs[job.uuid] = job
+        await self.send_to_broker(
+            NFP.POST,
+            service,
+            workers,
+            job.uuid,
+            {
+                "task": task,
+                "kwargs": job.kwargs,
+                "args": job.args,
+                "priority": priority,
+            },
+        )
+        log.info(
+            f"{self.name} - Submitted job {job.uuid} to service '{service}', "
+            f"task '{task}', workers '{workers}'"
+        )
+        return job
+
+    async def run_job(
+        self,
+        service: str,
+        task: str,
+        uuid: str = None,
+        args: list = None,
+        kwargs: dict = None,
+        workers: Union[str, list] = "all",
+        timeout: int = 600,
+        markdown: bool = False,
+        priority: int = 0,
+    ) -> Any:
+        """
+        Run a job and return its results once all workers completed it.
+
+        Arguments are the same as for ``submit_job``, in addition ``markdown``
+        argument allows to return results markdown representation.
+
+        Returns:
+            Results keyed by worker name, or None if the job failed or timed out.
+        """
+        job = await self.submit_job(
+            service=service,
+            task=task,
+            uuid=uuid,
+            args=args,
+            kwargs=kwargs,
+            workers=workers,
+            timeout=timeout,
+            priority=priority,
+        )
+        return await job.result(markdown=markdown)
+
+    async def mmi(
+        self,
+        service: str,
+        task: str = None,
+        args: list = None,
+        kwargs: dict = None,
+        workers: Union[str, list] = "all",
+        uuid: str = None,
+        timeout: int = 30,
+    ) -> dict:
+        """
+        Send an MMI request to a service via the broker.
+
+        Returns:
+            Dictionary containing ``status``, ``results``, and ``errors`` keys.
+        """
+        await self.start()
+        uuid = uuid or uuid4().hex
+        future = asyncio.get_running_loop().create_future()
+        self.mmi_requests[uuid] = future
+        await self.send_to_broker(
+            NFP.MMI,
+            service,
+            workers,
+            uuid,
+            {"task": task, "kwargs": kwargs or {}, "args": args or []},
+        )
+        try:
+            status, results = await asyncio.wait_for(future, timeout)
+        except asyncio.TimeoutError:
+            self.mmi_requests.pop(uuid, None)
+            msg = f"{self.name} - '{uuid}:{service}' MMI request {timeout}s timeout exceeded."
+            log.error(msg)
+            return {
+                "status": "408",
+                "results": {"status": "MMI Request Timeout"},
+                "errors": [msg],
+            }
+        return {"status": status, "results": results, "errors": []}
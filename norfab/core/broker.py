@@ -17,7 +17,7 @@ from norfab.utils.nflogging import read_jsonl_logs, setup_process_logging
 
 from . import NFP
 from .inventory import NorFabInventory
-from .keepalives import KeepAliver
+from .keepalives import KeepAliver, KeepAliveScheduler
 from .security import generate_certificates
 
 log = logging.getLogger(__name__)
@@ -69,6 +69,8 @@ class NFPWorker(object):
         multiplier (int): Multiplier value, e.g., 6 times.
         keepalive (int): Keepalive interval in milliseconds, e.g., 5000 ms.
         service (NFPService, optional): The service instance. Defaults to None.
+        keepalive_scheduler (KeepAliveScheduler, optional): Broker keepalives
+            scheduler, if not provided keepaliver runs its own thread.
     """
 
     def __init__(
@@ -79,6 +81,7 @@ class NFPWorker(object):
         multiplier: int,  # e.g. 6 times
         keepalive: int,  # e.g. 5000 ms
         service: Optional[NFPService] = None,
+        keepalive_scheduler: Optional[KeepAliveScheduler] = None,
     ) -> None:
         self.address = address  # Address to route to
         self.service = service
@@ -88,6 +91,7 @@ class NFPWorker(object):
         self.keepalive = keepalive
         self.multiplier = multiplier
         self.socket_lock = socket_lock
+        self.keepalive_scheduler = keepalive_scheduler
         self.build_message = NFP.MessageBuilder()
 
     def start_keepalives(self) -> None:
@@ -101,6 +105,7 @@ class NFPWorker(object):
             whoami=NFP.BROKER,
             name="NFPBroker",
             socket_lock=self.socket_lock,
+            scheduler=self.keepalive_scheduler,
         )
         self.keepaliver.start()
 
@@ -161,16 +166,24 @@ class NFPBroker:
         socket (zmq.Socket): The ZeroMQ socket.
         poller (zmq.Poller): The ZeroMQ poller.
         socket_lock (threading.Lock): The lock to protect the socket object.
+        mode (str): Broker routing mode - ``classic`` or ``threaded``.
+        keepalive_scheduler (KeepAliveScheduler): Single scheduler to send
+            keepalives to all workers and expire workers once holdtime elapsed.
+        state_lock (threading.RLock): The lock to protect workers and services.
+        tx_socket (zmq.Socket): The socket to send messages through, ROUTER
+            socket in classic mode or outbox PUSH socket in threaded mode.
 
     Methods:
         mediate(self):
             Main broker work happens here.
+        mediate_threaded(self):
+            Threaded mode broker I/O loop.
         destroy(self):
             Disconnect all workers, destroy context.
         delete_worker(self, worker, disconnect):
             Deletes worker from all data structures, and deletes worker.
-        purge_workers(self):
-            Look for & delete expired workers.
+        expire_worker(self, keepaliver):
+            Delete worker once its keepalives holdtime expired.
         send_to_worker(self, worker: NFPWorker, command: bytes, sender: bytes, uuid: bytes, data: bytes):
             Send message to worker. If message is provided, sends that message.
         send_to_client(self, client: str, command: str, service: str, message: list):
@@ -276,9 +289,59 @@ class NFPBroker:
         self.poller = zmq.Poller()
         self.poller.register(self.socket, zmq.POLLIN)
         self.socket.bind(endpoint)
+        self.endpoint = self.socket.getsockopt_string(zmq.LAST_ENDPOINT)
         self.socket_lock = (
             threading.Lock()
         )  # used for keepalives to protect socket object
+        self.state_lock = threading.RLock()  # protects workers and services
+        self.tx_socket = self.socket
+        self.keepalive_scheduler = KeepAliveScheduler(
+            exit_event=self.exit_event,
+            name="NFPBroker",
+            on_expire=self.expire_worker,
+        )
+
+        # threaded mode sockets, routing threads linked by inproc pipes
+        self.mode = self.inventory.broker.get("mode", "classic")
+        self.drain_batch = self.inventory.broker.get("drain_batch", 1000)
+        self.routing_threads = []
+        self.routing_exit_event = threading.Event()
+        if self.mode == "threaded":
+            pipes = f"inproc://nfp-broker-{id(self)}"
+            self.outbox = self.ctx.socket(zmq.PULL)
+            self.outbox.bind(f"{pipes}-outbox")
+            self.poller.register(self.outbox, zmq.POLLIN)
+            self.tx_socket = self.ctx.socket(zmq.PUSH)
+            self.tx_socket.connect(f"{pipes}-outbox")
+            self.client_pipe = self.ctx.socket(zmq.PAIR)
+            self.client_pipe.bind(f"{pipes}-clients")
+            self.worker_pipe = self.ctx.socket(zmq.PAIR)
+            self.worker_pipe.bind(f"{pipes}-workers")
+            # unlimited pipes queues to not block I/O loop and routing threads
+            for pipe in [
+                self.outbox,
+                self.tx_socket,
+                self.client_pipe,
+                self.worker_pipe,
+            ]:
+                pipe.sndhwm = 0
+                pipe.rcvhwm = 0
+            for name, target in [
+                ("clients", self.process_client),
+                ("workers", self.process_worker),
+            ]:
+                self.routing_threads.append(
+                    threading.Thread(
+                        target=self.routing_thread,
+                        args=(f"{pipes}-{name}", target),
+                        name=f"NFPBroker_{name}_routing_thread",
+                        daemon=True,
+                    )
+                )
+        elif self.mode != "classic":
+            raise ValueError(f"NFPBroker - unsupported broker mode '{self.mode}'")
+
+        self.keepalive_scheduler.start()
 
         init_done_event.set()  # signal finished initializing broker
         log.debug(f"NFPBroker - is ready and listening on {endpoint}")
@@ -311,12 +374,15 @@ class NFPBroker:
 
         This method continuously polls for incoming messages and processes them
         based on their headers. It handles messages from clients and workers,
-        and purges inactive workers periodically. The method also checks for an
-        exit event to gracefully shut down the broker.
+        while inactive workers expired by keepalives scheduler. The method also
+        checks for an exit event to gracefully shut down the broker.
 
         Raises:
             KeyboardInterrupt: If the process is interrupted by a keyboard signal.
         """
+        if self.mode == "threaded":
+            return self.mediate_threaded()
+
         while True:
             try:
                 items = self.poller.poll(1000)
@@ -326,7 +392,8 @@ class NFPBroker:
             if items:
                 with self.socket_lock:
                     msg = self.socket.recv_multipart()
-                log.debug(f"NFPBroker - received '{msg}'")
+                if log.isEnabledFor(logging.DEBUG):
+                    log.debug(f"NFPBroker - received '{msg}'")
 
                 if len(msg) < 3:
                     log.error(f"NFPBroker - received malformed message: {msg}")
@@ -359,13 +426,91 @@ class NFPBroker:
                         f"NFPBroker - message from '{NFP.bytest_to_text(sender)}' contains unsupported header '{header}'"
                     )
 
-            self.purge_workers()
-
             # check if need to stop
             if self.exit_event.is_set():
                 self.destroy()
                 break
 
+    def mediate_threaded(self) -> None:
+        """
+        Threaded mode broker I/O loop.
+
+        This loop is the only owner of the ROUTER socket. On every poll wakeup it
+        drains all ready messages, up to ``drain_batch`` messages, and hands them
+        over to client or worker routing threads using inproc pipes. Messages
+        produced by routing threads and keepalives are collected from the outbox
+        socket and sent out using ROUTER socket.
+        """
+        for thread in self.routing_threads:
+            thread.start()
+
+        while not self.exit_event.is_set():
+            try:
+                items = dict(self.poller.poll(1000))
+            except KeyboardInterrupt:
+                break  # Interrupted
+
+            if self.socket in items:
+                for _ in range(self.drain_batch):
+                    try:
+                        msg = self.socket.recv_multipart(zmq.NOBLOCK)
+                    except zmq.Again:
+                        break
+                    if len(msg) < 3:
+                        log.error(f"NFPBroker - received malformed message: {msg}")
+                    elif msg[2] == NFP.CLIENT:
+                        self.client_pipe.send_multipart(msg)
+                    elif msg[2] == NFP.WORKER:
+                        self.worker_pipe.send_multipart(msg)
+                    else:
+                        log.error(
+                            f"NFPBroker - message from '{NFP.bytest_to_text(msg[0])}' contains unsupported header '{msg[2]}'"
+                        )
+
+            if self.outbox in items:
+                for _ in range(self.drain_batch):
+                    try:
+                        msg = self.outbox.recv_multipart(zmq.NOBLOCK)
+                    except zmq.Again:
+                        break
+                    self.socket.send_multipart(msg)
+
+        self.destroy()
+
+    def routing_thread(self, pipe_endpoint: str, process: callable) -> None:
+        """
+        Threaded mode routing thread to process client or worker messages.
+
+        Args:
+            pipe_endpoint (str): inproc pipe endpoint to receive messages from.
+            process (callable): ``process_client`` or ``process_worker`` method.
+        """
+        pipe = self.ctx.socket(zmq.PAIR)
+        pipe.sndhwm = 0
+        pipe.rcvhwm = 0
+        pipe.connect(pipe_endpoint)
+
+        while not self.routing_exit_event.is_set():
+            if pipe.poll(1000):
+                for _ in range(self.drain_batch):
+                    try:
+                        msg = pipe.recv_multipart(zmq.NOBLOCK)
+                    except zmq.Again:
+                        break
+                    except zmq.ContextTerminated:
+                        return
+                    sender = msg[0]
+                    try:
+                        process(sender, msg[3:])
+                    except Exception as e:
+                        log.error(
+                            f"NFPBroker - failed to process message from "
+                            f"'{NFP.bytest_to_text(sender)}': {e}",
+                            exc_info=True,
+                        )
+
+        pipe.close(0)
+
     def destroy(self) -> None:
         """
         Disconnect all workers and destroy the context.
@@ -376,6 +521,15 @@ class NFPBroker:
         2. Iterates through all
         """
         log.info("NFPBroker - interrupt received, killing broker")
+        self.routing_exit_event.set()
+        self.keepalive_scheduler.stop()
+        for thread in self.routing_threads:
+            if thread.is_alive():
+                thread.join(timeout=3)
+        # send workers disconnect directly, threaded mode I/O loop stopped
+        self.tx_socket = self.socket
+        for worker in self.workers.values():
+            worker.socket = self.socket
         for name in list(self.workers.keys()):
             # in case worker self destroyed while we iterating
             if self.workers.get(name):
@@ -395,36 +549,25 @@ class NFPBroker:
         Returns:
             None
         """
-        worker.destroy(disconnect)
-        self.workers.pop(worker.address, None)
+        with self.state_lock:
+            worker.destroy(disconnect)
+            self.workers.pop(worker.address, None)
 
-    def purge_workers(self) -> None:
+    def expire_worker(self, keepaliver: KeepAliver) -> None:
         """
-        Look for and delete expired workers.
-
-        This method iterates through the list of workers and checks if each worker's
-        keepalive thread is still alive. If a worker's keepalive thread is not alive,
-        the worker is considered expired and is deleted from the list of workers.
-        Additionally, a log message is generated indicating that the worker's keepalive
-        has expired.
-
-        Note:
-            The method handles the case where a worker might be destroyed while
-            iterating through the list of workers.
+        Delete worker once its keepalives holdtime expired, called by keepalives
+        scheduler thread.
 
-        Logging:
-            Logs an info message when a worker's keepalive has expired, including the
-            worker's address.
+        Args:
+            keepaliver (KeepAliver): Expired worker's KeepAliver object.
         """
-        for name in list(self.workers.keys()):
-            # in case worker self destroyed while we iterating
-            if self.workers.get(name):
-                w = self.workers[name]
-                if not w.keepaliver.is_alive():
-                    self.delete_worker(w, False)
-                    log.info(
-                        f"NFPBroker - {NFP.bytest_to_text(w.address)} worker keepalives expired"
-                    )
+        with self.state_lock:
+            w = self.workers.get(keepaliver.address)
+            if w is not None and getattr(w, "keepaliver", None) is keepaliver:
+                self.delete_worker(w, False)
+                log.info(
+                    f"NFPBroker - {NFP.bytest_to_text(w.address)} worker keepalives expired"
+                )
 
     def send_to_worker(
         self, worker: NFPWorker, command: bytes, sender: bytes, uuid: bytes, data: bytes
@@ -467,7 +610,7 @@ class NFPBroker:
             log.debug(
                 f"NFPBroker - sending command '{command}' to worker '{worker.address}', job '{uuid}', from client '{sender}'"
             )
-            self.socket.send_multipart(msg)
+            self.tx_socket.send_multipart(msg)
 
     def send_to_client(
         self, client: str, command: str, service: str, message: list
@@ -506,7 +649,8 @@ class NFPBroker:
             log.debug(
                 f"NFPBroker - sending to client '{client}', command '{command}', service '{service}'"
             )
-            self.socket.send_multipart(msg)
+            # send stream data chunks without copying them
+            self.tx_socket.send_multipart(msg, copy=command != NFP.STREAM)
 
     def process_worker(self, sender: str, msg: list) -> None:
         """
@@ -534,14 +678,19 @@ class NFPBroker:
         command = msg.pop(0)
         worker = self.require_worker(sender)
 
-        log.debug(f"NFPBroker - processing '{sender}' worker message: '{msg}'")
+        # do not format stream data chunks into log messages
+        if NFP.STREAM == command:
+            log.debug(f"NFPBroker - processing '{sender}' worker stream message")
+        else:
+            log.debug(f"NFPBroker - processing '{sender}' worker message: '{msg}'")
 
         if NFP.READY == command and not worker.is_ready():
             service = msg.pop(0)
-            worker.service = self.require_service(service)
-            worker.ready = True
-            worker.start_keepalives()
-            worker.service.workers.append(worker)
+            with self.state_lock:
+                worker.service = self.require_service(service)
+                worker.ready = True
+                worker.start_keepalives()
+                worker.service.workers.append(worker)
         elif NFP.RESPONSE == command and worker.is_ready():
             client = msg.pop(0)
             empty = msg.pop(0)
@@ -575,17 +724,25 @@ class NFPBroker:
         Returns:
             NFPWorker: The worker associated with the given address.
         """
-        if not self.workers.get(address):
-            self.workers[address] = NFPWorker(
-                address=address,
-                socket=self.socket,
-                multiplier=self.multiplier,
-                keepalive=self.keepalive,
-                socket_lock=self.socket_lock,
-            )
-            log.info(f"NFPBroker - registered new worker {NFP.bytest_to_text(address)}")
+        worker = self.workers.get(address)
+        if worker is None:
+            with self.state_lock:
+                worker = self.workers.get(address)
+                if worker is None:
+                    worker = NFPWorker(
+                        address=address,
+                        socket=self.tx_socket,
+                        multiplier=self.multiplier,
+                        keepalive=self.keepalive,
+                        socket_lock=self.socket_lock,
+                        keepalive_scheduler=self.keepalive_scheduler,
+                    )
+                    self.workers[address] = worker
+                    log.info(
+                        f"NFPBroker - registered new worker {NFP.bytest_to_text(address)}"
+                    )
 
-        return self.workers[address]
+        return worker
 
     def require_service(self, name: bytes) -> NFPService:
         """
@@ -597,12 +754,18 @@ class NFPBroker:
         Returns:
             NFPService: The located or newly created service instance.
         """
-        if not self.services.get(name):
-            service = NFPService(name)
-            self.services[name] = service
-            log.debug(f"NFPBroker - registered new service {NFP.bytest_to_text(name)}")
+        service = self.services.get(name)
+        if service is None:
+            with self.state_lock:
+                service = self.services.get(name)
+                if service is None:
+                    service = NFPService(name)
+                    self.services[name] = service
+                    log.debug(
+                        f"NFPBroker - registered new service {NFP.bytest_to_text(name)}"
+                    )
 
-        return self.services[name]
+        return service
 
     def process_client(self, sender: str, msg: list) -> None:
         """
@@ -640,7 +803,8 @@ class NFPBroker:
             )
         # Management Interface
         elif service == b"mmi.service.broker":
-            self.mmi_service(sender, command, target, uuid, data)
+            with self.state_lock:
+                self.mmi_service(sender, command, target, uuid, data)
         elif service == b"sid.service.broker":
             self.inventory_service(sender, command, target, uuid, data)
         else:
@@ -733,8 +897,8 @@ class NFPBroker:
             f"command '{command}', service '{service.name}', target '{target}', "
             f"data '{data}', uuid '{uuid}'"
         )
-        self.purge_workers()
-        workers = self.filter_workers(target, service)
+        with self.state_lock:
+            workers = list(self.filter_workers(target, service))
 
         # handle case when service has no workers registered
         if not workers:
@@ -846,7 +1010,7 @@ class NFPBroker:
                 ret = [{"name": "", "service": "", "status": ""}]
         elif task == "show_broker":
             ret = {
-                "endpoint": self.socket.getsockopt_string(zmq.LAST_ENDPOINT),
+                "endpoint": self.endpoint,
                 "status": "active",
                 "keepalives": {
                     "interval": self.keepalive,
@@ -1,13 +1,18 @@
+import asyncio
+import concurrent.futures
 import glob
 import hashlib
 import logging
 import os
+import posixpath
 import queue
 import shutil
 import sqlite3
 import threading
 import time
+import weakref
 import zlib
+from collections import deque
 from contextlib import contextmanager
 from typing import TYPE_CHECKING, Any, Dict, List, Optional, Set, Tuple, Union
 
@@ -20,6 +25,12 @@ import zmq
 
 from norfab.core.inventory import NorFabInventory
 from norfab.models import InputResponseModel
+from norfab.utils.jobs_retention import (
+    JobsArchive,
+    compact_database,
+    delete_jobs,
+    select_expired_jobs,
+)
 from norfab.utils.markdown_results import markdown_results
 
 from . import NFP
@@ -63,6 +74,9 @@ class ClientJobDatabase:
             )
             self._local.conn.row_factory = sqlite3.Row
             # Enable WAL mode for better concurrent access
+            # release deleted jobs pages incrementally, must be set before
+            # WAL mode and tables creation to take effect on new databases
+            self._local.conn.execute("PRAGMA auto_vacuum=INCREMENTAL")
             self._local.conn.execute("PRAGMA journal_mode=WAL")
             self._local.conn.execute("PRAGMA synchronous=NORMAL")
             # performance PRagmas
@@ -119,9 +133,14 @@ class ClientJobDatabase:
                     started_timestamp TEXT,
                     completed_timestamp TEXT,
                     created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                    last_poll_timestamp REAL DEFAULT 0
+                    last_poll_timestamp REAL DEFAULT 0,
+                    priority INTEGER DEFAULT 0
                 )
                 """)
+            # add columns missing in databases created by older versions
+            columns = [row["name"] for row in conn.execute("PRAGMA table_info(jobs)")]
+            if "priority" not in columns:
+                conn.execute("ALTER TABLE jobs ADD COLUMN priority INTEGER DEFAULT 0")
             conn.execute("""
                 CREATE TABLE IF NOT EXISTS events (
                     id INTEGER PRIMARY KEY AUTOINCREMENT,
@@ -134,6 +153,17 @@ class ClientJobDatabase:
                     FOREIGN KEY (job_uuid) REFERENCES jobs(uuid) ON DELETE CASCADE
                 )
                 """)
+            # per-worker job results, stored as workers results arrive
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS results (
+                    job_uuid TEXT NOT NULL,
+                    worker TEXT NOT NULL,
+                    result_data BLOB,
+                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                    PRIMARY KEY (job_uuid, worker),
+                    FOREIGN KEY (job_uuid) REFERENCES jobs(uuid) ON DELETE CASCADE
+                )
+                """)
             conn.execute("CREATE INDEX IF NOT EXISTS idx_jobs_status ON jobs(status)")
             conn.execute(
                 "CREATE INDEX IF NOT EXISTS idx_jobs_created ON jobs(created_at)"
@@ -162,6 +192,7 @@ class ClientJobDatabase:
         kwargs: dict,
         timeout: int,
         deadline: float,
+        priority: int = 0,
     ) -> None:
 
         now = time.strftime("%Y-%m-%d %H:%M:%S")
@@ -169,8 +200,9 @@ class ClientJobDatabase:
             conn.execute(
                 """
                 INSERT INTO jobs (uuid, service, task, args, kwargs, timeout, deadline,
-                                  status, workers_requested, received_timestamp, created_at)
-                VALUES (?, ?, ?, ?, ?, ?, ?, 'NEW', ?, ?, ?)
+                                  status, workers_requested, received_timestamp, created_at,
+                                  priority)
+                VALUES (?, ?, ?, ?, ?, ?, ?, 'NEW', ?, ?, ?, ?)
                 """,
                 (
                     uuid,
@@ -183,6 +215,7 @@ class ClientJobDatabase:
                     orjson.dumps(workers).decode("utf-8"),
                     now,
                     now,
+                    priority,
                 ),
             )
 
@@ -195,12 +228,21 @@ class ClientJobDatabase:
         workers_started: Set[str] | List[str] | None = None,
         workers_completed: Set[str] | List[str] | None = None,
         result_data: dict | None = None,
+        worker_results: dict | None = None,
         errors: List[str] | None = None,
         append_errors: List[str] | None = None,
         started_ts: str | None = None,
         completed_ts: str | None = None,
         last_poll_ts: float | None = None,
     ) -> None:
+        """
+        Update job attributes.
+
+        ``result_data`` replaces job merged results, while ``worker_results``
+        dictionary keyed by worker name stores each worker result in results
+        table within the same transaction without rewriting other workers
+        results.
+        """
         fields = []
         values: List[Any] = []
 
@@ -234,7 +276,7 @@ class ClientJobDatabase:
             fields.append("last_poll_timestamp = ?")
             values.append(last_poll_ts)
 
-        if not fields and not append_errors:
+        if not fields and not append_errors and not worker_results:
             return
 
         # Handle appending errors to existing errors
@@ -249,14 +291,40 @@ class ClientJobDatabase:
             fields.append("errors = ?")
             values.append(orjson.dumps(existing_errors).decode("utf-8"))
 
-        if not fields:
-            return
-
         with self._transaction(write=True) as conn:
-            conn.execute(
-                f"UPDATE jobs SET {', '.join(fields)} WHERE uuid = ?",
-                (*values, uuid),
-            )
+            if worker_results:
+                conn.executemany(
+                    """
+                    INSERT OR REPLACE INTO results (job_uuid, worker, result_data)
+                    VALUES (?, ?, ?)
+                    """,
+                    [
+                        (uuid, worker, self._compress(result))
+                        for worker, result in worker_results.items()
+                    ],
+                )
+            if fields:
+                conn.execute(
+                    f"UPDATE jobs SET {', '.join(fields)} WHERE uuid = ?",
+                    (*values, uuid),
+                )
+
+    def get_job_results(self, uuid: str, workers: List[str] = None) -> dict:
+        """
+        Return job results keyed by worker name.
+
+        Args:
+            uuid: Job UUID
+            workers: List of workers to return results for, all workers by default
+        """
+        query = "SELECT worker, result_data FROM results WHERE job_uuid = ?"
+        params = [uuid]
+        if workers:
+            query += f" AND worker IN ({','.join(['?'] * len(workers))})"
+            params.extend(workers)
+        with self._transaction(write=False) as conn:
+            rows = conn.execute(query + " ORDER BY rowid ASC", params).fetchall()
+        return {row["worker"]: self._decompress(row["result_data"]) for row in rows}
 
     def fetch_jobs(
         self,
@@ -267,6 +335,7 @@ class ClientJobDatabase:
         task: str = None,
         workers_completed: List[str] = None,
         last: int = None,
+        include_results: bool = True,
     ) -> List[dict]:
         """Fetch jobs with flexible filtering and complete job attributes.
 
@@ -278,6 +347,7 @@ class ClientJobDatabase:
             task: Task name to filter by (optional)
             workers_completed: List of worker names that completed the job (optional)
             last: Return only the last x number of jobs (newest first), overrides limit (optional)
+            include_results: If False, skip loading and decompressing jobs results
 
         Returns:
             List of job dictionaries with complete attributes including:
@@ -334,7 +404,7 @@ class ClientJobDatabase:
                 SELECT uuid, service, task, args, kwargs, workers_requested, timeout, deadline,
                        workers_dispatched, workers_started, workers_completed, status,
                        result_data, errors, received_timestamp, started_timestamp,
-                       completed_timestamp, created_at, last_poll_timestamp
+                       completed_timestamp, created_at, last_poll_timestamp, priority
                 FROM jobs
                 WHERE {where_clause}
                 ORDER BY created_at {order_direction}, rowid {order_direction}
@@ -343,27 +413,44 @@ class ClientJobDatabase:
                 (*params, result_limit),
             )
             rows = cur.fetchall()
-        return [self._hydrate(row) for row in rows]
+        jobs = [self._hydrate(row, include_results) for row in rows]
+        if include_results:
+            for job in jobs:
+                self._load_results(job)
+        return jobs
 
-    def get_job(self, uuid: str) -> dict | None:
+    def get_job(self, uuid: str, include_results: bool = True) -> dict | None:
         with self._transaction(write=False) as conn:
             cur = conn.execute(
                 """
                   SELECT uuid, service, task, args, kwargs, timeout, deadline, status,
                        workers_requested, workers_dispatched, workers_started,
                        workers_completed, result_data, errors, created_at, completed_timestamp,
-                       last_poll_timestamp
+                       last_poll_timestamp, priority
                 FROM jobs WHERE uuid = ?
                 """,
                 (uuid,),
             )
             row = cur.fetchone()
-        return self._hydrate(row) if row else None
-
-    def _hydrate(self, row: sqlite3.Row) -> dict:
+        if not row:
+            return None
+        job = self._hydrate(row, include_results)
+        if include_results:
+            self._load_results(job)
+        return job
+
+    def _load_results(self, job: dict) -> None:
+        """Assemble job ``result_data`` merging per-worker results"""
+        results = self.get_job_results(job["uuid"])
+        if results:
+            job["result_data"] = {**(job.get("result_data") or {}), **results}
+
+    def _hydrate(self, row: sqlite3.Row, include_results: bool = True) -> dict:
         if row is None:
             return None
         data = dict(row)
+        if not include_results:
+            data["result_data"] = None
         data["args"] = self._decompress(data.get("args")) or {"args": []}
         data["kwargs"] = self._decompress(data.get("kwargs")) or {"kwargs": {}}
         data["args"] = data["args"].get("args", [])
@@ -387,6 +474,7 @@ class ClientJobDatabase:
         data["timeout"] = data.get("timeout", 600) or 600
         data["deadline"] = data.get("deadline", 0) or 0
         data["last_poll_timestamp"] = data.get("last_poll_timestamp", 0) or 0
+        data["priority"] = data.get("priority", 0) or 0
         return data
 
     def add_event(
@@ -412,6 +500,90 @@ class ClientJobDatabase:
                 ),
             )
 
+    def add_events(self, job_uuid: str, events: List[dict]) -> None:
+        with self._transaction(write=True) as conn:
+            conn.executemany(
+                """
+                INSERT INTO events (job_uuid, message, severity, task, event_data)
+                VALUES (?, ?, ?, ?, ?)
+                """,
+                [
+                    (
+                        job_uuid,
+                        event.get("message", ""),
+                        event.get("severity", "INFO"),
+                        event.get("task"),
+                        self._compress(event),
+                    )
+                    for event in events
+                ],
+            )
+
+    def get_job_events(self, uuid: str) -> List[dict]:
+        with self._transaction(write=False) as conn:
+            cur = conn.execute(
+                """
+                SELECT message, severity, task, event_data, created_at
+                FROM events WHERE job_uuid = ? ORDER BY id ASC
+                """,
+                (uuid,),
+            )
+            rows = [dict(row) for row in cur.fetchall()]
+        for row in rows:
+            row["event_data"] = self._decompress(row["event_data"])
+        return rows
+
+    def apply_retention(
+        self,
+        max_age: int = None,
+        max_count: int = None,
+        max_size: int = None,
+        archive: JobsArchive = None,
+        batch_size: int = 500,
+    ) -> dict:
+        """Delete finished jobs that exceed retention limits, optionally archiving them.
+
+        Args:
+            max_age: Maximum job age in seconds
+            max_count: Maximum number of finished jobs to keep
+            max_size: Maximum total size of jobs data in bytes
+            archive: If provided, archive jobs before deleting them
+            batch_size: Number of jobs to archive and delete per transaction
+
+        Returns:
+            Dictionary with number of ``deleted_jobs`` and ``archived_jobs``
+        """
+        ret = {"deleted_jobs": 0, "archived_jobs": 0}
+        with self._transaction(write=False) as conn:
+            expired = select_expired_jobs(
+                conn,
+                [JobStatus.COMPLETED, JobStatus.FAILED, JobStatus.STALE],
+                max_age=max_age,
+                max_count=max_count,
+                max_size=max_size,
+                results_table="results",
+            )
+        for i in range(0, len(expired), batch_size):
+            batch = expired[i : i + batch_size]
+            if archive is not None:
+                records = []
+                for uuid in batch:
+                    job = self.get_job(uuid)
+                    if job:
+                        job["events"] = self.get_job_events(uuid)
+                        records.append(job)
+                ret["archived_jobs"] += archive.write(records)
+            with self._transaction(write=True) as conn:
+                ret["deleted_jobs"] += delete_jobs(
+                    conn, batch, child_tables=["events", "results"]
+                )
+        return ret
+
+    def compact(self, vacuum_pages: int = None) -> dict:
+        """Checkpoint WAL file and release free pages of deleted jobs."""
+        with self._lock:
+            return compact_database(self._get_connection(), self.db_path, vacuum_pages)
+
     def close(self) -> None:
         if hasattr(self._local, "conn"):
             self._local.conn.close()
@@ -598,6 +770,8 @@ class NFPJobFuture:
         self.timeout = timeout
         self.kwargs = kwargs or {}
         self.events_buffer = queue.Queue(maxsize=0)
+        self.results_buffer = queue.Queue(maxsize=0)
+        self.results_yielded = set()
         self.done_event = threading.Event()
         self.terminal_job = None
         self.input_request_ids = set()
@@ -614,6 +788,9 @@ class NFPJobFuture:
         self.events_buffer.put(event)
         return True
 
+    def add_results(self, workers: List[str]) -> None:
+        self.results_buffer.put(workers)
+
     def mark_done(self, job: dict | None = None) -> None:
         self.terminal_job = job
         if not self.done_event.is_set():
@@ -632,6 +809,91 @@ class NFPJobFuture:
 
             yield event
 
+    def _next_results(self, wait_time: float) -> Tuple[list, bool]:
+        """
+        Return list of ``(worker_name, result)`` tuples not yielded yet and a
+        flag indicating that job is done and all its results were returned.
+
+        Args:
+            wait_time: Seconds to wait for next results to arrive, 0 to not wait
+        """
+        try:
+            if wait_time > 0:
+                workers = self.results_buffer.get(block=True, timeout=wait_time)
+            else:
+                workers = self.results_buffer.get_nowait()
+            finished = False
+        except queue.Empty:
+            if not self.done_event.is_set():
+                return [], False
+            # job done, pick up results stored before this future was created
+            job = self.client.job_db.get_job(self.uuid, include_results=False)
+            workers = job["workers_completed"] if job else []
+            finished = True
+        workers = [w for w in workers if w not in self.results_yielded]
+        if not workers:
+            return [], finished
+        results = self.client.job_db.get_job_results(self.uuid, workers)
+        self.results_yielded.update(results)
+        return list(results.items()), finished
+
+    def iter_results(self, timeout: int | float | None = None, block: bool = True):
+        """
+        Yield ``(worker_name, result)`` tuples as each worker result arrives.
+
+        Each worker result loaded from the client jobs database individually,
+        allowing to start processing results without waiting for all workers
+        to complete and without holding all workers results in memory at once.
+        Each worker result yielded only once across all calls.
+
+        Args:
+            timeout: Maximum seconds to wait for all results, waits until job
+                completes by default
+            block: If False, yield results that already arrived and return
+        """
+        wait_started = time.time()
+        while not self.client.exit_event.is_set():
+            if self.client.destroy_event.is_set():
+                return
+            wait_time = 0.2 if block else 0
+            if timeout is not None:
+                remaining_time = timeout - (time.time() - wait_started)
+                if remaining_time <= 0:
+                    return
+                wait_time = min(wait_time, remaining_time)
+            results, finished = self._next_results(wait_time)
+            yield from results
+            if finished or (not block and not results):
+                return
+
+    async def aiter_results(self, timeout: int | float | None = None):
+        """
+        Asyncio variant of ``iter_results``, asynchronously yields
+        ``(worker_name, result)`` tuples as each worker result arrives.
+
+        Waiting for results and reading them from the client jobs database
+        done in a thread to not block the event loop.
+
+        Args:
+            timeout: Maximum seconds to wait for all results, waits until job
+                completes by default
+        """
+        wait_started = time.time()
+        while not self.client.exit_event.is_set():
+            if self.client.destroy_event.is_set():
+                return
+            wait_time = 0.2
+            if timeout is not None:
+                remaining_time = timeout - (time.time() - wait_started)
+                if remaining_time <= 0:
+                    return
+                wait_time = min(wait_time, remaining_time)
+            results, finished = await asyncio.to_thread(self._next_results, wait_time)
+            for item in results:
+                yield item
+            if finished:
+                return
+
     def result(self, timeout: int | float | None = None, markdown: bool = False) -> Any:
         wait_started = time.time()
         while not self.done_event.is_set():
@@ -665,7 +927,7 @@ class NFPJobFuture:
         cancel: bool = False,
         metadata: dict | None = None,
     ) -> None:
-        job = self.client.job_db.get_job(self.uuid) or {}
+        job = self.client.job_db.get_job(self.uuid, include_results=False) or {}
         target_worker = worker or job.get("workers_dispatched") or self.workers
         payload = InputResponseModel(
             input_id=input_id,
@@ -757,28 +1019,28 @@ def recv(client) -> None:
             client.mmi_queue.put(msg)
 
 
-def handle_event(client: object, juuid: str, payload: dict, msg: list) -> None:
+def handle_event(
+    client: object, juuid: str, payload: Union[dict, list], msg: list
+) -> None:
     """
     Handle EVENT messages and update job database accordingly.
 
+    Workers pack several events of the same job into single EVENT message,
+    in that case payload is a list of events, saved using single transaction.
+
     Args:
         client: The client instance
         juuid: Job UUID
-        payload: Event payload dictionary
+        payload: Event payload dictionary or list of event dictionaries
         msg: Original message multipart for queue
     """
-    client.stats_recv_event_from_broker += 1
+    events = payload if isinstance(payload, list) else [payload]
+    client.stats_recv_event_from_broker += len(events)
     future = client.job_futures.get(juuid)
-    if future and not future.add_event(payload):
-        return
-
-    client.job_db.add_event(
-        job_uuid=juuid,
-        message=payload.get("message", ""),
-        severity=payload.get("severity", "INFO"),
-        task=payload.get("task"),
-        event_data=payload,
-    )
+    if future:
+        events = [event for event in events if future.add_event(event)]
+    if events:
+        client.job_db.add_events(juuid, events)
 
 
 def handle_response(client: object, juuid: str, status: str, payload: dict) -> None:
@@ -791,12 +1053,14 @@ def handle_response(client: object, juuid: str, status: str, payload: dict) -> N
 
     Status codes:
     - 202: Accepted (POST acknowledged by broker or worker)
-    - 200: OK (GET completed with results)
+    - 200: OK (job results pushed by worker or GET completed with results)
     - 300: Pending (job still in progress)
+    - 429: Worker jobs queue is full, job rejected by worker
+    - 303: Result Ready (job completed, results too large to push, GET them)
     - 4xx: Client errors
     - 5xx: Server errors
     """
-    job = client.job_db.get_job(juuid)
+    job = client.job_db.get_job(juuid, include_results=False)
     if not job:
         log.debug(f"{client.name} - received response for unknown job {juuid}")
         return
@@ -829,16 +1093,19 @@ def handle_response(client: object, juuid: str, status: str, payload: dict) -> N
         return
 
     # Handle 200 OK - GET completed with results
-    if status == "200":
+    # 429 - worker rejected the job, payload contains worker failed result
+    if status == "429":
+        log.warning(
+            f"{client.name} - job {juuid} rejected by workers {list(payload)}, "
+            f"jobs queue is full"
+        )
+
+    if status in ["200", "429"]:
         dispatched = set(job.get("workers_dispatched", []))
         completed = set(job.get("workers_completed", []))
-        existing_results = job.get("result_data") or {}
-
-        # Merge new results with existing (results keyed by worker name)
-        if isinstance(payload, dict):
-            for worker_name in payload.keys():
-                completed.add(worker_name)
-            existing_results.update(payload)
+        # results keyed by worker name, each stored separately
+        worker_results = payload if isinstance(payload, dict) else {}
+        completed.update(worker_results)
 
         is_complete = completed == dispatched and len(dispatched) > 0
 
@@ -846,16 +1113,18 @@ def handle_response(client: object, juuid: str, status: str, payload: dict) -> N
             juuid,
             status=JobStatus.COMPLETED if is_complete else JobStatus.STARTED,
             workers_completed=list(completed),
-            result_data=existing_results,
+            worker_results=worker_results,
             completed_ts=time.ctime() if is_complete else None,
         )
 
+        future = client.job_futures.get(juuid)
+        if future and worker_results:
+            future.add_results(list(worker_results))
         if is_complete:
             log.info(f"{client.name} - Job {juuid} completed")
             log.debug(f"{client.name} - job {juuid} completed")
-            future = client.job_futures.get(juuid)
             if future:
-                future.mark_done(client.job_db.get_job(juuid))
+                future.mark_done(client.job_db.get_job(juuid, include_results=False))
         return
 
     # Handle 102 Processing - worker is waiting for client input
@@ -899,6 +1168,26 @@ def handle_response(client: object, juuid: str, status: str, payload: dict) -> N
                 )
         return
 
+    # Handle 303 Result Ready - worker completed the job, retrieve results
+    if status == "303":
+        worker = payload.get("worker")
+        client.send_to_broker(
+            NFP.GET,
+            client.ensure_bytes(job["service"]),
+            client.ensure_bytes([worker]),
+            client.ensure_bytes(juuid),
+            client.ensure_bytes(
+                {
+                    "task": job["task"],
+                    "kwargs": job["kwargs"] or {},
+                    "args": job["args"] or [],
+                }
+            ),
+        )
+        client.job_db.update_job(juuid, last_poll_ts=time.time())
+        log.debug(f"{client.name} - job {juuid} result ready, sent GET to {worker}")
+        return
+
     # Handle 300 Pending - job still in progress
     if status == "300":
         worker = payload.get("worker")
@@ -923,41 +1212,90 @@ def handle_response(client: object, juuid: str, status: str, payload: dict) -> N
         )
         future = client.job_futures.get(juuid)
         if future:
-            future.mark_done(client.job_db.get_job(juuid))
+            future.mark_done(client.job_db.get_job(juuid, include_results=False))
         log.error(
             f"{client.name} - Job {juuid} failed with status {status}: {error_msg}"
         )
         return
 
 
+def adjust_transfer_window(file_transfer: dict, rtt: float) -> None:
+    """
+    Adjust file transfer window - number of chunks requested in advance -
+    using measured chunk request round trip time.
+
+    Number of chunks queued along the path estimated comparing smoothed
+    and minimal round trip times, window grows while less than one chunk
+    queued and shrinks when more than three chunks queued, keeping enough
+    chunks in transit to saturate the path without excessive buffering.
+
+    Args:
+        file_transfer (dict): File transfer state.
+        rtt (float): Chunk request round trip time in seconds.
+    """
+    srtt = file_transfer["srtt"]
+    srtt = rtt if srtt is None else 0.875 * srtt + 0.125 * rtt
+    min_rtt = (
+        rtt if file_transfer["min_rtt"] is None else min(file_transfer["min_rtt"], rtt)
+    )
+    file_transfer["min_rtt"], file_transfer["srtt"] = min_rtt, srtt
+
+    queued = file_transfer["window"] * (1 - min_rtt / srtt) if srtt else 0
+    if queued < 1:
+        file_transfer["window"] = min(
+            file_transfer["window"] + 1, file_transfer["max_window"]
+        )
+    elif queued > 3:
+        file_transfer["window"] = max(file_transfer["window"] - 1, 1)
+
+
 def handle_stream(client, juuid: str, status: str, payload: bytes) -> None:
-    job = client.job_db.get_job(juuid)
     file_transfer = client.file_transfers.get(juuid)
 
-    if not job:
-        log.error(f"{client.name} - received stream for unknown job {juuid}")
-        return
-
     if not file_transfer:
         log.error(f"{client.name} - received stream for unknown file transfer {juuid}")
         return
 
+    # resolve chunk requests parameters once per transfer
+    if "put_params" not in file_transfer:
+        job = client.job_db.get_job(juuid, include_results=False)
+        if not job:
+            log.error(f"{client.name} - received stream for unknown job {juuid}")
+            return
+        file_transfer["put_params"] = (
+            client.ensure_bytes(job["service"]),
+            client.ensure_bytes(job["workers_requested"]),
+            client.ensure_bytes(juuid),
+        )
+
     destination = file_transfer["destination"]  # file object
-    size = len(payload)
-    file_transfer["credit"] += 1  # Up to PIPELINE chunks in transit
-    file_transfer["total_bytes_received"] += size
+    if destination.closed:
+        log.error(f"{client.name} - received stream for finished file transfer {juuid}")
+        return
+    received_at = time.time()
+    file_transfer["total_bytes_received"] += len(payload)
 
     # save received chunk
     destination.write(payload)
-    file_transfer["file_hash"].update(payload)
+    if file_transfer["file_hash"] is not None:
+        file_transfer["file_hash"].update(payload)
+
+    # chunks arrive in the order they were requested, first chunk requested
+    # by the job itself and not used for round trip time measurements
+    if file_transfer["requests"]:
+        requested_at = file_transfer["requests"].popleft()
+        if requested_at is not None:
+            adjust_transfer_window(file_transfer, received_at - requested_at)
 
     # check if done
     if file_transfer["total_bytes_received"] >= file_transfer["size_bytes"]:
         destination.close()
 
         # check md5hash mismatch
-        file_hash = file_transfer["file_hash"].hexdigest()
-        if file_hash != file_transfer["md5hash"]:
+        if (
+            file_transfer["file_hash"] is not None
+            and file_transfer["file_hash"].hexdigest() != file_transfer["md5hash"]
+        ):
             client.job_db.update_job(
                 juuid,
                 status=JobStatus.FAILED,
@@ -968,28 +1306,30 @@ def handle_stream(client, juuid: str, status: str, payload: bytes) -> None:
             )
             future = client.job_futures.get(juuid)
             if future:
-                future.mark_done(client.job_db.get_job(juuid))
+                future.mark_done(client.job_db.get_job(juuid, include_results=False))
 
         log.debug(
-            f"{client.name} - finished file download, job '{juuid}', filename '{destination.name}'"
+            f"{client.name} - finished file download, job '{juuid}', filename "
+            f"'{destination.name}', window {file_transfer['window']} chunks"
         )
         return
 
-    # request next set of chunks up to credit
-    while file_transfer["credit"] > 0 and file_transfer["chunk_requests_remaining"] > 0:
+    # request next set of chunks up to transfer window
+    service, workers, uuid_bytes = file_transfer["put_params"]
+    while (
+        len(file_transfer["requests"]) < file_transfer["window"]
+        and file_transfer["chunk_requests_remaining"] > 0
+    ):
         file_transfer["offset"] += file_transfer[
             "chunk_size"
         ]  # Offset of next chunk request
-        service = client.ensure_bytes(job["service"])
-        uuid_bytes = client.ensure_bytes(juuid)
-        workers = client.ensure_bytes(job["workers_requested"])
         request = client.ensure_bytes(
             {
                 "offset": file_transfer["offset"],
             }
         )
         client.send_to_broker(NFP.PUT, service, workers, uuid_bytes, request)
-        file_transfer["credit"] -= 1
+        file_transfer["requests"].append(time.time())
         file_transfer["chunk_requests_remaining"] -= 1
 
 
@@ -999,7 +1339,7 @@ def dispatch_new_jobs(client) -> None:
     Non-blocking: sends request and updates status to SUBMITTING.
     """
     for job in client.job_db.fetch_jobs(
-        [JobStatus.NEW], limit=client.dispatch_batch_size
+        [JobStatus.NEW], limit=client.dispatch_batch_size, include_results=False
     ):
         juuid = job["uuid"]
         if juuid not in client.job_futures:
@@ -1015,6 +1355,7 @@ def dispatch_new_jobs(client) -> None:
                     "task": job["task"],
                     "kwargs": job["kwargs"] or {},
                     "args": job["args"] or [],
+                    "priority": job["priority"],
                 }
             )
 
@@ -1039,13 +1380,17 @@ def dispatch_new_jobs(client) -> None:
             )
             future = client.job_futures.get(juuid)
             if future:
-                future.mark_done(client.job_db.get_job(juuid))
+                future.mark_done(client.job_db.get_job(juuid, include_results=False))
 
 
 def poll_active_jobs(client) -> None:
     """
     Find active jobs and send GET requests to poll for results.
-    Non-blocking: sends request with 5-second throttling via last_poll_timestamp.
+    Non-blocking: sends request with poll_interval throttling via last_poll_timestamp.
+
+    Workers push job results to the client once job completes, GET polling
+    serves as a fallback to recover results that client missed, for example
+    while it was reconnecting or offline.
     """
     # Jobs that are ready for GET polling (dispatched or started)
     active_statuses = [
@@ -1059,6 +1404,7 @@ def poll_active_jobs(client) -> None:
         active_statuses,
         limit=client.dispatch_batch_size,
         min_poll_age=client.poll_interval,
+        include_results=False,
     ):
         juuid = job["uuid"]
         if juuid not in client.job_futures:
@@ -1076,7 +1422,7 @@ def poll_active_jobs(client) -> None:
             )
             future = client.job_futures.get(juuid)
             if future:
-                future.mark_done(client.job_db.get_job(juuid))
+                future.mark_done(client.job_db.get_job(juuid, include_results=False))
             continue
 
         try:
@@ -1094,7 +1440,7 @@ def poll_active_jobs(client) -> None:
 
             client.send_to_broker(NFP.GET, service, workers, uuid_bytes, request)
 
-            # Update last_poll_ts to enforce 5-second throttle
+            # Update last_poll_ts to enforce poll_interval throttle
             client.job_db.update_job(
                 juuid,
                 last_poll_ts=time.time(),
@@ -1129,6 +1475,29 @@ def dispatcher(client) -> None:
         time.sleep(0.1)
 
 
+def jobs_maintenance(client) -> None:
+    """
+    Jobs maintenance thread: applies jobs database retention policy and
+    compacts database every ``jobs_retention.interval`` seconds.
+
+    Runs separately from dispatcher and receiver threads, so that jobs
+    database cleanup does not delay jobs dispatching and results handling.
+
+    Args:
+        client (object): The client instance containing job_db, exit_event, and configuration.
+    """
+    while not client.exit_event.is_set() and not client.destroy_event.is_set():
+        if time.time() >= client.jobs_retention_run_at:
+            try:
+                client.job_db_compact()
+            except Exception as e:
+                log.error(
+                    f"{client.name} - jobs database retention error: {e}",
+                    exc_info=True,
+                )
+        client.destroy_event.wait(1)
+
+
 class NFPClient(object):
     """
     NFPClient is a client class for interacting with a broker using ZeroMQ for messaging.
@@ -1166,6 +1535,8 @@ class NFPClient(object):
             Sends a job reply message to the broker requesting job results and yields results iteratively.
         fetch_file(url, destination=None, chunk_size=250000, pipeline=10, timeout=600, read=False):
             Downloads a file from the Broker File Sharing Service.
+        fetch_manifest(url, timeout=600):
+            Retrieves details of all files in a directory from the Broker File Sharing Service.
         run_job(service, task, uuid=None, args=None, kwargs=None, workers="all", timeout=600):
             Runs a job and returns results produced by workers.
         run_job_iter(service, task, uuid=None, args=None, kwargs=None, workers="all", timeout=600):
@@ -1210,6 +1581,10 @@ class NFPClient(object):
             self.inventory.base_dir, "__norfab__", "files", "client", self.name
         )
         self.file_transfers = {}  # file transfers tracker
+        self.files_index = {}  # local file path -> (mtime_ns, size, md5hash)
+        self.files_index_lock = threading.Lock()
+        # local file path -> fetch_file lock, dropped once no transfers use it
+        self.file_locks = weakref.WeakValueDictionary()
         self.zmq_auth = self.inventory.broker.get("zmq_auth", True)
         self.socket_lock = threading.Lock()  # used to protect socket object
         self.build_message = NFP.MessageBuilder()
@@ -1221,6 +1596,14 @@ class NFPClient(object):
             os.path.join(self.base_dir, f"{self.name}.db"),
             jobs_compress=True,
         )
+        self.jobs_retention = self.inventory.client.get("jobs_retention") or {}
+        self.jobs_retention_run_at = 0
+        self.jobs_archive = JobsArchive(
+            directory=os.path.join(self.base_dir, "jobs_archive"),
+            prefix=self.name,
+            segment_size=self.jobs_retention.get("archive_segment_size", 50000000),
+            max_segments=self.jobs_retention.get("archive_max_segments", 10),
+        )
 
         # generate certificates and create directories
         if self.zmq_auth is not False:
@@ -1251,7 +1634,9 @@ class NFPClient(object):
         self.job_futures = {}
 
         # Configuration for dispatcher
-        self.poll_interval = 0.5  # Seconds between GET polls for same job (throttling)
+        self.poll_interval = self.inventory.client.get(
+            "poll_interval", 5
+        )  # Seconds between fallback GET polls for same job (throttling)
         self.dispatch_batch_size = 10  # Max jobs to process per dispatch cycle
         self.recover_job_futures()
 
@@ -1270,6 +1655,17 @@ class NFPClient(object):
         )
         self.dispatcher_thread.start()
 
+        # start jobs maintenance thread - applies jobs database retention
+        self.maintenance_thread = None
+        if self.jobs_retention:
+            self.maintenance_thread = threading.Thread(
+                target=jobs_maintenance,
+                daemon=True,
+                name=f"{self.name}_maintenance",
+                args=(self,),
+            )
+            self.maintenance_thread.start()
+
     def ensure_bytes(self, value: Union[bytes, str]) -> bytes:
         """
         Helper function to convert value to bytes.
@@ -1526,6 +1922,11 @@ class NFPClient(object):
         # Sort by depth (deepest first) to avoid deleting parent before children
         matches.sort(key=lambda x: x.count(os.sep), reverse=True)
 
+        # deleting all fetched files also clears files content cache
+        files_cache = os.path.join(self.base_dir, "filescache")
+        if filepath == "*" and os.path.isdir(files_cache):
+            matches.append(files_cache)
+
         for match in matches:
             try:
                 if os.path.isfile(match):
@@ -1543,6 +1944,292 @@ class NFPClient(object):
 
         return result
 
+    def local_file_md5(self, path: str) -> Union[None, str]:
+        """
+        Return MD5 hash of local file using files hash index.
+
+        File hashed only if it is not indexed yet or if its modification
+        time or size changed since it was indexed.
+
+        Args:
+            path (str): Local file path.
+
+        Returns:
+            str: File MD5 hash or None if file does not exist.
+        """
+        try:
+            stat = os.stat(path)
+        except OSError:
+            return None
+        signature = (stat.st_mtime_ns, stat.st_size)
+        with self.files_index_lock:
+            indexed = self.files_index.get(path)
+        if indexed and indexed[:2] == signature:
+            return indexed[2]
+
+        file_hash = hashlib.md5()
+        with open(path, "rb") as f:
+            chunk = f.read(65536)
+            while chunk:
+                file_hash.update(chunk)
+                chunk = f.read(65536)
+        md5hash = file_hash.hexdigest()
+        self.index_local_file(path, md5hash)
+
+        return md5hash
+
+    def index_local_file(self, path: str, md5hash: str) -> None:
+        """
+        Add local file with known MD5 hash to files hash index.
+
+        Args:
+            path (str): Local file path.
+            md5hash (str): File content MD5 hash.
+        """
+        stat = os.stat(path)
+        with self.files_index_lock:
+            self.files_index[path] = (stat.st_mtime_ns, stat.st_size, md5hash)
+
+    def place_file(self, source: str, destination: str) -> None:
+        """
+        Atomically place a copy of source file at destination path,
+        hard linking files where possible.
+
+        Args:
+            source (str): Source file path.
+            destination (str): Destination file path.
+        """
+        temp = f"{destination}.{uuid4().hex}.part"
+        try:
+            os.link(source, temp)
+        except OSError:
+            shutil.copyfile(source, temp)
+        os.replace(temp, destination)
+
+    def fetch_manifest(self, url: str, timeout: int = 600) -> dict:
+        """
+        Fetches details of all files in a directory from File Sharing Service
+        in one call.
+
+        Returned files details can be passed to ``fetch_file`` method using
+        ``file_details`` argument to download files without querying each
+        file details separately.
+
+        Parameters:
+            url (str): The URL of the directory e.g. ``nf://templates/``.
+            timeout (int, optional): The maximum time (in seconds) to wait for the
+                manifest. Default is 600 seconds.
+
+        Returns:
+            dict: A dictionary with status, content and error keys, content is a
+                dictionary of files details keyed by normalized file URL.
+        """
+        result = {"status": "200", "content": None, "error": None}
+
+        if not url.startswith("nf://"):
+            result["status"] = "500"
+            result["error"] = "Invalid url format"
+            return result
+
+        manifest = self.run_job(
+            service="filesharing",
+            workers="all",
+            task="file_manifest",
+            kwargs={"url": url},
+            timeout=timeout,
+        )
+        for w_name, w_res in manifest.items():
+            if not w_res["failed"]:
+                result["content"] = {
+                    self.normalize_file_url(file_url): {**details, "w_name": w_name}
+                    for file_url, details in w_res["result"].items()
+                }
+                break
+        else:
+            result["status"] = "404"
+            result["error"] = "Files manifest failed - directory not found"
+
+        return result
+
+    @staticmethod
+    def normalize_file_url(url: str) -> str:
+        """
+        Normalize ``nf://`` URL path collapsing redundant separators and
+        ``..`` references, so that URLs can be compared with each other.
+
+        Args:
+            url (str): File URL in ``nf://<filepath>`` format.
+
+        Returns:
+            str: Normalized URL.
+        """
+        url_path = url.replace("nf://", "", 1).replace("\\", "/").lstrip("/")
+        url_path = posixpath.normpath(url_path) if url_path else ""
+        return "nf://" if url_path == "." else f"nf://{url_path}"
+
+    def download_chunks(
+        self,
+        url: str,
+        w_name: str,
+        destination: Any,
+        offset: int,
+        length: int,
+        chunk_size: int,
+        pipeline: int,
+        max_pipeline: int,
+        timeout: int,
+        file_hash: Any = None,
+        md5hash: str = None,
+    ) -> Union[None, tuple]:
+        """
+        Downloads file bytes range from filesharing worker into open file object.
+
+        Chunks requested in advance using transfer window that starts at
+        ``pipeline`` chunks and adjusted up to ``max_pipeline`` chunks
+        based on measured chunk requests round trip time.
+
+        Parameters:
+            url (str): The URL of the file to be fetched.
+            w_name (str): Name of filesharing worker to download file from.
+            destination (file): File object to write received chunks to, closed once done.
+            offset (int): Offset of the first byte to download.
+            length (int): Number of bytes to download.
+            chunk_size (int): The size of each chunk to be fetched.
+            pipeline (int): Initial number of chunks in transit.
+            max_pipeline (int): Maximum number of chunks in transit.
+            timeout (int): The maximum time (in seconds) to wait for the range to be downloaded.
+            file_hash (hashlib object, optional): Running MD5 hash to update with received chunks.
+            md5hash (str, optional): Expected MD5 hash to verify ``file_hash`` against.
+
+        Returns:
+            None if range downloaded successfully, ``(status, error)`` tuple otherwise.
+        """
+        uuid = uuid4().hex
+        kwargs = {"url": url, "offset": offset, "chunk_size": chunk_size}
+        if file_hash is None:
+            kwargs["length"] = length
+        self.file_transfers[uuid] = {
+            "total_bytes_received": 0,  # Total bytes received
+            "size_bytes": length,  # Total bytes to receive
+            "offset": offset,  # Offset of next chunk request
+            "chunk_size": chunk_size,
+            "file_hash": file_hash,
+            "md5hash": md5hash,
+            "destination": destination,
+            # first chunk requested by fetch_file job itself
+            "chunk_requests_remaining": max(1, -(-length // chunk_size)) - 1,
+            "requests": deque([None]),  # chunk requests timestamps
+            "window": pipeline,  # number of chunks to keep in transit
+            "max_window": max(pipeline, max_pipeline),
+            "min_rtt": None,
+            "srtt": None,
+        }
+        try:
+            reply = self.run_job(
+                uuid=uuid,
+                service="filesharing",
+                workers=[w_name],
+                task="fetch_file",
+                kwargs=kwargs,
+                timeout=timeout,
+            )[w_name]
+        finally:
+            destination.close()
+            file_transfer = self.file_transfers.pop(uuid)
+
+        # Verify streaming did not mark job failed (e.g., MD5 mismatch)
+        download_job = self.job_db.get_job(uuid, include_results=False)
+        if reply["failed"]:
+            return "404", reply["errors"]
+        elif download_job and download_job.get("status") == JobStatus.FAILED:
+            return (
+                "400",
+                f"File download job {uuid} failed: {download_job.get('errors', [])}",
+            )
+        elif file_transfer["total_bytes_received"] < length:
+            return "408", f"File download job {uuid} incomplete"
+
+        return None
+
+    def download_ranges(
+        self,
+        url: str,
+        part: str,
+        file_details: dict,
+        sources: list,
+        chunk_size: int,
+        pipeline: int,
+        max_pipeline: int,
+        timeout: int,
+    ) -> Union[None, tuple]:
+        """
+        Downloads file in parallel ranges, one range per filesharing worker
+        serving the same file content, and verifies downloaded file MD5 hash.
+
+        Parameters:
+            url (str): The URL of the file to be fetched.
+            part (str): Path of the file to download content into.
+            file_details (dict): File details with ``size_bytes`` and ``md5hash``.
+            sources (list): Names of filesharing workers to download ranges from.
+            chunk_size (int): The size of each chunk to be fetched.
+            pipeline (int): Initial number of chunks in transit per range.
+            max_pipeline (int): Maximum number of chunks in transit per range.
+            timeout (int): The maximum time (in seconds) to wait for ranges to be downloaded.
+
+        Returns:
+            None if file downloaded successfully, ``(status, error)`` tuple otherwise.
+        """
+        size = file_details["size_bytes"]
+        chunks = -(-size // chunk_size)
+        range_size = -(-chunks // len(sources)) * chunk_size
+        with open(part, "wb") as f:
+            f.truncate(size)
+
+        log.debug(
+            f"{self.name}:fetch_file - downloading '{url}' in {range_size} bytes "
+            f"ranges from {', '.join(sources)}"
+        )
+        with concurrent.futures.ThreadPoolExecutor(len(sources)) as executor:
+            ranges = []
+            for index, w_name in enumerate(sources):
+                offset = index * range_size
+                if offset >= size:
+                    break
+                destination = open(part, "r+b")
+                destination.seek(offset)
+                ranges.append(
+                    executor.submit(
+                        self.download_chunks,
+                        url=url,
+                        w_name=w_name,
+                        destination=destination,
+                        offset=offset,
+                        length=min(range_size, size - offset),
+                        chunk_size=chunk_size,
+                        pipeline=pipeline,
+                        max_pipeline=max_pipeline,
+                        timeout=timeout,
+                    )
+                )
+            errors = [r.result() for r in ranges if r.result() is not None]
+
+        if errors:
+            return errors[0]
+
+        file_hash = hashlib.md5()
+        with open(part, "rb") as f:
+            chunk = f.read(1048576)
+            while chunk:
+                file_hash.update(chunk)
+                chunk = f.read(1048576)
+        if file_hash.hexdigest() != file_details["md5hash"]:
+            log.error(
+                f"{self.name} - file download failed, MD5 hash mismatch, filename '{part}'"
+            )
+            return "400", "Download failed, MD5 hash mismatch"
+
+        return None
+
     def fetch_file(
         self,
         url: str,
@@ -1550,16 +2237,39 @@ class NFPClient(object):
         pipeline: int = 10,
         timeout: int = 600,
         read: bool = False,
+        file_details: Optional[dict] = None,
+        max_pipeline: int = 64,
+        parallel_size: int = 67108864,
     ) -> Tuple[str, Any]:
         """
         Fetches a file from a given URL and saves it to a specified destination.
 
+        Local files are validated against files hash index, files are hashed
+        only if their modification time or size changed since they were
+        indexed. Downloaded files also stored in content addressed files
+        cache keyed by MD5 hash, so that file content is downloaded only
+        once even if it is served under several URLs or was removed from
+        fetched files folder.
+
+        Files downloaded into partial files named after file MD5 hash,
+        interrupted downloads resumed from partial file size on next fetch
+        of the same file content. Files larger than ``parallel_size`` served
+        by several filesharing workers downloaded in parallel ranges, one
+        range per worker.
+
         Parameters:
             url (str): The URL of the file to be fetched.
             chunk_size (int, optional): The size of each chunk to be fetched. Default is 250000 bytes.
-            pipeline (int, optional): The number of chunks to be fetched in transit. Default is 10.
+            pipeline (int, optional): The number of chunks to be fetched in transit initially. Default is 10.
             timeout (int, optional): The maximum time (in seconds) to wait for the file to be fetched. Default is 600 seconds.
             read (bool, optional): If True, the file content is read and returned. If False, the file path is returned. Default is False.
+            file_details (dict, optional): File details as returned by ``fetch_manifest``
+                method, if provided, file details not retrieved from File Sharing Service.
+            max_pipeline (int, optional): The maximum number of chunks in transit, number of
+                chunks in transit adjusted between 1 and this value based on measured chunks
+                round trip time. Default is 64.
+            parallel_size (int, optional): Minimum file size in bytes to download file in
+                parallel ranges from several filesharing workers. Default is 64MB.
 
         Returns:
             tuple: A tuple containing the status code (str) and the reply (str). The reply can be the file content, file path, or an error message.
@@ -1567,12 +2277,6 @@ class NFPClient(object):
         Raises:
             Exception: If there is an error in fetching the file or if the file's MD5 hash does not match the expected hash.
         """
-
-        # round up digit e.g. if 2.0 -> 2 if 2.1 -> 3 if 0.01 -> 1
-        def round_up(num: float) -> int:
-            return max(1, (int(num) + (not num.is_integer())))
-
-        uuid = uuid4().hex
         result = {"status": "200", "content": None, "error": None}
         downloaded = False
 
@@ -1595,88 +2299,112 @@ class NFPClient(object):
             return result
 
         os.makedirs(os.path.split(destination)[0], exist_ok=True)
+        files_cache = os.path.join(self.base_dir, "filescache")
+        os.makedirs(files_cache, exist_ok=True)
 
-        self.file_transfers[uuid] = {
-            "total_bytes_received": 0,  # Total bytes received
-            "offset": 0,  # Offset of next chunk request
-            "credit": pipeline,  # Up to PIPELINE chunks in transit
-            "chunk_size": chunk_size,
-            "file_hash": hashlib.md5(),
-        }
-
-        # get file details
-        file_details = self.run_job(
-            service="filesharing",
-            workers="all",
-            task="file_details",
-            kwargs={"url": url},
-            timeout=timeout,
-        )
-        for w_name, w_res in file_details.items():
-            if not w_res["failed"]:
-                file_details = w_res["result"]
-                self.file_transfers[uuid].update(file_details)
-                self.file_transfers[uuid]["w_name"] = w_name
-                self.file_transfers[uuid]["chunk_requests_remaining"] = round_up(
-                    file_details["size_bytes"] / chunk_size
-                )
-                break
+        # get file details, all workers serving the same file content
+        # can be used to download file in parallel ranges
+        if file_details is None:
+            reply = self.run_job(
+                service="filesharing",
+                workers="all",
+                task="file_details",
+                kwargs={"url": url},
+                timeout=timeout,
+            )
+            sources = []
+            for w_name, w_res in reply.items():
+                if w_res["failed"]:
+                    continue
+                if file_details is None:
+                    file_details = {**w_res["result"], "w_name": w_name}
+                if w_res["result"]["md5hash"] == file_details["md5hash"]:
+                    sources.append(w_name)
+            if file_details is None:
+                result["status"] = "404"
+                result["error"] = "File download failed - file not found"
+                return result
         else:
-            result["status"] = "404"
-            result["error"] = "File download failed - file not found"
-            _ = self.file_transfers.pop(uuid)
-            return result
+            sources = [file_details["w_name"]]
 
         log.debug(f"{self.name}:fetch_file - retrieved file details - {file_details}")
 
-        # check if file already downloaded
-        if os.path.isfile(destination):
-            file_hash = hashlib.md5()
-            with open(destination, "rb") as f:
-                chunk = f.read(8192)
-                while chunk:
-                    file_hash.update(chunk)
-                    chunk = f.read(8192)
-            md5hash = file_hash.hexdigest()
-            downloaded = md5hash == file_details["md5hash"]
-
-        if file_details["exists"] and not downloaded:
-            self.file_transfers[uuid]["destination"] = open(destination, "wb")
-            # decrement by 1 because calling fetch_job sends first chunk
-            self.file_transfers[uuid]["chunk_requests_remaining"] -= 1
-            # run fetch file job
-            file_fetch_job = self.run_job(
-                uuid=uuid,
-                service="filesharing",
-                workers=[w_name],
-                task="fetch_file",
-                kwargs={"url": url, "offset": 0, "chunk_size": chunk_size},
-                timeout=timeout,
-            )
-            file_fetch_job = file_fetch_job[w_name]
+        md5hash = file_details["md5hash"]
+        size = file_details["size_bytes"]
+        cached = os.path.join(files_cache, md5hash)
 
-            if file_fetch_job["failed"]:
-                result["status"] = "404"
-                result["error"] = file_fetch_job["errors"]
-                downloaded = False
-            else:
-                downloaded = True
+        # fetch the same destination file one at a time
+        with self.files_index_lock:
+            file_lock = self.file_locks.setdefault(destination, threading.Lock())
 
-        if downloaded:
-            # Verify streaming did not mark job failed (e.g., MD5 mismatch)
-            download_job = self.job_db.get_job(uuid)
-            if download_job and download_job.get("status") == JobStatus.FAILED:
-                result["error"] = (
-                    f"File download job {uuid} failed: {download_job.get('errors', [])}"
-                )
-                result["status"] = "400"
-            elif read:
-                with open(destination, "r", encoding="utf-8") as f:
-                    result["content"] = f.read()
-            else:
-                result["content"] = destination
+        with file_lock:
+            # check if file already downloaded or cached
+            if self.local_file_md5(destination) == md5hash:
+                downloaded = True
+            elif self.local_file_md5(cached) == md5hash:
+                self.place_file(cached, destination)
+                self.index_local_file(destination, md5hash)
+                downloaded = True
+                log.debug(f"{self.name}:fetch_file - '{url}' restored from files cache")
+            elif file_details["exists"]:
+                part = f"{destination}.{md5hash}.part"
+                transfer = {
+                    "chunk_size": chunk_size,
+                    "pipeline": pipeline,
+                    "max_pipeline": max_pipeline,
+                    "timeout": timeout,
+                }
+                if len(sources) > 1 and size >= parallel_size:
+                    error = self.download_ranges(
+                        url, part, file_details, sources, **transfer
+                    )
+                else:
+                    # resume interrupted download of the same file content
+                    file_hash = hashlib.md5()
+                    offset = os.path.getsize(part) if os.path.isfile(part) else 0
+                    if 0 < offset < size:
+                        with open(part, "rb") as f:
+                            chunk = f.read(1048576)
+                            while chunk:
+                                file_hash.update(chunk)
+                                chunk = f.read(1048576)
+                        log.info(
+                            f"{self.name} - resuming '{url}' download from offset {offset}"
+                        )
+                    else:
+                        offset = 0
+                    error = self.download_chunks(
+                        url=url,
+                        w_name=sources[0],
+                        destination=open(part, "ab" if offset else "wb"),
+                        offset=offset,
+                        length=size - offset,
+                        file_hash=file_hash,
+                        md5hash=md5hash,
+                        **transfer,
+                    )
 
-        _ = self.file_transfers.pop(uuid)
+                if error:
+                    result["status"], result["error"] = error
+                    # keep partial file of interrupted downloads to resume them
+                    if result["status"] == "400" and os.path.exists(part):
+                        os.remove(part)
+                else:
+                    os.replace(part, destination)
+                    self.index_local_file(destination, md5hash)
+                    self.place_file(destination, cached)
+                    self.index_local_file(cached, md5hash)
+                    downloaded = True
+                    # remove partial files of previous file versions
+                    for stale in glob.glob(f"{glob.escape(destination)}.*.part"):
+                        os.remove(stale)
+
+            if downloaded:
+                if read:
+                    with open(destination, "r", encoding="utf-8") as f:
+                        result["content"] = f.read()
+                else:
+                    result["content"] = destination
 
         return result
 
@@ -1688,7 +2416,9 @@ class NFPClient(object):
             JobStatus.STARTED,
             JobStatus.WAITING_CLIENT_INPUT,
         ]
-        for job in self.job_db.fetch_jobs(active_statuses, limit=10000):
+        for job in self.job_db.fetch_jobs(
+            active_statuses, limit=10000, include_results=False
+        ):
             if job["deadline"] and time.time() >= job["deadline"]:
                 self.job_db.update_job(
                     job["uuid"],
@@ -1711,6 +2441,49 @@ class NFPClient(object):
                 kwargs=job["kwargs"],
             )
 
+    def job_db_compact(
+        self,
+        max_age: int = None,
+        max_count: int = None,
+        max_size: int = None,
+        archive: bool = None,
+        vacuum: bool = True,
+    ) -> dict:
+        """
+        Delete finished jobs that exceed retention limits, optionally archiving
+        them, and compact client jobs database.
+
+        Arguments default to client inventory ``jobs_retention`` settings.
+
+        Args:
+            max_age (int, optional): Delete jobs older than this number of seconds.
+            max_count (int, optional): Keep only this number of newest jobs.
+            max_size (int, optional): Keep newest jobs with total data size within this number of bytes.
+            archive (bool, optional): If True, archive jobs to compressed JSONL files before deleting them.
+            vacuum (bool, optional): If True, release free database pages to the file system.
+
+        Returns:
+            dict: Number of deleted and archived jobs and database size.
+        """
+        retention = self.jobs_retention
+        self.jobs_retention_run_at = time.time() + retention.get("interval", 3600)
+        archive = retention.get("archive", False) if archive is None else archive
+        ret = self.job_db.apply_retention(
+            max_age=max_age or retention.get("max_age"),
+            max_count=max_count or retention.get("max_count"),
+            max_size=max_size or retention.get("max_size"),
+            archive=self.jobs_archive if archive else None,
+        )
+        # forget futures of deleted jobs
+        if ret["deleted_jobs"]:
+            for juuid in list(self.job_futures):
+                if self.job_db.get_job(juuid, include_results=False) is None:
+                    self.job_futures.pop(juuid, None)
+        if vacuum:
+            ret.update(self.job_db.compact(retention.get("vacuum_pages")))
+        log.info(f"{self.name} - jobs database retention applied: {ret}")
+        return ret
+
     def submit_job(
         self,
         service: str,
@@ -1720,6 +2493,7 @@ class NFPClient(object):
         kwargs: dict = None,
         workers: Union[str, list] = "all",
         timeout: int = 600,
+        priority: int = 0,
     ) -> NFPJobFuture:
         uuid = uuid or uuid4().hex
         args = args or []
@@ -1727,7 +2501,7 @@ class NFPClient(object):
         deadline = time.time() + timeout
 
         self.job_db.add_job(
-            uuid, service, task, workers, args, kwargs, timeout, deadline
+            uuid, service, task, workers, args, kwargs, timeout, deadline, priority
         )
         future = NFPJobFuture(
             client=self,
@@ -1756,6 +2530,8 @@ class NFPClient(object):
         timeout: int = 600,
         markdown: bool = False,
         nowait: bool = False,
+        priority: int = 0,
+        iter_results: bool = False,
     ) -> Any:
         """
         Run a job on the specified service and task, with optional arguments and timeout settings.
@@ -1774,6 +2550,9 @@ class NFPClient(object):
             timeout (int, optional): The maximum time in seconds to wait for the job to complete. Defaults to 600.
             markdown (bool, optional): Convert results to markdown representation
             nowait (bool, optional): If false, wait for job to complete for timeout, return job details otherwise
+            priority (int, optional): Job priority, workers run higher priority jobs first. Defaults to 0.
+            iter_results (bool, optional): If True, return iterator that yields ``(worker_name, result)``
+                tuples as each worker completes the job. Defaults to False.
 
         Returns:
             Any: The result of the job if successful, or None if the job failed, timed out, or became stale.
@@ -1786,6 +2565,7 @@ class NFPClient(object):
             kwargs=kwargs,
             workers=workers,
             timeout=timeout,
+            priority=priority,
         )
 
         if nowait is True:
@@ -1794,6 +2574,9 @@ class NFPClient(object):
                 "service": service,
             }
 
+        if iter_results is True:
+            return future.iter_results(timeout=timeout)
+
         return future.result(timeout=timeout, markdown=markdown)
 
     def get_agent(self, profile: str = "default") -> "NFAgent":
@@ -1845,7 +2628,7 @@ class NFPClient(object):
         log.info(f"{self.name} - client interrupt received, killing client")
         self.destroy_event.set()
         for future in self.job_futures.values():
-            future.mark_done(self.job_db.get_job(future.uuid))
+            future.mark_done(self.job_db.get_job(future.uuid, include_results=False))
         # Wait for background threads to exit before destroying the ZMQ context.
         # Without this, the dispatcher/receiver threads may still be executing
         # between their destroy_event check and a socket call, causing
@@ -1854,6 +2637,8 @@ class NFPClient(object):
             self.recv_thread.join(timeout=2)
         if self.dispatcher_thread.is_alive():
             self.dispatcher_thread.join(timeout=2)
+        if self.maintenance_thread is not None and self.maintenance_thread.is_alive():
+            self.maintenance_thread.join(timeout=2)
         self.job_db.close()
         self.ctx.destroy()
         # close all file transfer files
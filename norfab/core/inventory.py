@@ -75,11 +75,17 @@ import fnmatch
 import logging
 import os
 import sys
+from stat import S_ISREG
 from typing import Any, Dict, List
 
 import yaml
 from jinja2 import Environment
 
+try:
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:
+    from yaml import SafeLoader
+
 from norfab.utils.nflogging import make_logging_config as make_norfab_logging_config
 
 log = logging.getLogger(__name__)
@@ -110,9 +116,7 @@ def merge_recursively(data: dict, merge: dict) -> None:
         if k in data:
             # merge two lists
             if isinstance(data[k], list) and isinstance(v, list):
-                for i in v:
-                    if i not in data[k]:
-                        data[k].append(i)
+                merge_lists(data[k], v)
             # recursively merge dictionaries
             elif isinstance(data[k], dict) and isinstance(v, dict):
                 merge_recursively(data[k], v)
@@ -123,6 +127,52 @@ def merge_recursively(data: dict, merge: dict) -> None:
             data[k] = v
 
 
+def merge_lists(data: list, merge: list) -> None:
+    """
+    Function to append items of one list to another list, avoiding duplicates.
+
+    Hashable items checked for duplicates using a set of existing items, unhashable
+    items, such as dictionaries, checked by scanning the list.
+
+    Args:
+        data: The list to append items to.
+        merge: The list with items to append.
+    """
+    try:
+        seen = set(data)
+    except TypeError:
+        seen = None
+    for i in merge:
+        if seen is not None:
+            try:
+                if i in seen:
+                    continue
+                seen.add(i)
+            except TypeError:
+                if i in data:
+                    continue
+        elif i in data:
+            continue
+        data.append(i)
+
+
+def copy_data(data: Any) -> Any:
+    """
+    Function to copy dictionaries and lists structure of YAML loaded data.
+
+    Args:
+        data: Data to copy.
+
+    Returns:
+        Copy of data with new dictionaries and lists objects.
+    """
+    if isinstance(data, dict):
+        return {k: copy_data(v) for k, v in data.items()}
+    if isinstance(data, list):
+        return [copy_data(i) for i in data]
+    return data
+
+
 def make_hooks(base_dir: str, hooks: List) -> Dict[str, List]:
     """
     Load and organize hook functions from specified modules.
@@ -288,11 +338,19 @@ class WorkersInventory:
     forming it by recursively merging all data files that associated
     with the name of worker requesting inventory data.
 
+    Rendered and parsed data files cached keyed by file modification time,
+    size and OS environment variables hash, merged workers inventory data
+    cached until any of the files, environment variables or inventory
+    dictionaries it was formed from change. Callers receive a copy of cached
+    inventory data and are free to modify it.
+
     Attributes:
         path (str): OS path to the top folder with workers inventory data.
         data (dict): Dictionary keyed by glob patterns matching workers' names
             and values being a list of OS paths to files or dictionaries with workers'
             inventory data.
+        files_cache (dict): Parsed data files cache keyed by file path.
+        results_cache (dict): Merged inventory data cache keyed by worker name.
 
     Methods:
         __init__(path: str, data: dict) -> None:
@@ -305,15 +363,44 @@ class WorkersInventory:
     __slots__ = (
         "path",
         "data",
+        "files_cache",
+        "results_cache",
     )
 
     def __init__(self, path: str, data: dict) -> None:
         self.path = path
         self.data = data
+        self.files_cache = {}
+        self.results_cache = {}
 
-    def __getitem__(self, name: str) -> Any:
-        ret = {}
+    def __getstate__(self) -> dict:
+        # do not pass cached data to child processes
+        return {"path": self.path, "data": self.data}
 
+    def __setstate__(self, state: dict) -> None:
+        self.__init__(state["path"], state["data"])
+
+    def load_file(self, path: str, signature: tuple) -> Any:
+        """
+        Render and parse data file, reusing cached data if file signature not changed.
+
+        Args:
+            path (str): OS path to data file.
+            signature (tuple): File modification time, size and environment hash.
+
+        Returns:
+            Parsed file data.
+        """
+        cached = self.files_cache.get(path)
+        if cached is not None and cached["signature"] == signature:
+            return cached["data"]
+        with open(path, "r", encoding="utf-8") as f:
+            rendered = render_jinja2_template(f.read())
+            data = yaml.load(rendered, Loader=SafeLoader)
+        self.files_cache[path] = {"signature": signature, "data": data}
+        return data
+
+    def __getitem__(self, name: str) -> Any:
         # iterate over data keys and collect paths matching the item name
         paths = []
         for key, path_items in self.data.items():
@@ -322,25 +409,44 @@ class WorkersInventory:
                     if i not in paths:
                         paths.append(i)
 
-        # iterate over path items, load and merge them
+        # collect inputs signature to check if cached results are valid
+        env_hash = hash(frozenset(os.environ.items()))
+        signature = []
         for item in paths:
             if isinstance(item, str):
-                if os.path.isfile(os.path.join(self.path, item)):
-                    with open(
-                        os.path.join(self.path, item), "r", encoding="utf-8"
-                    ) as f:
-                        rendered = render_jinja2_template(f.read())
-                        merge_recursively(ret, yaml.safe_load(rendered))
-                else:
-                    log.error(f"{os.path.join(self.path, item)} - file not found")
-                    raise FileNotFoundError(os.path.join(self.path, item))
+                path = os.path.join(self.path, item)
+                try:
+                    stat = os.stat(path)
+                except OSError:
+                    stat = None
+                if stat is None or not S_ISREG(stat.st_mode):
+                    log.error(f"{path} - file not found")
+                    raise FileNotFoundError(path)
+                signature.append((path, stat.st_mtime_ns, stat.st_size, env_hash))
             elif isinstance(item, dict):
-                merge_recursively(ret, item)
+                signature.append(item)
             else:
                 raise TypeError(f"Expecting string or dictionary not {type(item)}")
 
+        cached = self.results_cache.get(name)
+        if cached is not None and cached["signature"] == signature:
+            return copy_data(cached["data"])
+
+        # iterate over path items, load and merge them
+        ret = {}
+        for item, item_signature in zip(paths, signature):
+            if isinstance(item, str):
+                data = self.load_file(item_signature[0], item_signature[1:])
+                merge_recursively(ret, copy_data(data))
+            else:
+                merge_recursively(ret, copy_data(item))
+
         if ret:
-            return ret
+            self.results_cache[name] = {
+                "signature": copy_data(signature),
+                "data": ret,
+            }
+            return copy_data(ret)
         else:
             raise KeyError(f"{name} has no inventory data")
 
@@ -446,7 +552,7 @@ class NorFabInventory:
 
         with open(path, "r", encoding="utf-8") as f:
             rendered = render_jinja2_template(f.read())
-            data = yaml.safe_load(rendered)
+            data = yaml.load(rendered, Loader=SafeLoader)
 
         self.load_data(data)
 
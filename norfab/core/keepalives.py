@@ -1,6 +1,9 @@
+import heapq
+import itertools
 import logging
 import threading
 import time
+from typing import Callable
 
 from . import NFP
 
@@ -21,6 +24,8 @@ class KeepAliver:
         whoami (str): Identifier e.g. NFP.WORKER or NFP.BROKER to use as keepalives header.
         name (str): Descriptive name to include in logs.
         socket_lock: Lock to synchronize access to the socket.
+        scheduler (KeepAliveScheduler): Optional scheduler to send keepalives
+            and check holdtime with instead of running dedicated thread.
 
     Attributes:
         address (str): Address to send keepalives to.
@@ -39,11 +44,13 @@ class KeepAliver:
         holdtime (float): Expiry time unless heartbeat is received.
         keepalive_at (float): Time to send the next keepalive.
         keepalive_thread (threading.Thread): Thread to run keepalives.
+        scheduler (KeepAliveScheduler): Scheduler that runs keepalives.
 
     Methods:
         start(): Start keepalives thread.
         stop(): Stop keepalives thread.
         run(): Send heartbeats at keepalive interval.
+        send_keepalive(): Send single heartbeat.
         received_heartbeat(msg): Update holdtime when a heartbeat is received.
         restart(socket): Restart keepalives with a new socket.
         is_alive(): Check if the other party is seen before expiry.
@@ -62,6 +69,7 @@ class KeepAliver:
         whoami: str,  # NFP.BROKER or NFP.WORKER
         name: str,
         socket_lock,
+        scheduler: "KeepAliveScheduler" = None,
     ) -> None:
         self.address = address
         self.socket = socket
@@ -75,6 +83,7 @@ class KeepAliver:
         self.whoami = whoami
         self.name = f"{name}-keepaliver"
         self.socket_lock = socket_lock
+        self.scheduler = scheduler
         self.build_message = NFP.MessageBuilder()
 
         self.started_at = 0
@@ -87,22 +96,28 @@ class KeepAliver:
             time.time() + 0.001 * self.keepalive
         )  # when to send keepalive
 
-        self.keepalive_thread = threading.Thread(
-            target=self.run, name=f"{self.name}_keepalives_thread", daemon=True
-        )
+        self.keepalive_thread = None
+        if self.scheduler is None:
+            self.keepalive_thread = threading.Thread(
+                target=self.run, name=f"{self.name}_keepalives_thread", daemon=True
+            )
 
     def start(self) -> bool:
         """
         Start the keepalives thread and record the start time.
 
-        This method initiates the keepalive thread and sets the `started_at`
-        attribute to the current time.
+        This method initiates the keepalive thread, or registers with the
+        scheduler if provided, and sets the `started_at` attribute to the
+        current time.
 
         Returns:
             bool: True if the keepalive thread was successfully started.
         """
-        self.keepalive_thread.start()
         self.started_at = time.time()
+        if self.scheduler is not None:
+            self.scheduler.add(self)
+        else:
+            self.keepalive_thread.start()
         return True
 
     def stop(self) -> bool:
@@ -118,7 +133,10 @@ class KeepAliver:
         """
         if not self.destroy_event.is_set():
             self.destroy_event.set()
-        self.keepalive_thread.join()
+        if self.scheduler is not None:
+            self.scheduler.remove(self)
+        else:
+            self.keepalive_thread.join()
         return True
 
     def run(self) -> None:
@@ -139,27 +157,29 @@ class KeepAliver:
         """
         while not self.exit_event.is_set() and not self.destroy_event.is_set():
             if time.time() > self.keepalive_at:  # time to send heartbeat
-                if self.whoami == NFP.WORKER:
-                    msg = self.build_message.worker_to_broker_keepalive(
-                        service=self.service
-                    )
-                elif self.whoami == NFP.BROKER:
-                    msg = self.build_message.broker_to_worker_keepalive(
-                        address=self.address,
-                        service=self.service,
-                    )
-                with self.socket_lock:
-                    try:
-                        self.socket.send_multipart(msg)
-                    except Exception as e:
-                        log.error(
-                            f"{self.name} - failed to send keepalive, error '{e}'"
-                        )
-                self.keepalive_at = time.time() + 0.001 * self.keepalive
-                self.keepalives_send += 1
-                log.debug(f"{self.name} - send keepalive '{msg}'")
+                self.send_keepalive()
             time.sleep(0.1)
 
+    def send_keepalive(self) -> None:
+        """
+        Send single heartbeat message and schedule next keepalive time.
+        """
+        if self.whoami == NFP.WORKER:
+            msg = self.build_message.worker_to_broker_keepalive(service=self.service)
+        elif self.whoami == NFP.BROKER:
+            msg = self.build_message.broker_to_worker_keepalive(
+                address=self.address,
+                service=self.service,
+            )
+        with self.socket_lock:
+            try:
+                self.socket.send_multipart(msg)
+            except Exception as e:
+                log.error(f"{self.name} - failed to send keepalive, error '{e}'")
+        self.keepalive_at = time.time() + 0.001 * self.keepalive
+        self.keepalives_send += 1
+        log.debug(f"{self.name} - send keepalive '{msg}'")
+
     def received_heartbeat(self, msg) -> None:
         """
         Handles the reception of a heartbeat message from another party.
@@ -225,3 +245,125 @@ class KeepAliver:
             int: The number of seconds since the instance was started.
         """
         return int(time.time() - self.started_at)
+
+
+class KeepAliveScheduler:
+    """
+    Single thread scheduler to send keepalives and check holdtime for many
+    KeepAliver objects, used by broker instead of running a thread per worker.
+
+    Scheduler keeps a heap of ``(due time, sequence, action, keepaliver)``
+    entries, where action is ``send`` to send keepalive or ``expire`` to check
+    keepaliver holdtime, and sleeps until next entry is due.
+
+    Args:
+        exit_event (threading.Event): Global exit event, if set stop scheduler.
+        name (str): Descriptive name to include in logs.
+        on_expire (callable): Function to call with KeepAliver object as an
+            argument once its holdtime expired.
+
+    Attributes:
+        keepalivers (set): Set of registered KeepAliver objects.
+        heap (list): Heap of scheduled actions.
+        condition (threading.Condition): Condition to protect heap and wake up
+            scheduler thread.
+        scheduler_thread (threading.Thread): Thread to run scheduler.
+    """
+
+    def __init__(
+        self,
+        exit_event: threading.Event,
+        name: str,
+        on_expire: Callable = None,
+    ) -> None:
+        self.exit_event = exit_event or threading.Event()
+        self.destroy_event = threading.Event()
+        self.name = f"{name}-keepalive-scheduler"
+        self.on_expire = on_expire
+        self.keepalivers = set()
+        self.heap = []
+        self.sequence = itertools.count()
+        self.condition = threading.Condition()
+        self.scheduler_thread = threading.Thread(
+            target=self.run, name=f"{self.name}_thread", daemon=True
+        )
+
+    def start(self) -> bool:
+        """Start scheduler thread."""
+        self.scheduler_thread.start()
+        return True
+
+    def stop(self) -> bool:
+        """Stop scheduler thread."""
+        self.destroy_event.set()
+        with self.condition:
+            self.condition.notify()
+        if self.scheduler_thread.is_alive():
+            self.scheduler_thread.join()
+        return True
+
+    def schedule(self, due: float, action: str, keepaliver: KeepAliver) -> None:
+        """Push action to the heap, must be called with condition lock acquired."""
+        heapq.heappush(self.heap, (due, next(self.sequence), action, keepaliver))
+
+    def add(self, keepaliver: KeepAliver) -> None:
+        """
+        Register KeepAliver to send keepalives and check its holdtime.
+
+        Args:
+            keepaliver (KeepAliver): KeepAliver object to register.
+        """
+        with self.condition:
+            self.keepalivers.add(keepaliver)
+            self.schedule(keepaliver.keepalive_at, "send", keepaliver)
+            self.schedule(keepaliver.holdtime, "expire", keepaliver)
+            self.condition.notify()
+
+    def remove(self, keepaliver: KeepAliver) -> None:
+        """
+        Unregister KeepAliver, its heap entries discarded once due.
+
+        Args:
+            keepaliver (KeepAliver): KeepAliver object to unregister.
+        """
+        with self.condition:
+            self.keepalivers.discard(keepaliver)
+
+    def run(self) -> None:
+        """
+        Wait for next due heap entry and run it - send keepalive and schedule
+        next one or check holdtime and call ``on_expire`` if it expired.
+        """
+        while not self.exit_event.is_set() and not self.destroy_event.is_set():
+            due = []
+            with self.condition:
+                now = time.time()
+                while self.heap and self.heap[0][0] <= now:
+                    _, _, action, keepaliver = heapq.heappop(self.heap)
+                    if keepaliver in self.keepalivers:
+                        due.append((action, keepaliver))
+                if not due:
+                    timeout = self.heap[0][0] - now if self.heap else 1
+                    self.condition.wait(min(timeout, 1))
+                    continue
+
+            for action, keepaliver in due:
+                if action == "send":
+                    keepaliver.send_keepalive()
+                    with self.condition:
+                        if keepaliver in self.keepalivers:
+                            self.schedule(keepaliver.keepalive_at, "send", keepaliver)
+                elif keepaliver.is_alive():
+                    with self.condition:
+                        if keepaliver in self.keepalivers:
+                            self.schedule(keepaliver.holdtime, "expire", keepaliver)
+                else:
+                    self.remove(keepaliver)
+                    if self.on_expire is not None:
+                        try:
+                            self.on_expire(keepaliver)
+                        except Exception as e:
+                            log.error(
+                                f"{self.name} - on expire callback failed, error '{e}'",
+                                exc_info=True,
+                            )
@@ -3,9 +3,10 @@ import logging
 import os
 import signal
 import sys
+import threading
 import time
 from importlib.metadata import EntryPoint, entry_points
-from multiprocessing import Event, Process
+from multiprocessing import get_context
 from typing import Union
 
 from dotenv import load_dotenv
@@ -174,9 +175,8 @@ class NorFab:
         self.workers_init_timeout = self.inventory.topology.get(
             "workers_init_timeout", 300
         )
-        self.broker_exit_event = Event()
-        self.workers_exit_event = Event()
-        self.clients_exit_event = Event()
+        self.workers_start_method = self.inventory.topology.get("workers_start_method")
+        self.workers_preload = self.inventory.topology.get("workers_preload", [])
 
         # create needed folders to kickstart the logs
         os.makedirs(
@@ -196,6 +196,12 @@ class NorFab:
         # find all workers plugins
         self.register_plugins()
 
+        # create processes context and events shared with processes
+        self.mp_context = self.make_mp_context()
+        self.broker_exit_event = self.mp_context.Event()
+        self.workers_exit_event = self.mp_context.Event()
+        self.clients_exit_event = self.mp_context.Event()
+
     def load_env_file(
         self,
         inventory: str,
@@ -285,6 +291,40 @@ class NorFab:
                 f"was already registered under this service."
             )
 
+    def make_mp_context(self) -> object:
+        """
+        Create multiprocessing context to start broker and workers processes with.
+
+        Uses default start method unless inventory topology `workers_start_method`
+        parameter defines one of `fork`, `spawn` or `forkserver` methods. For
+        `forkserver` method, NorFab and registered worker plugins modules, together
+        with modules listed in topology `workers_preload` parameter, imported once
+        by fork server process, allowing workers processes to start without
+        importing these modules from scratch.
+
+        Returns:
+            multiprocessing context object.
+        """
+        try:
+            ctx = get_context(self.workers_start_method)
+        except ValueError as e:
+            log.warning(
+                f"Unsupported workers start method '{self.workers_start_method}', "
+                f"using default start method, error '{e}'"
+            )
+            return get_context()
+
+        if ctx.get_start_method() == "forkserver":
+            preload = ["norfab.core.nfapi"]
+            for worker_plugin in self.worker_plugins.values():
+                if isinstance(worker_plugin, EntryPoint):
+                    preload.append(worker_plugin.module)
+            preload.extend(self.workers_preload)
+            ctx.set_forkserver_preload(list(dict.fromkeys(preload)))
+            log.debug(f"Fork server preloads modules: {', '.join(preload)}")
+
+        return ctx
+
     def add_built_in_workers_inventory(self) -> None:
         built_in_workers = {
             "filesharing-worker-1": [
@@ -374,9 +414,10 @@ class NorFab:
             Error: If no broker endpoint is defined or if the broker fails to start.
         """
         if self.broker_endpoint:
-            init_done_event = Event()  # for worker to signal if its fully initiated
+            # for broker to signal if its fully initiated
+            init_done_event = self.mp_context.Event()
 
-            self.broker = Process(
+            self.broker = self.mp_context.Process(
                 target=start_broker_process,
                 args=(
                     self.broker_endpoint,
@@ -424,7 +465,8 @@ class NorFab:
         if not self.workers_processes.get(worker_name):
             log.debug(f"NFAPI PID {os.getpid()} {worker_name} starting worker process")
             worker_inventory = self.inventory[worker_name]
-            init_done_event = Event()  # for worker to signal if its fully initiated
+            # for worker to signal if its fully initiated
+            init_done_event = self.mp_context.Event()
 
             # check dependent processes
             if worker_data.get("depends_on"):
@@ -451,7 +493,7 @@ class NorFab:
             worker_plugin = self.worker_plugins[worker_inventory["service"]]
 
             self.workers_processes[worker_name] = {
-                "process": Process(
+                "process": self.mp_context.Process(
                     target=start_worker_process,
                     args=(
                         worker_plugin,
@@ -464,12 +506,174 @@ class NorFab:
                     ),
                 ),
                 "init_done": init_done_event,
+                "started_at": time.time(),
+                "timings": {},
             }
 
             self.workers_processes[worker_name]["process"].start()
+            self.workers_processes[worker_name]["timings"]["process_start"] = round(
+                time.time() - self.workers_processes[worker_name]["started_at"], 3
+            )
 
             log.debug(f"NFAPI PID {os.getpid()} {worker_name} worker process started")
 
+    def watch_worker_init(self, worker_name: str, changed: threading.Event) -> None:
+        """
+        Wait for worker process to initialize or to exit, recording worker
+        initialization time and setting ``changed`` event once done.
+
+        Args:
+            worker_name (str): Name of the worker to watch.
+            changed (threading.Event): Event to set once worker initialized or exited.
+        """
+        worker = self.workers_processes[worker_name]
+        deadline = time.time() + self.workers_init_timeout
+        while not worker["init_done"].wait(timeout=1):
+            if not worker["process"].is_alive() or time.time() > deadline:
+                break
+        else:
+            worker["timings"]["init"] = round(time.time() - worker["started_at"], 3)
+            log.info(
+                f"'{worker_name}' - worker initialized, timings: "
+                + ", ".join(f"{k} {v}s" for k, v in worker["timings"].items())
+            )
+        changed.set()
+
+    def start_workers(self, workers: dict) -> None:
+        """
+        Starts workers processes in the order of their dependencies and waits
+        for them to initialize.
+
+        Workers that do not depend on other workers or which dependencies already
+        initialized started at once, remaining workers started as soon as all their
+        `depends_on` workers initialized. Waiting done using events signalled by
+        workers initialization watcher threads. Workers which dependencies failed
+        to start or exited before initializing not started.
+
+        Each worker startup phases durations in seconds recorded in worker
+        process `timings` dictionary:
+
+        - `queued` - time since workers startup began until worker process
+            started, including time spent waiting for dependencies to initialize
+        - `process_start` - time it took to start worker process
+        - `init` - time since worker process started until worker initialized
+
+        Args:
+            workers (dict): Dictionary keyed by worker name with worker data values.
+        """
+        changed = threading.Event()
+        pending = dict(workers)
+        failed = set()
+        start_time = time.time()
+
+        while True:
+            changed.clear()
+            progress = True
+            while progress:
+                progress = False
+                for worker_name, worker_data in list(pending.items()):
+                    depends_on = worker_data.get("depends_on") or []
+                    failed_depends = [
+                        w
+                        for w in depends_on
+                        if w in failed
+                        or (w not in workers and w not in self.workers_processes)
+                    ]
+                    if failed_depends:
+                        pending.pop(worker_name)
+                        failed.add(worker_name)
+                        progress = True
+                        log.error(
+                            f"'{worker_name}' - failed to start worker, dependent "
+                            f"workers failed to start '{', '.join(failed_depends)}'"
+                        )
+                        continue
+                    if not all(
+                        w in self.workers_processes
+                        and self.workers_processes[w]["init_done"].is_set()
+                        for w in depends_on
+                    ):
+                        continue
+                    pending.pop(worker_name)
+                    progress = True
+                    try:
+                        self.start_worker(worker_name, worker_data)
+                    # if failed to start add to failed workers
+                    except KeyError:
+                        failed.add(worker_name)
+                        log.error(
+                            f"'{worker_name}' - failed to start worker, no inventory data found"
+                        )
+                        continue
+                    except FileNotFoundError as e:
+                        failed.add(worker_name)
+                        log.error(
+                            f"'{worker_name}' - failed to start worker, inventory file not found '{e}'"
+                        )
+                        continue
+                    except Exception as e:
+                        failed.add(worker_name)
+                        log.exception(
+                            f"'{worker_name}' - failed to start worker, error '{e}'"
+                        )
+                        continue
+                    worker = self.workers_processes[worker_name]
+                    worker["timings"] = {
+                        "queued": round(worker["started_at"] - start_time, 3),
+                        **worker["timings"],
+                    }
+                    threading.Thread(
+                        target=self.watch_worker_init,
+                        args=(worker_name, changed),
+                        daemon=True,
+                        name=f"{worker_name}_init_watcher",
+                    ).start()
+
+            # check started workers state
+            initializing = []
+            exited = False
+            for worker_name, worker in self.workers_processes.items():
+                if worker["init_done"].is_set() or worker_name in failed:
+                    continue
+                if worker["process"].is_alive():
+                    initializing.append(worker_name)
+                else:
+                    failed.add(worker_name)
+                    exited = True
+                    log.error(
+                        f"'{worker_name}' - worker process exited before initializing"
+                    )
+
+            if not initializing and not pending:
+                break
+            if not initializing:
+                # re-check pending workers dependencies if any worker exited
+                if exited:
+                    continue
+                for worker_name in pending:
+                    failed.add(worker_name)
+                    log.error(
+                        f"'{worker_name}' - failed to start worker, circular "
+                        f"workers dependencies"
+                    )
+                break
+            remaining = self.workers_init_timeout - (time.time() - start_time)
+            if remaining <= 0:
+                log.error(
+                    f"TimeoutError - {self.workers_init_timeout}s workers init timeout "
+                    f"expired, workers not initialized: {', '.join(initializing)}, "
+                    f"workers not started: {', '.join(pending) or 'none'}"
+                )
+                self.destroy()
+                return
+            changed.wait(remaining)
+
+        log.info(
+            f"Started {len([w for w in workers if w not in failed])} workers in "
+            f"{round(time.time() - start_time, 3)}s"
+            + (f", failed to start: {', '.join(sorted(failed))}" if failed else "")
+        )
+
     def start(
         self,
         run_broker: bool = None,
@@ -498,7 +702,6 @@ class NorFab:
         """
         run_broker = run_broker or self.run_broker
         run_workers = run_workers or self.run_workers
-        workers_to_start = set()
 
         # start the broker
         if run_broker is True and self.inventory.topology.get("broker") is True:
@@ -519,62 +722,21 @@ class NorFab:
         if not run_workers:
             return
 
-        # form a list of workers to start
-        for worker_name in run_workers:
-            if isinstance(worker_name, dict):
-                worker_name = tuple(worker_name)[0]
+        # form a dictionary of workers to start keyed by worker name
+        workers_to_start = {}
+        for worker in run_workers:
+            if isinstance(worker, dict):
+                worker_name = tuple(worker)[0]
+                worker_data = worker[worker_name] or {}
+            else:
+                worker_name = worker
+                worker_data = {}
             if worker_name:
-                workers_to_start.add(worker_name)
+                workers_to_start[worker_name] = worker_data
             else:
                 log.error(f"'{worker_name}' - worker name is bad, skipping..")
-                continue
-
-        while workers_to_start != set(self.workers_processes.keys()):
-            for worker in run_workers:
-                # extract worker name and data/params
-                if isinstance(worker, dict):
-                    worker_name = tuple(worker)[0]
-                    worker_data = worker[worker_name]
-                elif worker:
-                    worker_name = worker
-                    worker_data = {}
-                else:
-                    continue
-                # verify if need to start this worker
-                if worker_name not in workers_to_start:
-                    continue
-                # start worker
-                try:
-                    self.start_worker(worker_name, worker_data)
-                # if failed to start remove from workers to start
-                except KeyError:
-                    workers_to_start.discard(worker_name)
-                    log.error(
-                        f"'{worker_name}' - failed to start worker, no inventory data found"
-                    )
-                except FileNotFoundError as e:
-                    workers_to_start.discard(worker_name)
-                    log.error(
-                        f"'{worker_name}' - failed to start worker, inventory file not found '{e}'"
-                    )
-                except Exception as e:
-                    workers_to_start.discard(worker_name)
-                    log.exception(
-                        f"'{worker_name}' - failed to start worker, error '{e}'"
-                    )
-
-            time.sleep(0.01)
 
-        # wait for workers to initialize
-        start_time = time.time()
-        while self.workers_init_timeout > time.time() - start_time:
-            if all(w["init_done"].is_set() for w in self.workers_processes.values()):
-                break
-        else:
-            log.error(
-                f"TimeoutError - {self.workers_init_timeout}s workers init timeout expired"
-            )
-            self.destroy()
+        self.start_workers(workers_to_start)
 
         # run startup hooks
         for f in self.inventory.hooks.get("startup", []):
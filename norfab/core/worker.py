@@ -1,7 +1,9 @@
 import concurrent.futures
 import copy
 import functools
+import heapq
 import inspect
+import itertools
 import logging
 import os
 import queue
@@ -18,7 +20,7 @@ from typing import Any, Callable, Dict, List, Literal, Optional, Union
 import orjson
 import psutil
 import zmq
-from jinja2 import Environment, FileSystemLoader, meta
+from jinja2 import Environment, meta
 from jinja2.nodes import Include
 from pydantic import (
     BaseModel,
@@ -33,6 +35,13 @@ from pydantic import (
 from norfab import models
 from norfab.core.inventory import NorFabInventory
 from norfab.models import InputRequestModel, NorFabEvent, Result
+from norfab.utils.jinja2_templates import Jinja2Templates
+from norfab.utils.jobs_retention import (
+    JobsArchive,
+    compact_database,
+    delete_jobs,
+    select_expired_jobs,
+)
 from norfab.utils.nflogging import read_jsonl_logs, setup_process_logging
 from norfab.utils.text import format_duration
 
@@ -675,6 +684,9 @@ class JobDatabase:
             )
             self._local.conn.row_factory = sqlite3.Row
             # Enable WAL mode for better concurrent access
+            # release deleted jobs pages incrementally, must be set before
+            # WAL mode and tables creation to take effect on new databases
+            self._local.conn.execute("PRAGMA auto_vacuum=INCREMENTAL")
             self._local.conn.execute("PRAGMA journal_mode=WAL")
             self._local.conn.execute("PRAGMA synchronous=NORMAL")
             # performance PRagmas
@@ -774,9 +786,14 @@ class JobDatabase:
                     started_timestamp TEXT,
                     completed_timestamp TEXT,
                     result_data BLOB,
+                    priority INTEGER DEFAULT 0,
                     created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
                 )
             """)
+            # add columns missing in databases created by older versions
+            columns = [row["name"] for row in conn.execute("PRAGMA table_info(jobs)")]
+            if "priority" not in columns:
+                conn.execute("ALTER TABLE jobs ADD COLUMN priority INTEGER DEFAULT 0")
 
             # Events table
             conn.execute("""
@@ -820,6 +837,7 @@ class JobDatabase:
         kwargs: dict,
         timeout: int,
         timestamp: str,
+        priority: int = 0,
     ) -> None:
         """
         Add a new job to the database.
@@ -832,6 +850,7 @@ class JobDatabase:
             kwargs (dict): Task keyword arguments.
             timeout (int): Job timeout.
             timestamp (str): Received timestamp.
+            priority (int): Job priority, higher priority jobs run first.
         """
         now = time.strftime("%Y-%m-%d %H:%M:%S")
         with self._transaction(write=True) as conn:
@@ -842,8 +861,8 @@ class JobDatabase:
             conn.execute(
                 """
                 INSERT INTO jobs (uuid, client_address, task, args, kwargs, timeout,
-                                 status, received_timestamp, created_at)
-                VALUES (?, ?, ?, ?, ?, ?, 'PENDING', ?, ?)
+                                 status, received_timestamp, priority, created_at)
+                VALUES (?, ?, ?, ?, ?, ?, 'PENDING', ?, ?, ?)
             """,
                 (
                     uuid,
@@ -853,6 +872,7 @@ class JobDatabase:
                     compressed_kwargs,
                     timeout,
                     timestamp,
+                    priority,
                     now,
                 ),
             )
@@ -885,6 +905,42 @@ class JobDatabase:
                 return uuid, row["received_timestamp"]
             return None
 
+    def get_pending_jobs(self) -> list:
+        """
+        Get all pending jobs, oldest first.
+
+        Returns:
+            list: List of dictionaries with pending jobs ``uuid``,
+                ``client_address`` and ``priority``.
+        """
+        with self._transaction(write=False) as conn:
+            cursor = conn.execute("""
+                SELECT uuid, client_address, priority FROM jobs
+                WHERE status = 'PENDING'
+                ORDER BY created_at ASC
+            """)
+            return [dict(row) for row in cursor.fetchall()]
+
+    def claim_job(self, uuid: str) -> bool:
+        """
+        Mark pending job as STARTED.
+
+        Args:
+            uuid (str): Job UUID.
+
+        Returns:
+            bool: True if job was pending and now marked as started, False otherwise.
+        """
+        with self._transaction(write=True) as conn:
+            cursor = conn.execute(
+                """
+                UPDATE jobs SET status = 'STARTED', started_timestamp = ?
+                WHERE uuid = ? AND status = 'PENDING'
+            """,
+                (time.ctime(), uuid),
+            )
+            return cursor.rowcount == 1
+
     def complete_job(self, uuid: str, result_data: dict) -> None:
         """
         Mark a job as completed and store its result.
@@ -1051,6 +1107,32 @@ class JobDatabase:
                 ),
             )
 
+    def add_events(self, events: List[dict]) -> None:
+        """
+        Add events for one or more jobs using single transaction.
+
+        Args:
+            events (list): List of event dictionaries, each must contain
+                ``juuid``, ``message`` and ``task`` keys.
+        """
+        with self._transaction(write=True) as conn:
+            conn.executemany(
+                """
+                INSERT INTO events (job_uuid, message, severity, task, event_data)
+                VALUES (?, ?, ?, ?, ?)
+            """,
+                [
+                    (
+                        e["juuid"],
+                        e["message"],
+                        e.get("severity", "INFO"),
+                        e["task"],
+                        orjson.dumps(e).decode("utf-8"),
+                    )
+                    for e in events
+                ],
+            )
+
     def get_job_events(self, uuid: str) -> list:
         """
         Get all events for a job.
@@ -1144,6 +1226,61 @@ class JobDatabase:
             cursor = conn.execute(query, params)
             return [dict(row) for row in cursor.fetchall()]
 
+    def apply_retention(
+        self,
+        max_age: int = None,
+        max_count: int = None,
+        max_size: int = None,
+        archive: JobsArchive = None,
+        batch_size: int = 500,
+    ) -> dict:
+        """
+        Delete completed and failed jobs that exceed retention limits.
+
+        Args:
+            max_age (int): Maximum job age in seconds.
+            max_count (int): Maximum number of completed and failed jobs to keep.
+            max_size (int): Maximum total size of jobs data in bytes.
+            archive (JobsArchive): If provided, archive jobs before deleting them.
+            batch_size (int): Number of jobs to archive and delete per transaction.
+
+        Returns:
+            dict: Number of ``deleted_jobs`` and ``archived_jobs``.
+        """
+        ret = {"deleted_jobs": 0, "archived_jobs": 0}
+        with self._transaction(write=False) as conn:
+            expired = select_expired_jobs(
+                conn,
+                ["COMPLETED", "FAILED"],
+                max_age=max_age,
+                max_count=max_count,
+                max_size=max_size,
+            )
+        for i in range(0, len(expired), batch_size):
+            batch = expired[i : i + batch_size]
+            if archive is not None:
+                records = [
+                    self.get_job_info(uuid, include_result=True, include_events=True)
+                    for uuid in batch
+                ]
+                ret["archived_jobs"] += archive.write([r for r in records if r])
+            with self._transaction(write=True) as conn:
+                ret["deleted_jobs"] += delete_jobs(conn, batch)
+        return ret
+
+    def compact(self, vacuum_pages: int = None) -> dict:
+        """
+        Checkpoint WAL file and release free pages of deleted jobs.
+
+        Args:
+            vacuum_pages (int): Maximum number of free pages to release, all if None.
+
+        Returns:
+            dict: Database size before and after compaction.
+        """
+        with self._lock:
+            return compact_database(self._get_connection(), self.db_path, vacuum_pages)
+
     def close(self) -> None:
         """Close all database connections."""
         if hasattr(self._local, "conn"):
@@ -1156,6 +1293,184 @@ class JobDatabase:
 # --------------------------------------------------------------------------------------------
 
 
+class FairJobQueue:
+    """
+    Thread-safe queue of jobs ready to run with priorities and per-client fairness.
+
+    Jobs queued per client address, within each client queue jobs ordered by
+    priority, higher priority first, and by arrival order. Clients served using
+    start-time weighted fair queuing - next job taken from the client with the
+    smallest virtual start time and each job advances its client virtual time by
+    ``1 / (1 + priority)``. As a result a client that queued thousands of jobs
+    can not starve other clients, while higher priority jobs get a larger share
+    of job execution slots.
+    """
+
+    def __init__(self) -> None:
+        self._condition = threading.Condition()
+        self._clients = {}  # client address -> heap of (-priority, seq, uuid)
+        self._finish = {}  # client address -> virtual finish time
+        self._virtual_time = 0.0
+        self._sequence = itertools.count()
+        self._size = 0
+
+    def put(self, uuid: str, client_address: str, priority: int = 0) -> None:
+        """
+        Add job to the queue.
+
+        Args:
+            uuid (str): Job UUID.
+            client_address (str): Address of the client that submitted the job.
+            priority (int): Job priority, higher priority jobs run first.
+        """
+        with self._condition:
+            heapq.heappush(
+                self._clients.setdefault(client_address, []),
+                (-priority, next(self._sequence), uuid),
+            )
+            self._size += 1
+            self._condition.notify()
+
+    def get(self, timeout: float = None) -> str:
+        """
+        Remove and return next job UUID to run.
+
+        Args:
+            timeout (float): Seconds to wait for a job to become available.
+
+        Returns:
+            str: Job UUID.
+
+        Raises:
+            queue.Empty: If no jobs available within timeout.
+        """
+        with self._condition:
+            if not self._size and not self._condition.wait_for(
+                lambda: self._size, timeout
+            ):
+                raise queue.Empty
+
+            client_address = min(
+                self._clients,
+                key=lambda c: max(self._virtual_time, self._finish.get(c, 0)),
+            )
+            start = max(self._virtual_time, self._finish.get(client_address, 0))
+            jobs = self._clients[client_address]
+            priority, _, uuid = heapq.heappop(jobs)
+            if not jobs:
+                del self._clients[client_address]
+            self._finish[client_address] = start + 1 / (1 + max(0, -priority))
+            self._virtual_time = start
+            self._size -= 1
+
+            # forget idle clients that have no virtual time advantage left
+            for client in [
+                c
+                for c, finish in self._finish.items()
+                if finish <= self._virtual_time and c not in self._clients
+            ]:
+                del self._finish[client]
+
+            return uuid
+
+    def qsize(self) -> int:
+        """Return number of queued jobs."""
+        return self._size
+
+
+class JobEventsRateLimiter:
+    """
+    Per-job progress events rate limiter that coalesces excess events.
+
+    Each job gets a token bucket refilled at ``rate`` tokens per second with
+    capacity of ``rate`` tokens. Progress events emitted while job has no
+    tokens left are not dropped but coalesced - only the most recent one kept
+    pending and emitted once job has a token again, with ``extras.coalesced``
+    set to the number of events it replaced. Events other than running
+    progress events at INFO or DEBUG severity are never coalesced and flush
+    job pending event first to preserve events order.
+
+    Not thread-safe, intended to be used by worker events thread only.
+
+    Args:
+        rate (float): Maximum number of progress events per second per job,
+            0 to disable rate limiting.
+    """
+
+    def __init__(self, rate: float = 0) -> None:
+        self.rate = rate
+        self._jobs = {}  # juuid -> [tokens, last refill time, pending, coalesced]
+
+    @staticmethod
+    def coalescable(event: dict) -> bool:
+        return (
+            event.get("event_type", "progress") == "progress"
+            and event.get("status", "running") == "running"
+            and event.get("severity", "INFO") in ("INFO", "DEBUG")
+        )
+
+    def _refill(self, state: list, now: float) -> None:
+        state[0] = min(self.rate, state[0] + (now - state[1]) * self.rate)
+        state[1] = now
+
+    @staticmethod
+    def _pending(state: list) -> list:
+        event, coalesced = state[2], state[3]
+        state[2], state[3] = None, 0
+        if event is None:
+            return []
+        if coalesced:
+            event["extras"] = {**(event.get("extras") or {}), "coalesced": coalesced}
+        return [event]
+
+    def add(self, event: dict, now: float = None) -> List[dict]:
+        """
+        Add event and return list of events to emit now.
+
+        Args:
+            event (dict): Event dictionary with ``juuid`` key.
+            now (float): Current time, defaults to ``time.monotonic()``.
+        """
+        if not self.rate:
+            return [event]
+        now = time.monotonic() if now is None else now
+        state = self._jobs.setdefault(event["juuid"], [self.rate, now, None, 0])
+        self._refill(state, now)
+        if not self.coalescable(event):
+            return self._pending(state) + [event]
+        if state[0] >= 1 and state[2] is None:
+            state[0] -= 1
+            return [event]
+        # coalesce with pending event
+        state[3] += 1 if state[2] is not None else 0
+        state[2] = event
+        return []
+
+    def flush(self, juuid: str = None, now: float = None) -> List[dict]:
+        """
+        Return pending events that are due to be emitted.
+
+        Args:
+            juuid (str): If provided, return this job pending event regardless
+                of available tokens and forget job rate limiting state.
+            now (float): Current time, defaults to ``time.monotonic()``.
+        """
+        if juuid is not None:
+            state = self._jobs.pop(juuid, None)
+            return self._pending(state) if state else []
+        ret = []
+        now = time.monotonic() if now is None else now
+        for job_uuid, state in list(self._jobs.items()):
+            self._refill(state, now)
+            if state[2] is not None and state[0] >= 1:
+                state[0] -= 1
+                ret.extend(self._pending(state))
+            # forget idle jobs
+            elif state[2] is None and state[0] >= self.rate:
+                del self._jobs[job_uuid]
+        return ret
+
+
 class WorkerWatchDog(threading.Thread):
     """
     Class to monitor worker performance.
@@ -1348,6 +1663,8 @@ def _post(worker, post_queue, destroy_event) -> None:
         - Continuously processes POST requests from the queue until the destroy event is set.
         - Saves the request to the database.
         - Sends an acknowledgment back to the client.
+        - Rejects the request with 429 status if worker jobs queue is full.
+        - Signals job UUID to the worker ready queue for execution.
     """
     while not destroy_event.is_set():
         try:
@@ -1364,6 +1681,45 @@ def _post(worker, post_queue, destroy_event) -> None:
         args = data.get("args", [])
         kwargs = data.get("kwargs", {})
         timeout = data.get("timeout", 60)
+        try:
+            priority = int(data.get("priority") or 0)
+        except (TypeError, ValueError):
+            log.warning(
+                f"{worker.name} - '{suuid.decode('utf-8')}' job invalid priority "
+                f"'{data.get('priority')}', using default priority 0"
+            )
+            priority = 0
+
+        # reject job if jobs queue is full
+        if (
+            worker.jobs_queue_max_depth
+            and worker.ready_queue.qsize() >= worker.jobs_queue_max_depth
+        ):
+            message = (
+                f"{worker.name} - jobs queue is full, "
+                f"max depth {worker.jobs_queue_max_depth}, try later"
+            )
+            log.warning(f"{message}, rejected job '{suuid.decode('utf-8')}'")
+            result = Result(
+                task=f"{worker.name}:{task}",
+                errors=[message],
+                failed=True,
+                status="skipped",
+                juuid=suuid.decode("utf-8"),
+                service=worker.service.decode("utf-8"),
+            )
+            worker.send_to_broker(
+                NFP.RESPONSE,
+                [
+                    client_address,
+                    b"",
+                    suuid,
+                    b"429",  # TOO MANY REQUESTS
+                    orjson.dumps({worker.name: result.model_dump()}),
+                ],
+            )
+            post_queue.task_done()
+            continue
 
         # Add job to database
         try:
@@ -1375,6 +1731,7 @@ def _post(worker, post_queue, destroy_event) -> None:
                 kwargs=kwargs,
                 timeout=timeout,
                 timestamp=timestamp,
+                priority=priority,
             )
             log.debug(
                 f"{worker.name} - '{suuid.decode('utf-8')}' job added to database"
@@ -1406,6 +1763,11 @@ def _post(worker, post_queue, destroy_event) -> None:
             f"{worker.name} - '{suuid.decode('utf-8')}' job, sent ACK back to client '{NFP.bytest_to_text(client_address)}'"
         )
 
+        # signal job is ready to run
+        worker.ready_queue.put(
+            suuid.decode("utf-8"), client_address.decode("utf-8"), priority
+        )
+
         post_queue.task_done()
 
 
@@ -1470,6 +1832,48 @@ def _get(worker, get_queue, destroy_event) -> None:
         get_queue.task_done()
 
 
+def emit_events(worker, events: List[dict]) -> None:
+    """
+    Save events to the worker jobs database using single transaction and
+    send them to clients packing consecutive events of the same job into
+    single EVENT message with a list of events as a payload.
+
+    Args:
+        worker (Worker): The worker instance that is emitting events.
+        events (list): List of event dictionaries.
+    """
+    if not events:
+        return
+    try:
+        worker.db.add_events(events)
+    except Exception as e:
+        log.error(f"{worker.name} - failed to save events to database: {e}")
+
+    service = worker.service.decode("utf-8")
+    for juuid, job_events in itertools.groupby(events, key=lambda e: e["juuid"]):
+        job_events = list(job_events)
+        client_address = job_events[0]["client_address"]
+        payload = [
+            {
+                "worker": worker.name,
+                "service": service,
+                "uuid": juuid,
+                **{k: v for k, v in e.items() if k not in ("juuid", "client_address")},
+            }
+            for e in job_events
+        ]
+        worker.send_to_broker(
+            NFP.EVENT,
+            [
+                client_address.encode("utf-8"),
+                b"",
+                juuid.encode("utf-8"),
+                b"200",
+                orjson.dumps(payload[0] if len(payload) == 1 else payload),
+            ],
+        )
+
+
 def _event(worker, event_queue, destroy_event) -> None:
     """
     Thread function to emit events to Clients.
@@ -1479,31 +1883,39 @@ def _event(worker, event_queue, destroy_event) -> None:
         event_queue (queue.Queue): The queue from which events are retrieved.
         destroy_event (threading.Event): An event to signal the thread to stop.
 
-    The function continuously retrieves events from the event_queue, processes them,
-    and sends them to the broker until the destroy_event is set.
+    The function continuously retrieves events from the event_queue, drains up
+    to ``worker.events_batch_size`` queued events at a time, rate limits them
+    per job and emits them in batches until the destroy_event is set.
+
+    Job results pushed by ``run_next_job`` travel through the same queue so that
+    client receives job RESPONSE only after all preceding job events.
     """
+    limiter = JobEventsRateLimiter(worker.events_rate_limit)
     while not destroy_event.is_set():
+        items = []
         try:
-            event_data = event_queue.get(block=True, timeout=0.1)
+            items.append(event_queue.get(block=True, timeout=0.1))
+            while len(items) < worker.events_batch_size:
+                items.append(event_queue.get_nowait())
         except queue.Empty:
-            continue
-        uuid = event_data.pop("juuid")
-        event = [
-            event_data.pop("client_address").encode("utf-8"),
-            b"",
-            uuid.encode("utf-8"),
-            b"200",
-            orjson.dumps(
-                {
-                    "worker": worker.name,
-                    "service": worker.service.decode("utf-8"),
-                    "uuid": uuid,
-                    **event_data,
-                }
-            ),
-        ]
-        worker.send_to_broker(NFP.EVENT, event)
-        event_queue.task_done()
+            pass
+
+        events = []
+        for item in items:
+            # push job results to the client after job events
+            if "response" in item:
+                juuid = item["response"][2].decode("utf-8")
+                events.extend(limiter.flush(juuid))
+                emit_events(worker, events)
+                events = []
+                worker.send_to_broker(NFP.RESPONSE, item["response"])
+            else:
+                events.extend(limiter.add(item))
+        events.extend(limiter.flush())
+        emit_events(worker, events)
+
+        for _ in items:
+            event_queue.task_done()
 
 
 def recv(worker, destroy_event) -> None:
@@ -1536,7 +1948,8 @@ def recv(worker, destroy_event) -> None:
         if items:
             with worker.socket_lock:
                 msg = worker.broker_socket.recv_multipart()
-            log.debug(f"{worker.name} - received '{msg}'")
+            if log.isEnabledFor(logging.DEBUG):
+                log.debug(f"{worker.name} - received '{msg}'")
             empty = msg.pop(0)  # noqa
             header = msg.pop(0)
             command = msg.pop(0)
@@ -1600,6 +2013,12 @@ class NFPWorker:
         self.setup_logging(log_level)
         self.max_concurrent_jobs = max(1, inventory.get("max_concurrent_jobs", 5))
         self.jobs_compress = inventory.get("jobs_compress", True)
+        self.jobs_push_results = inventory.get("jobs_push_results", True)
+        self.jobs_push_max_bytes = inventory.get("jobs_push_max_bytes", 10000000)
+        self.jobs_queue_max_depth = inventory.get("jobs_queue_max_depth", 0)
+        self.jobs_retention = inventory.get("jobs_retention") or {}
+        self.events_batch_size = max(1, inventory.get("events_batch_size", 100))
+        self.events_rate_limit = inventory.get("events_rate_limit", 0)
         self.autostart_watchdog = inventory.get("autostart_watchdog", True)
         self.broker = broker
         self.service = service.encode("utf-8") if isinstance(service, str) else service
@@ -1622,6 +2041,21 @@ class NFPWorker:
         # Initialize SQLite database for job management
         db_path = os.path.join(self.base_dir, f"{self.name}.db")
         self.db = JobDatabase(db_path, jobs_compress=self.jobs_compress)
+        self.jobs_archive = JobsArchive(
+            directory=os.path.join(self.base_dir, "jobs_archive"),
+            prefix=self.name,
+            segment_size=self.jobs_retention.get("archive_segment_size", 50000000),
+            max_segments=self.jobs_retention.get("archive_max_segments", 10),
+        )
+        self.jobs_retention_run_at = 0
+        self.jinja2_templates = Jinja2Templates(
+            cache_size=inventory.get("jinja2_cache_size", 1000),
+            bytecode_cache_dir=(
+                os.path.join(self.base_dir, "jinja2_bytecode_cache")
+                if inventory.get("jinja2_bytecode_cache", False)
+                else None
+            ),
+        )
 
         # dictionary to store currently running jobs
         self.running_jobs = {}
@@ -1642,6 +2076,7 @@ class NFPWorker:
         self.delete_queue = queue.Queue(maxsize=0)
         self.event_queue = queue.Queue(maxsize=0)
         self.put_queue = queue.Queue(maxsize=0)
+        self.ready_queue = FairJobQueue()  # jobs ready to run
 
         # generate certificates and create directories
         if self.zmq_auth is not False:
@@ -1676,6 +2111,8 @@ class NFPWorker:
         # initiate watchdog
         if self.autostart_watchdog:
             self.watchdog = WorkerWatchDog(self)
+            if self.jobs_retention:
+                self.watchdog.watchdog_tasks.append(self.run_jobs_retention)
             self.watchdog.start()
 
     def setup_logging(self, log_level: str = None) -> dict:
@@ -1805,10 +2242,15 @@ class NFPWorker:
             )
             return
 
-        log.debug(f"{self.name} - sending '{msg}'")
+        # do not format stream data chunks into log messages
+        if command == NFP.STREAM:
+            log.debug(f"{self.name} - sending stream chunk, {len(msg[-1])} bytes")
+        else:
+            log.debug(f"{self.name} - sending '{msg}'")
 
+        # send stream data chunks without copying them
         with self.socket_lock:
-            self.broker_socket.send_multipart(msg)
+            self.broker_socket.send_multipart(msg, copy=command != NFP.STREAM)
 
     def load_inventory(self) -> dict:
         """
@@ -1934,7 +2376,11 @@ class NFPWorker:
         return any(str(url).startswith(k) for k in ["nf://"])
 
     def fetch_file(
-        self, url: str, raise_on_fail: bool = False, read: bool = True
+        self,
+        url: str,
+        raise_on_fail: bool = False,
+        read: bool = True,
+        file_details: dict = None,
     ) -> str:
         """
         Function to download file from broker File Sharing Service
@@ -1943,6 +2389,8 @@ class NFPWorker:
             url: file location string in ``nf://<filepath>`` format
             raise_on_fail: raise FIleNotFoundError if download fails
             read: if True returns file content, return OS path to saved file otherwise
+            file_details: file details from files manifest, used to skip file
+                details lookup
 
         Returns:
             str: File content if read is True, otherwise OS path to the saved file.
@@ -1953,7 +2401,7 @@ class NFPWorker:
         if not self.is_url(url):
             raise ValueError(f"Invalid URL format: {url}")
 
-        result = self.client.fetch_file(url=url, read=read)
+        result = self.client.fetch_file(url=url, read=read, file_details=file_details)
         status = result["status"]
         file_content = result["content"]
         msg = f"{self.name} - worker '{url}' fetch file failed with status '{status}'"
@@ -1981,7 +2429,9 @@ class NFPWorker:
             context (dict): A dictionary containing the context variables for rendering the templates.
             filters (dict, optional): A dictionary of custom Jinja2 filters to be used during rendering.
             template_cache (dict, optional): Cache of compiled Jinja2 file templates
-                keyed by resolved NorFab file URL.
+                keyed by resolved NorFab file URL, used to download file templates
+                once per job, compiled templates shared across jobs using worker
+                ``jinja2_templates`` cache.
 
         Returns:
             str: The rendered templates concatenated into a single string.
@@ -1992,19 +2442,16 @@ class NFPWorker:
         template_cache = template_cache if template_cache is not None else {}
         for template in templates:
             if any(marker in template for marker in ("{{", "{%", "{#")):
-                j2env = Environment(loader="BaseLoader")
-                j2env.filters.update(filters)  # add custom filters
-                renderer = j2env.from_string(template)
+                renderer = self.jinja2_templates.from_string(template, filters)
                 template = renderer.render(**context)
             # download template file and render it again
             if template.startswith("nf://"):
                 renderer = template_cache.get(template)
                 if renderer is None:
                     filepath = self.jinja2_fetch_template(template)
-                    searchpath, filename = os.path.split(filepath)
-                    j2env = Environment(loader=FileSystemLoader(searchpath))
-                    j2env.filters.update(filters)  # add custom filters
-                    renderer = j2env.get_template(filename)
+                    renderer = self.jinja2_templates.get_template(
+                        filepath, self.client.local_file_md5(filepath), filters
+                    )
                     template_cache[template] = renderer
                 rendered.append(renderer.render(**context))
             # template content is fully rendered
@@ -2036,7 +2483,7 @@ class NFPWorker:
         # load Jinja2 template content to parse "include"-ed files
         with open(filepath, "r", encoding="utf-8") as f:
             content = f.read()
-        j2env = Environment(loader="BaseLoader")
+        _, j2env = self.jinja2_templates.environment()
         try:
             parsed_content = j2env.parse(content)
         except Exception as e:
@@ -2063,7 +2510,8 @@ class NFPWorker:
         Handles the creation and emission of an event.
 
         This method takes event data, processes it, and sends it to the event queue.
-        It also saves the event data to the database for future reference.
+        Events thread saves queued events to the database in batches for future
+        reference and sends them to the client.
 
         Args:
             message: The event message
@@ -2108,18 +2556,6 @@ class NFPWorker:
             elif severity == "ERROR":
                 log.error(event_log)
 
-        # save event to database
-        try:
-            self.db.add_event(
-                job_uuid=juuid,
-                message=message,
-                severity=event_dict.get("severity", "INFO"),
-                task=task,
-                event_data=event_dict,
-            )
-        except Exception as e:
-            log.error(f"Failed to save event to database: {e}")
-
     @Task(fastapi={"methods": ["GET"]}, agent={"enabled": False})
     def job_details(
         self,
@@ -2199,6 +2635,63 @@ class NFPWorker:
             result=jobs,
         )
 
+    def run_jobs_retention(self) -> None:
+        """
+        Watchdog task to apply jobs database retention policy and compact
+        database every ``jobs_retention.interval`` seconds.
+        """
+        if time.time() < self.jobs_retention_run_at:
+            return
+        self.jobs_retention_run_at = time.time() + self.jobs_retention.get(
+            "interval", 3600
+        )
+        try:
+            ret = self.job_db_compact().result
+            log.info(f"{self.name} - jobs database retention applied: {ret}")
+        except Exception as e:
+            log.error(
+                f"{self.name} - failed to apply jobs database retention: {e}",
+                exc_info=True,
+            )
+
+    @Task(fastapi={"methods": ["POST"]}, agent={"enabled": False})
+    def job_db_compact(
+        self,
+        max_age: int = None,
+        max_count: int = None,
+        max_size: int = None,
+        archive: bool = None,
+        vacuum: bool = True,
+    ) -> Result:
+        """
+        Method to delete completed and failed jobs that exceed retention limits,
+        optionally archiving them, and to compact worker jobs database.
+
+        Arguments default to worker inventory ``jobs_retention`` settings.
+
+        Args:
+            max_age (int, optional): Delete jobs older than this number of seconds.
+            max_count (int, optional): Keep only this number of newest jobs.
+            max_size (int, optional): Keep newest jobs with total data size within this number of bytes.
+            archive (bool, optional): If True, archive jobs to compressed JSONL files before deleting them.
+            vacuum (bool, optional): If True, release free database pages to the file system.
+
+        Returns:
+            Result: Result object with number of deleted and archived jobs and database size.
+        """
+        retention = self.jobs_retention
+        archive = retention.get("archive", False) if archive is None else archive
+        ret = self.db.apply_retention(
+            max_age=max_age or retention.get("max_age"),
+            max_count=max_count or retention.get("max_count"),
+            max_size=max_size or retention.get("max_size"),
+            archive=self.jobs_archive if archive else None,
+        )
+        if vacuum:
+            ret.update(self.db.compact(retention.get("vacuum_pages")))
+
+        return Result(task=f"{self.name}:job_db_compact", result=ret)
+
     @Task(fastapi={"methods": ["GET"]}, agent={"enabled": False})
     def get_logs(
         self,
@@ -2569,42 +3062,111 @@ class NFPWorker:
         # inform client that job completed
         job.event(message="completed", status="completed")
 
+        # push job results to the client
+        if self.jobs_push_results:
+            self.push_job_result(uuid, client_address, result_data)
+
+    def push_job_result(
+        self, uuid: str, client_address: str, result_data: dict
+    ) -> None:
+        """
+        Push completed job results to the client, sparing client from GET polling.
+
+        Results larger than ``jobs_push_max_bytes`` are not pushed, instead client
+        receives a small ``303`` RESULT READY notice and retrieves results using
+        GET request. Results pushed via event queue to preserve ordering with job
+        events.
+
+        Args:
+            uuid (str): The job UUID.
+            client_address (str): Address of the client that submitted the job.
+            result_data (dict): Job result data as saved in the database.
+        """
+        try:
+            payload = orjson.dumps(result_data["result"])
+            status = result_data.get("status_code", "200").encode("utf-8")
+        except Exception as e:
+            log.error(f"{self.name} - failed to serialize job {uuid} results: {e}")
+            return
+
+        if len(payload) > self.jobs_push_max_bytes:
+            status = b"303"  # RESULT READY
+            payload = orjson.dumps(
+                {
+                    "worker": self.name,
+                    "uuid": uuid,
+                    "status": "RESULT READY",
+                    "service": self.service.decode("utf-8"),
+                    "size_bytes": len(payload),
+                }
+            )
+
+        self.event_queue.put(
+            {
+                "response": [
+                    client_address.encode("utf-8"),
+                    b"",
+                    uuid.encode("utf-8"),
+                    status,
+                    payload,
+                ]
+            }
+        )
+
     def work(self) -> None:
         """
         Executes the main worker loop, managing job execution using a thread pool.
 
-        This method starts necessary background threads, then enters a loop where it:
+        This method queues pending jobs left in the database, starts necessary
+        background threads, then enters a loop where it:
 
-        - Queries the database for the next pending job.
+        - Waits for a free executor slot.
+        - Waits for the next job signalled by the POST thread in the ready queue,
+          jobs taken by priority and fairly across clients.
         - Atomically marks the job as started in the database.
         - Submits the job to a thread pool executor for concurrent processing.
-        - Waits briefly if no pending jobs are found.
         - Continues until either the exit or destroy event is set.
 
+        Database serves as a durable jobs log, jobs only marked as started once
+        there is an executor slot available to run them.
+
         Upon exit, performs cleanup by calling the `destroy` method with a status message.
         """
+        # queue jobs that were pending before worker restart
+        for job in self.db.get_pending_jobs():
+            self.ready_queue.put(job["uuid"], job["client_address"], job["priority"])
 
         self.start_threads()
 
+        job_slots = threading.BoundedSemaphore(self.max_concurrent_jobs)
+
         # start job threads and submit jobs in an infinite loop
         with concurrent.futures.ThreadPoolExecutor(
             max_workers=self.max_concurrent_jobs,
             thread_name_prefix=f"{self.name}-job-thread",
         ) as executor:
             while not self.exit_event.is_set() and not self.destroy_event.is_set():
-                # Get next pending job from database
-                job_info = self.db.get_next_pending_job()
+                # wait for free executor slot
+                if not job_slots.acquire(timeout=0.1):
+                    continue
+
+                # wait for next job to run
+                try:
+                    uuid = self.ready_queue.get(timeout=0.1)
+                except queue.Empty:
+                    job_slots.release()
+                    continue
 
-                if job_info is None:
-                    # No pending jobs, wait a bit
-                    time.sleep(0.1)
+                if not self.db.claim_job(uuid):
+                    log.warning(f"{self.name} - job {uuid} is not pending, skipping")
+                    job_slots.release()
                     continue
 
-                uuid, received_timestamp = job_info
                 log.debug(f"{self.name} - submitting job {uuid} to executor")
 
                 # Submit the job to workers
-                executor.submit(self.run_next_job, uuid)
+                future = executor.submit(self.run_next_job, uuid)
+                future.add_done_callback(lambda f: job_slots.release())
 
         # make sure to clean up
         self.destroy(
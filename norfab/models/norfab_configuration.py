@@ -1,4 +1,4 @@
-from typing import Any, Dict, List, Union
+from typing import Any, Dict, List, Literal, Union
 
 from picle.models import ConfigModel
 from pydantic import (
@@ -134,9 +134,46 @@ class AgentProfile(BaseModel):
     )
 
 
+class JobsRetentionConfig(BaseModel):
+    """Jobs database retention, archival and compaction configuration."""
+
+    max_age: StrictInt = Field(
+        None, description="Delete finished jobs older than this number of seconds"
+    )
+    max_count: StrictInt = Field(
+        None, description="Maximum number of finished jobs to keep"
+    )
+    max_size: StrictInt = Field(
+        None, description="Maximum total size of finished jobs data in bytes"
+    )
+    archive: StrictBool = Field(
+        None, description="Archive jobs to compressed JSONL files before deleting"
+    )
+    archive_segment_size: StrictInt = Field(
+        None, description="Archive segment file size in bytes to rotate at"
+    )
+    archive_max_segments: StrictInt = Field(
+        None, description="Maximum number of archive segment files to keep"
+    )
+    interval: StrictInt = Field(
+        None, description="Seconds between retention policy runs"
+    )
+    vacuum_pages: StrictInt = Field(
+        None, description="Maximum number of free pages to release per run"
+    )
+
+
 class ClientConfig(BaseModel):
     """NorFab client-side configuration."""
 
+    poll_interval: Union[StrictInt, StrictFloat] = Field(
+        None,
+        description="Seconds between fallback GET polls for the same job",
+    )
+    jobs_retention: JobsRetentionConfig = Field(
+        None, description="Client jobs database retention settings"
+    )
+
     agent_profiles: Dict[StrictStr, AgentProfile] = Field(
         None,
         description="Named agent profiles for NFPClient.get_agent()",
@@ -165,6 +202,14 @@ class BrokerConfig(BaseModel):
         description="Enable ZMQ CURVE authentication",
         json_schema_extra={"presence": True},
     )
+    mode: Literal["classic", "threaded"] = Field(
+        None,
+        description="Broker routing mode, threaded mode runs clients and workers routing in separate threads",
+    )
+    drain_batch: StrictInt = Field(
+        None,
+        description="Threaded mode maximum number of messages to drain per poll wakeup",
+    )
 
 
 # ------------------------------------------------------
@@ -299,6 +344,24 @@ class WorkerInventoryEntry(BaseModel):
     max_concurrent_jobs: StrictInt = Field(
         None, description="Maximum number of threads to run jobs"
     )
+    jobs_push_results: StrictBool = Field(
+        None, description="Push job results to the client on job completion"
+    )
+    jobs_push_max_bytes: StrictInt = Field(
+        None, description="Maximum size of job results to push to the client"
+    )
+    jobs_queue_max_depth: StrictInt = Field(
+        None, description="Maximum number of pending jobs, 0 for unlimited"
+    )
+    jobs_retention: JobsRetentionConfig = Field(
+        None, description="Worker jobs database retention settings"
+    )
+    events_batch_size: StrictInt = Field(
+        None, description="Maximum number of job events to save and send at once"
+    )
+    events_rate_limit: Union[StrictInt, StrictFloat] = Field(
+        None, description="Maximum progress events per second per job, 0 unlimited"
+    )
     autostart_watchdog: StrictBool = Field(
         None, description="Start watch dog on worker startup"
     )
@@ -0,0 +1,172 @@
+"""
+Jinja2 templates cache - worker lifetime Jinja2 environments and compiled
+templates shared across jobs.
+"""
+
+import hashlib
+import logging
+import os
+import threading
+from collections import OrderedDict
+from typing import Any, Union
+
+from jinja2 import Environment, FileSystemBytecodeCache, FileSystemLoader, Template
+
+log = logging.getLogger(__name__)
+
+
+class Jinja2Templates:
+    """
+    Worker lifetime cache of Jinja2 environments and compiled templates.
+
+    Environments created once per templates directory and custom filters
+    combination. Compiled templates kept in LRU cache keyed by template
+    content MD5 hash, templates compiled once and recompiled only if their
+    content changes. Templates included by file templates are loaded by
+    environment loader and reloaded once their files change.
+
+    Optional on-disk bytecode cache keeps compiled templates code across
+    worker restarts, cached code is validated against template source.
+
+    Args:
+        cache_size (int): Maximum number of compiled templates to keep.
+        bytecode_cache_dir (str): Directory to store templates bytecode in,
+            on-disk bytecode cache disabled if not provided.
+    """
+
+    max_environments = 64
+
+    def __init__(
+        self, cache_size: int = 1000, bytecode_cache_dir: Union[None, str] = None
+    ) -> None:
+        self.cache_size = max(1, cache_size)
+        self.lock = threading.Lock()
+        self.environments = OrderedDict()  # (searchpath, filters) -> Environment
+        self.templates = OrderedDict()  # (environment key, name, md5) -> Template
+        self.hits = 0
+        self.misses = 0
+        self.bytecode_cache = None
+        if bytecode_cache_dir:
+            os.makedirs(bytecode_cache_dir, exist_ok=True)
+            self.bytecode_cache = FileSystemBytecodeCache(bytecode_cache_dir)
+
+    def environment(
+        self, searchpath: Union[None, str] = None, filters: Union[None, dict] = None
+    ) -> tuple:
+        """
+        Return Jinja2 environment for given templates directory and filters.
+
+        Args:
+            searchpath (str): Templates directory, environment without loader
+                returned if not provided.
+            filters (dict): Custom Jinja2 filters.
+
+        Returns:
+            tuple: ``(key, environment)`` tuple.
+        """
+        key = (searchpath, frozenset((filters or {}).items()))
+        with self.lock:
+            environment = self.environments.get(key)
+            if environment is not None:
+                self.environments.move_to_end(key)
+                return key, environment
+
+            environment = Environment(
+                loader=FileSystemLoader(searchpath) if searchpath else None,
+                bytecode_cache=self.bytecode_cache,
+                cache_size=self.cache_size,
+            )
+            environment.filters.update(filters or {})
+            self.environments[key] = environment
+            while len(self.environments) > self.max_environments:
+                self.environments.popitem(last=False)
+
+        return key, environment
+
+    def _get(self, key: tuple) -> Union[None, Template]:
+        with self.lock:
+            template = self.templates.get(key)
+            if template is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+                self.templates.move_to_end(key)
+        return template
+
+    def _put(self, key: tuple, template: Template) -> None:
+        with self.lock:
+            self.templates[key] = template
+            while len(self.templates) > self.cache_size:
+                self.templates.popitem(last=False)
+
+    def from_string(self, source: str, filters: Union[None, dict] = None) -> Template:
+        """
+        Return compiled template for given template content.
+
+        Args:
+            source (str): Jinja2 template content.
+            filters (dict): Custom Jinja2 filters.
+
+        Returns:
+            Compiled Jinja2 template.
+        """
+        env_key, environment = self.environment(filters=filters)
+        md5hash = hashlib.md5(source.encode("utf-8")).hexdigest()
+        key = (env_key, None, md5hash)
+        template = self._get(key)
+        if template is None:
+            if self.bytecode_cache is not None:
+                bucket = self.bytecode_cache.get_bucket(
+                    environment, md5hash, None, source
+                )
+                if bucket.code is None:
+                    bucket.code = environment.compile(source)
+                    self.bytecode_cache.set_bucket(bucket)
+                template = environment.template_class.from_code(
+                    environment, bucket.code, environment.make_globals(None)
+                )
+            else:
+                template = environment.from_string(source)
+            self._put(key, template)
+        return template
+
+    def get_template(
+        self,
+        filepath: str,
+        md5hash: Union[None, str] = None,
+        filters: Union[None, dict] = None,
+    ) -> Template:
+        """
+        Return compiled template for given template file.
+
+        Args:
+            filepath (str): Template file path, file directory used to load
+                included templates from.
+            md5hash (str): Template file content MD5 hash, calculated if
+                not provided.
+            filters (dict): Custom Jinja2 filters.
+
+        Returns:
+            Compiled Jinja2 template.
+        """
+        searchpath, filename = os.path.split(filepath)
+        if md5hash is None:
+            with open(filepath, "rb") as f:
+                md5hash = hashlib.md5(f.read()).hexdigest()
+        env_key, environment = self.environment(searchpath, filters)
+        key = (env_key, filename, md5hash)
+        template = self._get(key)
+        if template is None:
+            template = environment.get_template(filename)
+            self._put(key, template)
+        return template
+
+    def stats(self) -> dict[str, Any]:
+        """Return cache statistics"""
+        with self.lock:
+            return {
+                "environments": len(self.environments),
+                "templates": len(self.templates),
+                "hits": self.hits,
+                "misses": self.misses,
+            }
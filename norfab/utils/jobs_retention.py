@@ -0,0 +1,239 @@
+"""
+Collection of jobs databases retention utils shared by worker and client
+jobs databases - expired jobs selection, archival and database compaction.
+"""
+
+import glob
+import gzip
+import logging
+import os
+import re
+import sqlite3
+import time
+from typing import List
+
+import orjson
+
+log = logging.getLogger(__name__)
+
+SEGMENT_RE = re.compile(r"-(\d+)\.jsonl\.gz$")
+
+
+class JobsArchive:
+    """
+    Archive of jobs stored in rotating gzip compressed JSONL segment files.
+
+    Each archived job written as a single JSON line into the current segment
+    file ``<prefix>-<index>.jsonl.gz``. Once segment file size reaches
+    ``segment_size`` bytes, next segment file started, and oldest segments
+    deleted to keep at most ``max_segments`` files. Archive directory created
+    once first records written.
+
+    Args:
+        directory (str): Directory to store archive segment files in.
+        prefix (str): Segment file names prefix.
+        segment_size (int): Segment file size in bytes to rotate at.
+        max_segments (int): Maximum number of segment files to keep, 0 for unlimited.
+    """
+
+    def __init__(
+        self,
+        directory: str,
+        prefix: str = "jobs",
+        segment_size: int = 50000000,
+        max_segments: int = 10,
+    ) -> None:
+        self.directory = directory
+        self.prefix = prefix
+        self.segment_size = segment_size
+        self.max_segments = max_segments
+
+    def segments(self) -> List[str]:
+        """Return archive segment files paths sorted from oldest to newest."""
+        files = glob.glob(os.path.join(self.directory, f"{self.prefix}-*.jsonl.gz"))
+        return sorted(
+            [f for f in files if SEGMENT_RE.search(f)],
+            key=lambda f: int(SEGMENT_RE.search(f).group(1)),
+        )
+
+    def current_segment(self) -> str:
+        """Return path to the segment file to write next records into."""
+        segments = self.segments()
+        if not segments:
+            index = 1
+        else:
+            index = int(SEGMENT_RE.search(segments[-1]).group(1))
+            if os.path.getsize(segments[-1]) >= self.segment_size:
+                index += 1
+        return os.path.join(self.directory, f"{self.prefix}-{index:06d}.jsonl.gz")
+
+    def write(self, records: List[dict]) -> int:
+        """
+        Append records to the archive and rotate segments.
+
+        Args:
+            records (list): List of JSON serializable job dictionaries.
+
+        Returns:
+            int: Number of records written.
+        """
+        if not records:
+            return 0
+        os.makedirs(self.directory, exist_ok=True)
+        with gzip.open(self.current_segment(), "ab") as f:
+            for record in records:
+                f.write(orjson.dumps(record, default=str) + b"\n")
+        # remove oldest segments
+        if self.max_segments:
+            for segment in self.segments()[: -self.max_segments]:
+                os.remove(segment)
+        return len(records)
+
+
+def select_expired_jobs(
+    conn: sqlite3.Connection,
+    statuses: List[str],
+    max_age: int = None,
+    max_count: int = None,
+    max_size: int = None,
+    results_table: str = None,
+) -> List[str]:
+    """
+    Select UUIDs of finished jobs that exceed retention limits.
+
+    Only jobs in one of ``statuses`` are considered. Job is expired if it is
+    older than ``max_age`` seconds, if it is not within ``max_count`` newest
+    jobs, or if total size of newer jobs payloads exceeds ``max_size`` bytes.
+
+    Args:
+        conn (sqlite3.Connection): Jobs database connection.
+        statuses (list): List of finished jobs statuses.
+        max_age (int): Maximum job age in seconds.
+        max_count (int): Maximum number of jobs to keep.
+        max_size (int): Maximum total size of jobs args, kwargs and results in bytes.
+        results_table (str): Name of the table with per-worker jobs results to
+            account for in jobs size.
+
+    Returns:
+        list: Expired jobs UUIDs, oldest first.
+    """
+    expired = set()
+    placeholders = ",".join(["?"] * len(statuses))
+
+    if max_age:
+        cutoff = time.strftime(
+            "%Y-%m-%d %H:%M:%S", time.localtime(time.time() - max_age)
+        )
+        cur = conn.execute(
+            f"SELECT uuid FROM jobs WHERE status IN ({placeholders}) AND created_at < ?",
+            (*statuses, cutoff),
+        )
+        expired.update(row[0] for row in cur.fetchall())
+
+    if max_count:
+        cur = conn.execute(
+            f"""
+            SELECT uuid FROM jobs WHERE status IN ({placeholders})
+            ORDER BY created_at DESC, rowid DESC LIMIT -1 OFFSET ?
+            """,
+            (*statuses, max_count),
+        )
+        expired.update(row[0] for row in cur.fetchall())
+
+    if max_size:
+        results_size = (
+            f"""+ IFNULL((SELECT SUM(LENGTH(r.result_data)) FROM {results_table} r
+                         WHERE r.job_uuid = jobs.uuid), 0)"""
+            if results_table
+            else ""
+        )
+        cur = conn.execute(
+            f"""
+            SELECT uuid, IFNULL(LENGTH(args), 0) + IFNULL(LENGTH(kwargs), 0) +
+                   IFNULL(LENGTH(result_data), 0) {results_size}
+            FROM jobs WHERE status IN ({placeholders})
+            ORDER BY created_at DESC, rowid DESC
+            """,
+            statuses,
+        )
+        total = 0
+        for uuid, size in cur.fetchall():
+            total += size
+            if total > max_size:
+                expired.add(uuid)
+
+    if not expired:
+        return []
+
+    # order expired jobs oldest first
+    cur = conn.execute(
+        f"""
+        SELECT uuid FROM jobs WHERE status IN ({placeholders})
+        ORDER BY created_at ASC, rowid ASC
+        """,
+        statuses,
+    )
+    return [row[0] for row in cur.fetchall() if row[0] in expired]
+
+
+def delete_jobs(
+    conn: sqlite3.Connection, uuids: List[str], child_tables: List[str] = ("events",)
+) -> int:
+    """
+    Delete jobs and their events.
+
+    Args:
+        conn (sqlite3.Connection): Jobs database connection.
+        uuids (list): Jobs UUIDs to delete.
+        child_tables (list): Tables with ``job_uuid`` column to delete jobs rows from.
+
+    Returns:
+        int: Number of deleted jobs.
+    """
+    params = [(uuid,) for uuid in uuids]
+    for table in child_tables:
+        conn.executemany(f"DELETE FROM {table} WHERE job_uuid = ?", params)
+    conn.executemany("DELETE FROM jobs WHERE uuid = ?", params)
+    return len(uuids)
+
+
+def compact_database(
+    conn: sqlite3.Connection, db_path: str, vacuum_pages: int = None
+) -> dict:
+    """
+    Checkpoint WAL file and release free database pages to the file system.
+
+    Databases created with incremental auto vacuum mode release up to
+    ``vacuum_pages`` free pages, all free pages if ``vacuum_pages`` is None.
+    Databases created before incremental auto vacuum was enabled converted
+    to it using one-time full VACUUM.
+
+    Args:
+        conn (sqlite3.Connection): Jobs database connection without open transaction.
+        db_path (str): Path to database file.
+        vacuum_pages (int): Maximum number of free pages to release.
+
+    Returns:
+        dict: Database ``db_size_before`` and ``db_size_after`` in bytes and
+            ``vacuum`` mode used - ``incremental`` or ``full``.
+    """
+
+    def db_size() -> int:
+        return sum(
+            os.path.getsize(db_path + suffix)
+            for suffix in ["", "-wal"]
+            if os.path.exists(db_path + suffix)
+        )
+
+    ret = {"db_size_before": db_size(), "vacuum": "incremental"}
+    if conn.execute("PRAGMA auto_vacuum").fetchone()[0] != 2:
+        conn.execute("PRAGMA auto_vacuum=INCREMENTAL")
+        conn.execute("VACUUM")
+        ret["vacuum"] = "full"
+    elif vacuum_pages:
+        conn.execute(f"PRAGMA incremental_vacuum({int(vacuum_pages)})").fetchall()
+    else:
+        conn.execute("PRAGMA incremental_vacuum").fetchall()
+    conn.execute("PRAGMA wal_checkpoint(TRUNCATE)").fetchall()
+    ret["db_size_after"] = db_size()
+    return ret
@@ -1,3 +1,4 @@
+import asyncio
 import importlib.metadata
 import logging
 import os
@@ -5,17 +6,22 @@ import signal
 import sys
 import threading
 import time
+from collections import OrderedDict
 from datetime import datetime
-from typing import Annotated, Any, Dict, List, Optional, Union
+from typing import Annotated, Any, AsyncIterator, Dict, List, Optional, Union
 
+import orjson
 import uvicorn
 from diskcache import FanoutCache
-from fastapi import Body, Depends, FastAPI, HTTPException, Request
+from fastapi import Body, Depends, FastAPI, HTTPException, Query, Request
+from fastapi.encoders import jsonable_encoder
 from fastapi.openapi.utils import get_openapi
+from fastapi.responses import JSONResponse, StreamingResponse
 from fastapi.security.http import HTTPAuthorizationCredentials, HTTPBearer
 from starlette import status
 from starlette.routing import Route
 
+from norfab.core.async_client import AsyncNFPClient, AsyncNFPJob
 from norfab.core.worker import Job, NFPWorker, Task
 from norfab.models import Result
 from norfab.workers.fastapi_worker.fastapi_models import (
@@ -58,7 +64,10 @@ def create_api_endpoint(
         function: An asynchronous endpoint function
 
     The generated endpoint expects a JSON body containing arguments for
-    the job and returns the result of the job execution.
+    the job and returns the result of the job execution. If ``submit`` query
+    parameter is true, endpoint returns job details with ``202`` status as
+    soon as job submitted, job results can be retrieved later on using
+    ``/jobs/{uuid}`` endpoint or streamed using ``/jobs/{uuid}/events``.
     """
     # We will handle a missing token ourselves
     get_bearer_token = HTTPBearer(auto_error=False)
@@ -80,6 +89,10 @@ def create_api_endpoint(
 
     async def endpoint(
         request: Request,
+        submit: bool = Query(
+            default=False,
+            description="Submit the job and return job UUID without waiting for results",
+        ),
         token: str = Depends(get_token),
     ) -> Dict[Annotated[str, Body(description="Worker Name")], Result]:
         kwargs = await request.json()
@@ -89,7 +102,20 @@ def create_api_endpoint(
             f"FastAPI running '{service}:{task_name}' task, on '{workers}' workers, job data: '{kwargs}'"
         )
 
-        res = worker.client.run_job(
+        if submit is True:
+            job = await worker.async_client.submit_job(
+                service=service,
+                task=task_name,
+                kwargs=kwargs,
+                workers=workers,
+            )
+            worker.api_job_save(job)
+            return JSONResponse(
+                content=jsonable_encoder(job.as_dict()),
+                status_code=status.HTTP_202_ACCEPTED,
+            )
+
+        res = await worker.async_client.run_job(
             service=service,
             task=task_name,
             kwargs=kwargs,
@@ -100,6 +126,42 @@ def create_api_endpoint(
     return endpoint
 
 
+async def job_events_stream(job: AsyncNFPJob) -> AsyncIterator[str]:
+    """
+    Stream job events and workers results as Server-Sent Events.
+
+    Emits ``event`` messages for job events, ``result`` message for each
+    worker as soon as worker returns job results and final ``done`` message
+    with job details once job completes, fails or times out. Each stream
+    replays job events and results history first, allowing multiple clients
+    to stream the same job and clients to reconnect.
+
+    Args:
+        job (AsyncNFPJob): Job to stream events and results for.
+
+    Yields:
+        str: Server-Sent Events formatted messages.
+    """
+    queue = job.subscribe()
+    try:
+        while True:
+            item = await queue.get()
+            if item is None:
+                break
+            kind, data = item
+            if kind == "result":
+                data = {"worker": data[0], "result": data[1]}
+            data = orjson.dumps(data, default=str).decode("utf-8")
+            yield f"event: {kind}\ndata: {data}\n\n"
+        data = orjson.dumps(
+            {k: v for k, v in job.as_dict().items() if k != "result_data"},
+            default=str,
+        ).decode("utf-8")
+        yield f"event: done\ndata: {data}\n\n"
+    finally:
+        job.unsubscribe(queue)
+
+
 def make_openapi_schema(
     app, regenerate: bool = False, json_refs: Optional[dict] = None
 ) -> Dict:
@@ -291,6 +353,19 @@ class FastAPIWorker(NFPWorker):
         self.cache = self._get_diskcache()
         self.cache.expire()
 
+        # jobs submitted via REST API to retrieve results and events for
+        self.api_jobs = OrderedDict()
+        self.api_jobs_max = self.fastapi_inventory.get("jobs_max", 1000)
+        self.api_jobs_ttl = self.fastapi_inventory.get("jobs_ttl", 3600)
+
+        # asyncio client to run API requests jobs within uvicorn event loop
+        self.async_client = AsyncNFPClient(
+            self.inventory,
+            self.broker,
+            name=f"{self.name}-AsyncNFPClient",
+            exit_event=self.exit_event,
+        )
+
         # start FastAPI server
         self.fastapi_start()
 
@@ -322,6 +397,38 @@ class FastAPIWorker(NFPWorker):
             size_limit=1073741824,  #  1 GigaByte
         )
 
+    def api_job_save(self, job: AsyncNFPJob) -> None:
+        """
+        Save job submitted via REST API for later retrieval.
+
+        At most ``jobs_max`` jobs kept, oldest completed jobs evicted first
+        followed by oldest running jobs.
+
+        Args:
+            job (AsyncNFPJob): Submitted job.
+        """
+        self.api_jobs[job.uuid] = job
+        self.api_jobs_expire()
+        excess = len(self.api_jobs) - self.api_jobs_max
+        if excess <= 0:
+            return
+        done = [u for u, j in self.api_jobs.items() if j.done_event.is_set()]
+        for uuid in done[:excess]:
+            self.api_jobs.pop(uuid)
+        while len(self.api_jobs) > self.api_jobs_max:
+            self.api_jobs.popitem(last=False)
+
+    def api_jobs_expire(self) -> None:
+        """Remove jobs completed more than ``jobs_ttl`` seconds ago."""
+        expire_before = time.time() - self.api_jobs_ttl
+        expired = [
+            uuid
+            for uuid, job in self.api_jobs.items()
+            if job.done_event.is_set() and job.completed_time < expire_before
+        ]
+        for uuid in expired:
+            self.api_jobs.pop(uuid)
+
     def fastapi_start(self) -> None:
         """
         Starts the FastAPI server.
@@ -684,11 +791,12 @@ def make_fast_api_app(worker: object, config: dict) -> FastAPI:
     """
     Create a FastAPI application with endpoints for posting, getting, and running jobs.
 
-    This function sets up a FastAPI application with three endpoints:
+    This function sets up a FastAPI application with these endpoints:
 
-    - POST /job: To post a job to the NorFab service.
-    - GET /job: To get job results from the NorFab service.
-    - POST /job/run: To run a job and return job results synchronously.
+    - POST /jobs: To submit a job to the NorFab service.
+    - GET /jobs/{uuid}: To get submitted job details and results.
+    - GET /jobs/{uuid}/events: To stream submitted job events and results.
+    - POST /job/run: To run a job and return job results.
 
     Each endpoint requires a bearer token for authentication, which is validated
     against the worker's token database.
@@ -724,113 +832,121 @@ def make_fast_api_app(worker: object, config: dict) -> FastAPI:
             )
         return auth.credentials
 
-    # @app.post(
-    #     f"{worker.api_prefix}/job",
-    #     responses={status.HTTP_401_UNAUTHORIZED: dict(model=UnauthorizedMessage)},
-    #     tags=["NORFAB"],
-    # )
-    # def post_job(
-    #     service: Annotated[
-    #         str, Body(description="The name of the service to post the job to")
-    #     ],
-    #     task: Annotated[
-    #         str, Body(description="The task to be executed by the service")
-    #     ],
-    #     args: Annotated[
-    #         List[Any], Body(description="A list of positional arguments for the task")
-    #     ] = None,
-    #     kwargs: Annotated[
-    #         Dict[str, Any],
-    #         Body(description="A dictionary of keyword arguments for the task"),
-    #     ] = None,
-    #     workers: Annotated[
-    #         Union[str, List[str]], Body(description="The workers to dispatch the task")
-    #     ] = "all",
-    #     uuid: Annotated[
-    #         str, Body(description="Optional a unique identifier to use for the job")
-    #     ] = None,
-    #     timeout: Annotated[
-    #         int, Body(description="The timeout for the job in seconds")
-    #     ] = 600,
-    #     token: str = Depends(get_token),
-    # ) -> ClientPostJobResponse:
-    #     """
-    #     Method to post the job to NorFab.
-    #
-    #     Args:
-    #         service: The name of the service to post the job to.
-    #         task: The task to be executed by the service.
-    #         args: A list of positional arguments for the task. Defaults to None.
-    #         kwargs: A dictionary of keyword arguments for the task. Defaults to None.
-    #         workers: The workers to dispatch the task. Defaults to "all".
-    #         uuid: Optional a unique identifier to use for the job. Defaults to None.
-    #         timeout: The timeout for the job in seconds. Defaults to 600.
-    #
-    #     Returns:
-    #         The response from the NorFab service.
-    #     """
-    #     log.debug(
-    #         f"{worker.name} - received job post request, service {service}, task {task}, args {args}, kwargs {kwargs}"
-    #     )
-    #     res = worker.client.post(
-    #         service=service,
-    #         task=task,
-    #         args=args,
-    #         kwargs=kwargs,
-    #         workers=workers,
-    #         timeout=timeout,
-    #         uuid=uuid,
-    #     )
-    #     return res
-
-    # @app.get(
-    #     f"{worker.api_prefix}/job",
-    #     responses={status.HTTP_401_UNAUTHORIZED: dict(model=UnauthorizedMessage)},
-    #     tags=["NORFAB"],
-    # )
-    # def get_job(
-    #     service: Annotated[
-    #         str, Body(description="The name of the service to get the job from")
-    #     ],
-    #     uuid: Annotated[str, Body(description="A unique identifier for the job")],
-    #     workers: Annotated[
-    #         Union[str, List[str]],
-    #         Body(description="The workers to dispatch the get request to"),
-    #     ] = "all",
-    #     timeout: Annotated[
-    #         int, Body(description="The timeout for the job in seconds")
-    #     ] = 600,
-    #     token: str = Depends(get_token),
-    # ) -> ClientGetJobResponse:
-    #     """
-    #     Method to get job results from NorFab.
-    #
-    #     Args:
-    #         service: The name of the service to get the job from.
-    #         workers: The workers to dispatch the get request to. Defaults to "all".
-    #         uuid: A unique identifier for the job.
-    #         timeout: The timeout for the job get requests in seconds. Defaults to 600.
-    #
-    #     Returns:
-    #         The response from the NorFab service.
-    #     """
-    #     log.debug(
-    #         f"{worker.name} - received job get request, service {service}, uuid {uuid}"
-    #     )
-    #     res = worker.client.mmi(
-    #         service=service,
-    #         uuid=uuid,
-    #         workers=workers,
-    #         timeout=timeout,
-    #     )
-    #     return res
+    @app.post(
+        f"{worker.api_prefix}/jobs",
+        status_code=status.HTTP_202_ACCEPTED,
+        responses={status.HTTP_401_UNAUTHORIZED: dict(model=UnauthorizedMessage)},
+        tags=["NORFAB"],
+    )
+    async def submit_job(
+        service: Annotated[
+            str, Body(description="The name of the service to post the job to")
+        ],
+        task: Annotated[
+            str, Body(description="The task to be executed by the service")
+        ],
+        args: Annotated[
+            List[Any], Body(description="A list of positional arguments for the task")
+        ] = None,
+        kwargs: Annotated[
+            Dict[str, Any],
+            Body(description="A dictionary of keyword arguments for the task"),
+        ] = None,
+        workers: Annotated[
+            Union[str, List[str]], Body(description="The workers to dispatch the task")
+        ] = "all",
+        uuid: Annotated[
+            str, Body(description="Optional a unique identifier to use for the job")
+        ] = None,
+        timeout: Annotated[
+            int, Body(description="The timeout for the job in seconds")
+        ] = 600,
+        token: str = Depends(get_token),
+    ) -> Dict[str, Any]:
+        """
+        Method to submit the job to NorFab and return job details without
+        waiting for job results.
+
+        Args:
+            service: The name of the service to post the job to.
+            task: The task to be executed by the service.
+            args: A list of positional arguments for the task. Defaults to None.
+            kwargs: A dictionary of keyword arguments for the task. Defaults to None.
+            workers: The workers to dispatch the task. Defaults to "all".
+            uuid: Optional a unique identifier to use for the job. Defaults to None.
+            timeout: The timeout for the job in seconds. Defaults to 600.
+
+        Returns:
+            Job details including job ``uuid`` and ``status``.
+        """
+        log.debug(
+            f"{worker.name} - received submit job request, service {service}, task {task}, args {args}, kwargs {kwargs}"
+        )
+        job = await worker.async_client.submit_job(
+            service=service,
+            task=task,
+            uuid=uuid,
+            args=args,
+            kwargs=kwargs,
+            workers=workers,
+            timeout=timeout,
+        )
+        worker.api_job_save(job)
+        return job.as_dict()
+
+    def get_api_job(uuid: str) -> AsyncNFPJob:
+        worker.api_jobs_expire()
+        job = worker.api_jobs.get(uuid)
+        if job is None:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail=f"Job '{uuid}' not found",
+            )
+        return job
+
+    @app.get(
+        f"{worker.api_prefix}/jobs/{{uuid}}",
+        responses={status.HTTP_401_UNAUTHORIZED: dict(model=UnauthorizedMessage)},
+        tags=["NORFAB"],
+    )
+    async def get_job(uuid: str, token: str = Depends(get_token)) -> Dict[str, Any]:
+        """
+        Method to get details and results of the job submitted via REST API.
+
+        Args:
+            uuid: Job UUID.
+
+        Returns:
+            Job details including job ``status`` and workers ``result_data``.
+        """
+        return get_api_job(uuid).as_dict()
+
+    @app.get(
+        f"{worker.api_prefix}/jobs/{{uuid}}/events",
+        responses={status.HTTP_401_UNAUTHORIZED: dict(model=UnauthorizedMessage)},
+        tags=["NORFAB"],
+    )
+    async def stream_job_events(
+        uuid: str, token: str = Depends(get_token)
+    ) -> StreamingResponse:
+        """
+        Method to stream events and results of the job submitted via REST API
+        using Server-Sent Events. Stream ends with ``done`` event once job
+        completes.
+
+        Args:
+            uuid: Job UUID.
+        """
+        return StreamingResponse(
+            job_events_stream(get_api_job(uuid)), media_type="text/event-stream"
+        )
 
     @app.post(
         f"{worker.api_prefix}/job/run",
         responses={status.HTTP_401_UNAUTHORIZED: dict(model=UnauthorizedMessage)},
         tags=["NORFAB"],
     )
-    def run_job(
+    async def run_job(
         service: Annotated[
             str, Body(description="The name of the service to post the job to")
         ],
@@ -856,11 +972,10 @@ def make_fast_api_app(worker: object, config: dict) -> FastAPI:
         token: str = Depends(get_token),
     ) -> Dict[str, Result]:
         """
-        Method to run job and return job results synchronously. This function
-        is blocking, internally it uses post/get methods to submit job request
-        and waits for job results to come through for all workers request was
-        dispatched to, exiting either once timeout expires or after all workers
-        reported job result back to the client.
+        Method to run job and return job results. Job submitted using asyncio
+        client, request awaits for job results to come through for all workers
+        request was dispatched to, exiting either once timeout expires or after
+        all workers reported job result back to the client.
 
         Args:
             service: The name of the service to post the job to.
@@ -877,7 +992,7 @@ def make_fast_api_app(worker: object, config: dict) -> FastAPI:
         log.debug(
             f"{worker.name} - received run job request, service {service}, task {task}, args {args}, kwargs {kwargs}"
         )
-        res = worker.client.run_job(
+        res = await worker.async_client.run_job(
             service=service,
             task=task,
             uuid=uuid,
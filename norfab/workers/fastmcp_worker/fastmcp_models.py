@@ -80,6 +80,14 @@ class TaskMCPResultGuardrail(BaseModel):
         return self
 
 
+class ToolsConcurrencyLimit(BaseModel):
+    model_config = ConfigDict(extra="forbid")
+
+    service: StrictStr = "*"
+    task: StrictStr = "*"
+    limit: StrictInt = Field(..., gt=0)
+
+
 class GetVersionInput(BaseModel, use_enum_values=True, populate_by_name=True):
     pass
 
@@ -1,3 +1,5 @@
+import asyncio
+import contextlib
 import copy
 import importlib.metadata
 import logging
@@ -9,7 +11,7 @@ import threading
 import time
 from datetime import datetime
 from fnmatch import fnmatch
-from typing import Any, Iterator, Optional
+from typing import Any, Optional
 
 import orjson
 from diskcache import FanoutCache
@@ -26,6 +28,7 @@ from pydantic import (
     create_model,
 )
 
+from norfab.core.async_client import AsyncNFPClient
 from norfab.core.worker import Job, NFPWorker, Task
 from norfab.models import Result
 
@@ -50,6 +53,7 @@ from .fastmcp_models import (
     GetVersionResult,
     TaskMCPGuardrail,
     TaskMCPResultGuardrail,
+    ToolsConcurrencyLimit,
 )
 
 SERVICE = "fastmcp"
@@ -204,23 +208,54 @@ def make_task_result_guardrails(
     return result_guardrails_metadata
 
 
-def iter_result_string_leaves(
-    container: dict | list,
-    key: Any,
+def transform_result_leaves(
+    value: Any,
     path: str,
-) -> Iterator[tuple[dict | list, Any, str, str]]:
-    """Yield mutable containers for string leaves below a result field."""
-    value = container[key]
+    rules: list[tuple[int, str, list[re.Pattern], dict[str, Any]]],
+    stats: dict[str, Any],
+) -> Any:
+    """
+    Apply ordered replace and regex rules to string leaves of a result field.
+
+    Returns transformed copy of ``value``, containers without string leaves
+    changed are returned as is. Rules after the first regex rule that matched
+    any of the leaves are not applied, as that regex rule withholds the whole
+    field. ``stats`` collects replacements count and serialized size change
+    per rule index, and ``blocked`` rule index and path of the first match.
+    """
     if isinstance(value, dict):
-        for child_key in value:
-            yield from iter_result_string_leaves(
-                value, child_key, f"{path}.{child_key}"
-            )
+        ret, changed = {}, False
+        for key, item in value.items():
+            ret[key] = transform_result_leaves(item, f"{path}.{key}", rules, stats)
+            changed = changed or ret[key] is not item
+        return ret if changed else value
     elif isinstance(value, list):
-        for index in range(len(value)):
-            yield from iter_result_string_leaves(value, index, f"{path}[{index}]")
-    elif isinstance(value, str):
-        yield container, key, path, value
+        ret, changed = [], False
+        for index, item in enumerate(value):
+            ret.append(transform_result_leaves(item, f"{path}[{index}]", rules, stats))
+            changed = changed or ret[-1] is not item
+        return ret if changed else value
+    elif not isinstance(value, str):
+        return value
+
+    for index, rule_type, patterns, guardrail in rules:
+        if stats["blocked"] is not None and index >= stats["blocked"][0]:
+            break
+        if rule_type == "replace":
+            new_value = value
+            for pattern in patterns:
+                new_value, count = pattern.subn(guardrail["replace"], new_value)
+                stats["replacements"][index] += count
+            if stats["track_size"] and new_value != value:
+                stats["sizes"][index] += len(orjson.dumps(new_value)) - len(
+                    orjson.dumps(value)
+                )
+            value = new_value
+        elif rule_type == "regex":
+            if any(pattern.search(value) for pattern in patterns):
+                stats["blocked"] = (index, path)
+                break
+    return value
 
 
 def apply_task_result_guardrails(
@@ -230,22 +265,40 @@ def apply_task_result_guardrails(
     raw_result: dict[str, Any] | None,
     result_guardrails: list[dict[str, Any]],
 ) -> dict[str, Any] | None:
-    """Apply ordered result guardrails to one deep MCP delivery copy."""
+    """
+    Apply ordered result guardrails to MCP delivery copy of the result.
+
+    Replace and regex rules applied to each string leaf in a single pass,
+    copying only containers with changed leaves and leaving raw result intact.
+    Limit rules evaluated against raw result size adjusted by the size change
+    of the rules that precede them.
+    """
     if raw_result is None:
         return None
 
-    delivery_result = copy.deepcopy(raw_result)
-
-    for guardrail in result_guardrails:
-        guardrail_type = guardrail["type"]
-
-        if guardrail_type == "limit":
-            serialized_size = len(orjson.dumps(delivery_result))
+    rules = []
+    for index, guardrail in enumerate(result_guardrails):
+        patterns = []
+        if guardrail["type"] in ("replace", "regex"):
+            match_values = guardrail["match"]
+            if isinstance(match_values, str):
+                match_values = [match_values]
+            patterns = [re.compile(value) for value in match_values]
+        rules.append((index, guardrail["type"], patterns, guardrail))
+    string_rules = [r for r in rules if r[1] in ("replace", "regex")]
+    limit_rules = [r for r in rules if r[1] == "limit"]
+    sizes = [0] * len(rules)
+    raw_size = len(orjson.dumps(raw_result)) if limit_rules else 0
+
+    def check_limits(before: int) -> dict[str, Any] | None:
+        for index, _, _, guardrail in limit_rules:
+            if index >= before:
+                break
+            serialized_size = raw_size + sum(sizes[:index])
             limit = guardrail["limit"]
             if serialized_size <= limit:
                 continue
-
-            worker_result = next(iter(delivery_result.values()), {})
+            worker_result = next(iter(raw_result.values()), {})
             juuid = worker_result.get("juuid")
             message = guardrail.get("message") or (
                 f"Guardrail omitted the result for tool '{tool_name}' because its "
@@ -253,58 +306,69 @@ def apply_task_result_guardrails(
             )
             log.warning(message)
             return Result(result=message, failed=False, juuid=juuid).model_dump()
+        return None
 
-        elif guardrail_type == "replace":
-            match_values = guardrail["match"]
-            if isinstance(match_values, str):
-                match_values = [match_values]
-            patterns = [re.compile(value) for value in match_values]
-            replacement_count = 0
-
-            for worker_result in delivery_result.values():
-                for field in ("result", "diff"):
-                    for container, key, _, value in iter_result_string_leaves(
-                        worker_result, field, field
-                    ):
-                        for pattern in patterns:
-                            value, count = pattern.subn(guardrail["replace"], value)
-                            replacement_count += count
-                        container[key] = value
-
-            if replacement_count:
-                log.warning(
-                    f"Guardrail replaced {replacement_count} matches in the result "
-                    f"for tool '{tool_name}'"
-                )
+    # limits preceding any replace or regex rule measure raw result as is
+    first_string_rule = string_rules[0][0] if string_rules else len(rules)
+    limited = check_limits(first_string_rule)
+    if limited is not None:
+        return limited
+    if not string_rules:
+        return raw_result
+
+    replacements = [0] * len(rules)
+    blocked_fields = [0] * len(rules)
+    delivery_result = {}
+    for worker_name, worker_result in raw_result.items():
+        delivery_worker_result = dict(worker_result)
+        for field in ("result", "diff"):
+            if field not in worker_result:
+                continue
+            value, field_rules = worker_result[field], string_rules
+            while field_rules:
+                stats = {
+                    "blocked": None,
+                    "track_size": bool(limit_rules),
+                    "sizes": [0] * len(rules),
+                    "replacements": [0] * len(rules),
+                }
+                new_value = transform_result_leaves(value, field, field_rules, stats)
+                # discard stats of rules that follow blocking regex rule
+                stop = stats["blocked"][0] if stats["blocked"] else len(rules)
+                for index in range(stop):
+                    sizes[index] += stats["sizes"][index]
+                    replacements[index] += stats["replacements"][index]
+                if stats["blocked"] is None:
+                    value = new_value
+                    break
+                index, matched_path = stats["blocked"]
+                msg = f"Guardrail withheld content for '{matched_path}', blocked by regex."
+                message = rules[index][3].get("message") or msg
+                log.warning(msg)
+                blocked_fields[index] += 1
+                if limit_rules:
+                    field_size = len(orjson.dumps(value)) + sum(stats["sizes"][:index])
+                    sizes[index] += len(orjson.dumps(message)) - field_size
+                # remaining rules apply to the regex rule message
+                value, field_rules = message, [r for r in field_rules if r[0] > index]
+            delivery_worker_result[field] = value
+        delivery_result[worker_name] = delivery_worker_result
+
+    for index, rule_type, _, _ in string_rules:
+        if rule_type == "replace" and replacements[index]:
+            log.warning(
+                f"Guardrail replaced {replacements[index]} matches in the result "
+                f"for tool '{tool_name}'"
+            )
+        elif rule_type == "regex" and blocked_fields[index]:
+            log.warning(
+                f"Guardrail withheld {blocked_fields[index]} result fields for tool "
+                f"'{tool_name}' from service '{service}' task '{task_name}'."
+            )
 
-        elif guardrail_type == "regex":
-            match_values = guardrail["match"]
-            if isinstance(match_values, str):
-                match_values = [match_values]
-            patterns = [re.compile(value) for value in match_values]
-            blocked_fields = 0
-
-            for worker_name, worker_result in delivery_result.items():
-                for field in ("result", "diff"):
-                    matched_path = None
-                    for _, _, path, value in iter_result_string_leaves(
-                        worker_result, field, field
-                    ):
-                        if any(pattern.search(value) for pattern in patterns):
-                            matched_path = path
-                            break
-                    if matched_path is None:
-                        continue
-                    msg = f"Guardrail withheld content for '{matched_path}', blocked by regex."
-                    worker_result[field] = guardrail.get("message") or msg
-                    log.warning(msg)
-                    blocked_fields += 1
-
-            if blocked_fields:
-                log.warning(
-                    f"Guardrail withheld {blocked_fields} result fields for tool "
-                    f"'{tool_name}' from service '{service}' task '{task_name}'."
-                )
+    limited = check_limits(len(rules))
+    if limited is not None:
+        return limited
 
     return delivery_result
 
@@ -516,6 +580,11 @@ class FastMCPWorker(NFPWorker):
         self.fastmcp_inventory.setdefault("authentication_enabled", False)
         self.fastmcp_inventory.setdefault("auth_bearer", {})
         self.authentication_enabled = self.is_authentication_enabled()
+        self.tools_concurrency = [
+            ToolsConcurrencyLimit.model_validate(rule)
+            for rule in self.fastmcp_inventory.get("tools", {}).get("concurrency", [])
+        ]
+        self.tools_semaphores = {}
 
         # instantiate cache
         self.cache_dir = os.path.join(self.base_dir, "cache")
@@ -523,6 +592,14 @@ class FastMCPWorker(NFPWorker):
         self.cache = self.get_diskcache()
         self.cache.expire()
 
+        # asyncio client to run tool calls jobs within FastMCP server event loop
+        self.async_client = AsyncNFPClient(
+            self.inventory,
+            self.broker,
+            name=f"{self.name}-AsyncNFPClient",
+            exit_event=self.exit_event,
+        )
+
         # start FastMCP server
         self.fastmcp_start()
 
@@ -975,6 +1052,21 @@ class FastMCPWorker(NFPWorker):
 
         return service, task_name
 
+    def get_tool_semaphore(
+        self, service: str, task_name: str
+    ) -> asyncio.Semaphore | None:
+        """
+        Return concurrency semaphore of the first ``tools.concurrency`` rule
+        matching service task, tools matching the same rule share semaphore.
+        Returns None if no rules match, running tool calls without limit.
+        """
+        for index, rule in enumerate(self.tools_concurrency):
+            if fnmatch(service, rule.service) and fnmatch(task_name, rule.task):
+                if index not in self.tools_semaphores:
+                    self.tools_semaphores[index] = asyncio.Semaphore(rule.limit)
+                return self.tools_semaphores[index]
+        return None
+
     def get_prompt_data(self, name: str) -> dict:
         """
         Resolve a published MCP prompt name to its registry data.
@@ -1048,7 +1140,8 @@ class FastMCPWorker(NFPWorker):
           - `call_tool`: Asynchronously handles tool invocation requests by
             parsing the tool name, checking it against ``tools.policy``,
             evaluating registered guardrails, extracting the corresponding
-            service and task, and running the job using `self.client.run_job`.
+            service and task, and running the job using `self.async_client.run_job`
+            limited by matching ``tools.concurrency`` rule semaphore.
           - `list_prompts`: Returns prompts discovered from task MCP metadata.
           - `get_prompt`: Validates prompt arguments and renders prompt messages
             without dispatching a NorFab job.
@@ -1099,12 +1192,14 @@ class FastMCPWorker(NFPWorker):
                 f"Calling NorFab service '{service}' task '{task_name}' with arguments: '{arguments}'"
             )
 
-            raw_result = self.client.run_job(
-                service=service,
-                task=task_name,
-                kwargs=arguments,
-                workers="all",
-            )
+            semaphore = self.get_tool_semaphore(service, task_name)
+            async with semaphore or contextlib.nullcontext():
+                raw_result = await self.async_client.run_job(
+                    service=service,
+                    task=task_name,
+                    kwargs=arguments,
+                    workers="all",
+                )
             return apply_task_result_guardrails(
                 name,
                 service,
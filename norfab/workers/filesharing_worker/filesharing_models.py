@@ -73,6 +73,20 @@ class FileDetailsResult(Result):
     )
 
 
+class FileManifestInput(BaseModel, use_enum_values=True, populate_by_name=True):
+    url: StrictStr = Field(
+        ...,
+        description="Directory URL starting with nf:// to get files manifest for",
+    )
+
+
+class FileManifestResult(Result):
+    result: Union[None, dict[StrictStr, FileDetailsPayload]] = Field(
+        None,
+        description="Files details keyed by file URL",
+    )
+
+
 class WalkInput(BaseModel, use_enum_values=True, populate_by_name=True):
     url: StrictStr = Field(
         ...,
@@ -100,6 +114,10 @@ class FetchFileInput(BaseModel, use_enum_values=True, populate_by_name=True):
         description="Client chunk request timeout in seconds",
         alias="chunk-timeout",
     )
+    length: Union[None, StrictInt] = Field(
+        None,
+        description="Number of bytes to fetch starting from offset, fetch until file end if not provided",
+    )
 
 
 class FetchFileResult(Result):
@@ -3,6 +3,7 @@ import importlib.metadata
 import logging
 import os
 import sys
+import threading
 from typing import Any
 
 from norfab.core.worker import Job, NFPWorker, Task
@@ -13,6 +14,8 @@ from .filesharing_models import (
     FetchFileResult,
     FileDetailsInput,
     FileDetailsResult,
+    FileManifestInput,
+    FileManifestResult,
     GetInventoryInput,
     GetInventoryResult,
     GetStatusInput,
@@ -53,6 +56,8 @@ class FileSharingWorker(NFPWorker):
         # get inventory from broker
         self.filesharing_inventory = self.load_inventory()
         self.base_dir = self.filesharing_inventory.get("base_dir")
+        self.files_index = {}  # full path -> (mtime_ns, size, md5hash)
+        self.files_index_lock = threading.Lock()
 
         self.init_done_event.set()
         log.debug(f"{self.name} - Started, {self.filesharing_inventory}")
@@ -91,6 +96,68 @@ class FileSharingWorker(NFPWorker):
             raise ValueError(f"'{url}' - invalid URL path")
         return candidate
 
+    def _file_md5(self, full_path: str) -> tuple:
+        """
+        Return file MD5 hash and size using files hash index.
+
+        File hashed only if it is not indexed yet or if its modification
+        time or size changed since it was indexed, otherwise indexed hash
+        returned without reading the file.
+
+        Args:
+            full_path (str): File filesystem path.
+
+        Returns:
+            tuple: ``(md5hash, size_bytes)`` tuple.
+        """
+        stat = os.stat(full_path)
+        signature = (stat.st_mtime_ns, stat.st_size)
+        with self.files_index_lock:
+            indexed = self.files_index.get(full_path)
+        if indexed and indexed[:2] == signature:
+            return indexed[2], stat.st_size
+
+        file_hash = hashlib.md5()
+        with open(full_path, "rb") as f:
+            chunk = f.read(65536)
+            while chunk:
+                file_hash.update(chunk)
+                chunk = f.read(65536)
+        md5hash = file_hash.hexdigest()
+
+        with self.files_index_lock:
+            self.files_index[full_path] = (*signature, md5hash)
+
+        return md5hash, stat.st_size
+
+    def _walk_files(self, full_path: str):
+        """
+        Recursively iterate over directory files skipping hidden files
+        and files in ``__folders__``.
+
+        Args:
+            full_path (str): Directory filesystem path.
+
+        Yields:
+            tuple: ``(url, file_path)`` tuples for each file found.
+        """
+        for root, dirs, files in os.walk(full_path):
+            # skip path containing folders like __folders__
+            if root.count("__") >= 2:
+                continue
+            file_root = root
+            root = root.replace(self.base_dir, "")
+            root = root.lstrip("\\")
+            root = root.replace("\\", "/")
+            for file in files:
+                # skip hidden/system files
+                if file.startswith("."):
+                    continue
+                if root:
+                    yield f"nf://{root}/{file}", os.path.join(file_root, file)
+                else:
+                    yield f"nf://{file}", os.path.join(file_root, file)
+
     @Task(
         input=GetVersionInput,
         output=GetVersionResult,
@@ -230,17 +297,8 @@ class FileSharingWorker(NFPWorker):
             return ret
         exists = os.path.exists(full_path) and os.path.isfile(full_path)
 
-        # calculate md5 hash
-        md5hash = None
         if exists:
-            with open(full_path, "rb") as f:
-                file_hash = hashlib.md5()
-                chunk = f.read(8192)
-                while chunk:
-                    file_hash.update(chunk)
-                    chunk = f.read(8192)
-            md5hash = file_hash.hexdigest()
-            size = os.path.getsize(full_path)
+            md5hash, size = self._file_md5(full_path)
             ret.result = {
                 "md5hash": md5hash,
                 "size_bytes": size,
@@ -286,28 +344,66 @@ class FileSharingWorker(NFPWorker):
             return ret
 
         if os.path.exists(full_path) and os.path.isdir(full_path):
-            files_list = []
-            for root, dirs, files in os.walk(full_path):
-                # skip path containing folders like __folders__
-                if root.count("__") >= 2:
-                    continue
-                root = root.replace(self.base_dir, "")
-                root = root.lstrip("\\")
-                root = root.replace("\\", "/")
-                for file in files:
-                    # skip hidden/system files
-                    if file.startswith("."):
-                        continue
-                    if root:
-                        files_list.append(f"nf://{root}/{file}")
-                    else:
-                        files_list.append(f"nf://{file}")
+            files_list = [file_url for file_url, _ in self._walk_files(full_path)]
             ret.result = files_list
         else:
             ret.failed = True
             ret.errors = ["Directory Not Found"]
         return ret
 
+    @Task(
+        input=FileManifestInput,
+        output=FileManifestResult,
+        fastapi={"methods": ["GET"]},
+        agent={"enabled": False},
+        mcp={
+            "annotations": {
+                "title": "Get Files Manifest",
+                "readOnlyHint": True,
+                "destructiveHint": False,
+                "idempotentHint": True,
+                "openWorldHint": False,
+            }
+        },
+    )
+    def file_manifest(self, url: str) -> Result:
+        """
+        Get details of all files in a directory and its subdirectories, so
+        that clients can validate whole directory content in one call.
+
+        Args:
+            url: URL path starting with 'nf://' to get files manifest for
+
+        Returns:
+            Result containing dictionary keyed by file URL with md5hash,
+            size_bytes and exists fields
+        """
+        ret = Result(result=None)
+        try:
+            full_path = self._safe_path(url)
+        except ValueError as e:
+            ret.failed = True
+            ret.errors = [str(e)]
+            return ret
+
+        if os.path.exists(full_path) and os.path.isdir(full_path):
+            ret.result = {}
+            for file_url, file_path in self._walk_files(full_path):
+                try:
+                    md5hash, size = self._file_md5(file_path)
+                except OSError as e:
+                    log.warning(f"{self.name} - failed to hash '{file_url}': {e}")
+                    continue
+                ret.result[file_url] = {
+                    "md5hash": md5hash,
+                    "size_bytes": size,
+                    "exists": True,
+                }
+        else:
+            ret.failed = True
+            ret.errors = ["Directory Not Found"]
+        return ret
+
     @Task(
         input=FetchFileInput,
         output=FetchFileResult,
@@ -330,14 +426,22 @@ class FileSharingWorker(NFPWorker):
         chunk_size: int = 256000,
         offset: int = 0,
         chunk_timeout: int = 5,
+        length: int = None,
     ) -> Result:
         """
         Fetch a file in chunks with offset support.
 
+        Chunks read using positional reads and streamed to the client as
+        soon as client requests them, client can request several chunks
+        in advance to keep them in transit.
+
         Args:
             url: URL path starting with 'nf://' to fetch file from
             chunk_size: Size of chunk to read in bytes (default: 256KB)
             offset: Number of bytes to offset (default: 0)
+            chunk_timeout: Seconds to wait for the next chunk request from client
+            length: Number of bytes to fetch starting from offset, fetch file
+                until its end if not provided
 
         Returns:
             Result containing file chunk bytes or error message
@@ -352,13 +456,13 @@ class FileSharingWorker(NFPWorker):
 
         if os.path.exists(full_path):
             size = os.path.getsize(full_path)
+            end = size if length is None else min(size, offset + length)
             with open(full_path, "rb") as f:
                 while True:
-                    f.seek(offset, os.SEEK_SET)
-                    chunk = f.read(chunk_size)
+                    chunk = self._read_chunk(f, offset, min(chunk_size, end - offset))
                     if chunk:
                         job.stream(chunk)
-                    if f.tell() >= size:
+                    if not chunk or offset + len(chunk) >= end:
                         break
                     client_response = job.wait_client_input(timeout=chunk_timeout)
                     if not client_response:
@@ -373,3 +477,24 @@ class FileSharingWorker(NFPWorker):
             ret.errors = [f"'{url}' file not found"]
 
         return ret
+
+    @staticmethod
+    def _read_chunk(f: Any, offset: int, size: int) -> bytes:
+        """
+        Read file chunk at given offset, uses positional read where
+        supported to read chunk with single system call.
+
+        Args:
+            f: File object opened in binary mode.
+            offset: Chunk offset in bytes.
+            size: Chunk size in bytes.
+
+        Returns:
+            bytes: Chunk content, empty if offset is beyond file end.
+        """
+        if size <= 0:
+            return b""
+        if hasattr(os, "pread"):
+            return os.pread(f.fileno(), size, offset)
+        f.seek(offset, os.SEEK_SET)
+        return f.read(size)
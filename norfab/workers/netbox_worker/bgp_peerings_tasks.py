@@ -2036,13 +2036,7 @@ class NetboxBgpPeeringsTasks:
         job.event(
             f"fetching BGP session data from {len(devices)} device(s) via Nornir parse_ttp"
         )
-        parse_data = self.client.run_job(
-            "nornir",
-            "parse_ttp",
-            kwargs={"get": "bgp_neighbors", "FL": devices},
-            workers="all",
-            timeout=timeout,
-        )
+        parse_data = self.get_device_state(job, devices, timeout, get="bgp_neighbors")
 
         # Build NetBox BGP sessions normalised dicts per device
         job.event("normalising NetBox BGP session data")
@@ -66,6 +66,7 @@ class NetboxBranchTasks:
 
         if nb_branch:
             nb_branch.delete()
+            self.pynetbox_cache_invalidate(instance, branch)
             ret.result = True
             job.event(f"'{branch}' deleted from '{instance}' Netbox instance")
         else:
@@ -1,6 +1,8 @@
+import concurrent.futures
 import fnmatch
 import logging
 import re
+import time
 from typing import Any, Union
 
 import yaml
@@ -243,6 +245,23 @@ class NetboxDevicesTasks:
             else f"retrieving device data from instance '{instance}' using {len(filters)} filter(s)"
         )
 
+        # serve devices requested by name from cache if changelog watcher
+        # reports no changes for them, without querying NetBox
+        if cache == True and self.cache_watcher and devices and len(filters) == 1:
+            for device_name in devices:
+                device_cache_key = f"get_devices::{device_name}"
+                if self.cache_watcher.is_valid(instance, device_cache_key):
+                    device_data = self.cache.get(device_cache_key)
+                    if device_data is not None:
+                        ret.result[device_name] = device_data
+            if ret.result:
+                job.event(
+                    f"serving {len(ret.result)} device(s) from cache, "
+                    f"no changes reported by NetBox changelog"
+                )
+            remaining = [d for d in devices if d not in ret.result]
+            filters = [{"name": remaining}] if remaining else []
+
         filters_to_fetch = list(filters)
 
         if cache == True or cache == "force":
@@ -283,6 +302,7 @@ class NetboxDevicesTasks:
         # fetch full device data from Netbox
         if filters_to_fetch:
             job.event(f"fetching device data from NetBox instance '{instance}'")
+            fetch_started = time.time()
             nb = self._get_pynetbox(instance, job=job)
             all_devices_raw = {}
 
@@ -305,6 +325,14 @@ class NetboxDevicesTasks:
                     if cache != False:
                         cache_key = f"get_devices::{device_name}"
                         self.cache.set(cache_key, device_data, expire=self.cache_ttl)
+                        if self.cache_watcher:
+                            self.cache_watcher.register(
+                                instance,
+                                cache_key,
+                                fetch_started,
+                                device=device_name,
+                                device_id=device.id,
+                            )
                         log.info(
                             f"{self.name} - Cached device data for '{device_name}'"
                         )
@@ -570,14 +598,7 @@ class NetboxDevicesTasks:
         else:
             nornir_kwargs["get"] = "inventory"
         nornir_kwargs["strict"] = False
-        nornir_kwargs["FL"] = devices
-        parse_data = self.client.run_job(
-            "nornir",
-            "parse_ttp",
-            workers="all",
-            timeout=timeout,
-            kwargs=nornir_kwargs,
-        )
+        parse_data = self.get_device_state(job, devices, timeout, **nornir_kwargs)
         if parse_data is None:
             msg = "nornir parse_ttp inventory returned no data"
             ret.errors.append(msg)
@@ -1184,7 +1205,8 @@ class NetboxDevicesTasks:
         Calls ``sync_device_inventory``, ``sync_device_interfaces``,
         ``sync_mac_addresses``, ``sync_device_ip``, and ``sync_bgp_peerings`` in
         dry-run mode and produces a per-device report indicating which items are
-        in sync and which are not.
+        in sync and which are not. Live devices data required by these checks is
+        collected once and shared, sub-tasks run in parallel over it.
 
         ``Result.diff`` contains the full dry-run detail from each sub-task, keyed by
         sub-task name (``inventory``, ``interfaces``, ``mac_addresses``,
@@ -1254,107 +1276,81 @@ class NetboxDevicesTasks:
         for device in devices:
             ret.result[device] = {}
 
-        # --- check inventory ---
+        # work out live data needed by selected checks and collect it in one pass
+        getters = {}
         if check_inventory:
-            job.event("checking device inventory sync state")
-            inventory_result = self.sync_device_inventory(
-                job=job,
-                instance=instance,
-                dry_run=True,
-                timeout=timeout,
-                devices=list(devices),
-                branch=branch,
-            )
-            if inventory_result.errors:
-                ret.errors.extend(inventory_result.errors)
-            for device, data in inventory_result.result.items():
-                in_sync = (
-                    not data.get("create")
-                    and not data.get("update")
-                    and not data.get("delete")
-                )
-                ret.result.setdefault(device, {})["inventory"] = in_sync
-            ret.diff["inventory"] = inventory_result.result
-
-        # --- check interfaces ---
-        if check_interfaces:
-            job.event("checking interfaces sync state")
-            intf_result = self.sync_device_interfaces(
-                job=job,
-                instance=instance,
-                dry_run=True,
-                timeout=timeout,
-                devices=list(devices),
-                branch=branch,
-            )
-            if intf_result.errors:
-                ret.errors.extend(intf_result.errors)
-            for device, data in intf_result.result.items():
-                in_sync = (
-                    not data.get("create")
-                    and not data.get("update")
-                    and not data.get("delete")
-                )
-                ret.result.setdefault(device, {})["interfaces"] = in_sync
-            ret.diff["interfaces"] = intf_result.result
-
-        # --- check MAC addresses ---
-        if check_mac_addresses:
-            job.event("checking MAC addresses sync state")
-            mac_result = self.sync_mac_addresses(
-                job=job,
-                instance=instance,
-                dry_run=True,
-                timeout=timeout,
-                devices=list(devices),
-                branch=branch,
-            )
-            if mac_result.errors:
-                ret.errors.extend(mac_result.errors)
-            for device, data in mac_result.result.items():
-                in_sync = not data.get("created") and not data.get("updated")
-                ret.result.setdefault(device, {})["mac_addresses"] = in_sync
-            ret.diff["mac_addresses"] = mac_result.result
-
-        # --- check IP addresses ---
-        if check_ip_addresses:
-            job.event("checking IP addresses sync state")
-            ip_result = self.sync_device_ip(
-                job=job,
-                instance=instance,
-                dry_run=True,
-                timeout=timeout,
-                devices=list(devices),
-                branch=branch,
-            )
-            if ip_result.errors:
-                ret.errors.extend(ip_result.errors)
-            for device, data in ip_result.result.items():
-                in_sync = not data.get("created") and not data.get("updated")
-                ret.result.setdefault(device, {})["ip_addresses"] = in_sync
-            ret.diff["ip_addresses"] = ip_result.result
-
-        # --- check BGP peerings ---
+            getters["inventory"] = {"get": "inventory", "strict": False}
+        if check_interfaces or check_mac_addresses or check_ip_addresses:
+            getters["interfaces"] = {"get": "interfaces"}
         if check_bgp_peerings:
-            job.event("checking BGP peerings sync state")
-            bgp_result = self.sync_bgp_peerings(
-                job=job,
-                instance=instance,
-                dry_run=True,
-                timeout=timeout,
-                devices=list(devices),
-                branch=branch,
-            )
-            if bgp_result.errors:
-                ret.errors.extend(bgp_result.errors)
-            for device, data in bgp_result.result.items():
-                in_sync = (
-                    not data.get("create")
-                    and not data.get("update")
-                    and not data.get("delete")
-                )
-                ret.result.setdefault(device, {})["bgp_peerings"] = in_sync
-            ret.diff["bgp_peerings"] = bgp_result.result
+            getters["bgp_neighbors"] = {"get": "bgp_neighbors"}
+        job.event(f"collecting live {', '.join(getters)} data in one pass")
+
+        # run dry-run sync tasks in parallel over collected devices state,
+        # each check defined as (category, sync task, in sync result keys)
+        checks = [
+            (
+                "inventory",
+                self.sync_device_inventory,
+                ("create", "update", "delete"),
+                check_inventory,
+            ),
+            (
+                "interfaces",
+                self.sync_device_interfaces,
+                ("create", "update", "delete"),
+                check_interfaces,
+            ),
+            (
+                "mac_addresses",
+                self.sync_mac_addresses,
+                ("created", "updated"),
+                check_mac_addresses,
+            ),
+            (
+                "ip_addresses",
+                self.sync_device_ip,
+                ("created", "updated"),
+                check_ip_addresses,
+            ),
+            (
+                "bgp_peerings",
+                self.sync_bgp_peerings,
+                ("create", "update", "delete"),
+                check_bgp_peerings,
+            ),
+        ]
+        try:
+            self.collect_device_state(job, getters, list(devices), timeout)
+            with concurrent.futures.ThreadPoolExecutor(
+                max_workers=len(checks)
+            ) as executor:
+                futures = {
+                    category: executor.submit(
+                        sync_task,
+                        job=job,
+                        instance=instance,
+                        dry_run=True,
+                        timeout=timeout,
+                        devices=list(devices),
+                        branch=branch,
+                    )
+                    for category, sync_task, _, checked in checks
+                    if checked
+                }
+                job.event(f"checking {', '.join(futures)} sync state")
+                for category, sync_task, diff_keys, checked in checks:
+                    if not checked:
+                        continue
+                    sync_result = futures[category].result()
+                    if sync_result.errors:
+                        ret.errors.extend(sync_result.errors)
+                    for device, data in sync_result.result.items():
+                        in_sync = not any(data.get(k) for k in diff_keys)
+                        ret.result.setdefault(device, {})[category] = in_sync
+                    ret.diff[category] = sync_result.result
+        finally:
+            self.release_device_state(job)
 
         checked_categories = {
             "inventory": check_inventory,
@@ -1436,6 +1432,7 @@ class NetboxDevicesTasks:
         """
         Synchronize all device data from live devices into NetBox in sequence:
         inventory → interfaces → MAC addresses → IP addresses → BGP peerings.
+        Live devices data for all stages is collected once upfront and shared.
 
         Pass ``dry_run=True`` to preview changes without writing to NetBox.
         Pass ``with_approval=True`` to have each sync stage run a dry-run preview,
@@ -1533,151 +1530,171 @@ class NetboxDevicesTasks:
         for device in devices:
             ret.result[device] = {}
 
-        # --- sync device inventory ---
-        job.event("SYNCING device inventory")
-        inventory_result = self.sync_device_inventory(
-            job=job,
-            instance=instance,
-            dry_run=dry_run,
-            timeout=timeout,
-            devices=list(devices),
-            branch=branch,
-            with_approval=with_approval,
-            process_deletions=process_deletions,
-            create_module_types=inventory_create_module_types,
-            create_module_bays=inventory_create_module_bays,
-            inventory_map=inventory_map,
-            inventory_transform=inventory_transform,
-            filter_by_module=inventory_filter_by_module,
-            filter_by_slot=inventory_filter_by_slot,
-            ignore_modules=inventory_ignore_modules,
-            ignore_slots=inventory_ignore_slots,
-            message=message,
-        )
-        if inventory_result.errors:
-            job.event("inventory sync completed with errors", severity="WARNING")
-            ret.errors.extend(inventory_result.errors)
-        for device, data in inventory_result.result.items():
-            ret.result.setdefault(device, {})["inventory"] = data
-        if inventory_result.status == "skipped" and inventory_result.dry_run:
-            ret.status = "skipped"
-            ret.dry_run = True
-            job.event("sync all stopped because device inventory review was declined")
-            return ret
-
-        # --- sync interfaces ---
-        job.event("SYNCING interfaces")
-        intf_result = self.sync_device_interfaces(
-            job=job,
-            instance=instance,
-            dry_run=dry_run,
-            timeout=timeout,
-            devices=list(devices),
-            branch=branch,
-            process_deletions=process_deletions,
-            with_approval=with_approval,
-            filter_by_name=interfaces_filter_by_name,
-            filter_by_description=interfaces_filter_by_description,
-            update_type=interfaces_update_type,
-            vlan_group=interfaces_vlan_group,
-        )
-        if intf_result.errors:
-            job.event("interface sync completed with errors", severity="WARNING")
-            ret.errors.extend(intf_result.errors)
-        for device, data in intf_result.result.items():
-            ret.result.setdefault(device, {})["interfaces"] = data
-        if intf_result.status == "skipped" and intf_result.dry_run:
-            ret.status = "skipped"
-            ret.dry_run = True
-            job.event("sync all stopped because interface review was declined")
-            return ret
-
-        # --- sync MAC addresses ---
-        job.event("SYNCING MAC addresses")
-        mac_result = self.sync_mac_addresses(
-            job=job,
-            instance=instance,
-            dry_run=dry_run,
-            timeout=timeout,
-            devices=list(devices),
-            branch=branch,
-            with_approval=with_approval,
-            filter_by_name=mac_filter_by_name,
-            filter_by_description=mac_filter_by_description,
-            filter_by_mac=mac_filter_by_mac,
-        )
-        if mac_result.errors:
-            job.event("MAC address sync completed with errors", severity="WARNING")
-            ret.errors.extend(mac_result.errors)
-        for device, data in mac_result.result.items():
-            ret.result.setdefault(device, {})["mac_addresses"] = data
-        if mac_result.status == "skipped" and mac_result.dry_run:
-            ret.status = "skipped"
-            ret.dry_run = True
-            job.event("sync all stopped because MAC address review was declined")
-            return ret
+        # collect live data for all sync stages in one pass, stages and their
+        # review steps reuse it instead of querying devices again
+        job.event("collecting live inventory, interfaces and bgp_neighbors data")
+        try:
+            self.collect_device_state(
+                job,
+                {
+                    "inventory": {"get": "inventory", "strict": False},
+                    "interfaces": {"get": "interfaces"},
+                    "bgp_neighbors": {"get": "bgp_neighbors"},
+                },
+                list(devices),
+                timeout,
+            )
 
-        # --- sync IP addresses ---
-        job.event("SYNCING IP addresses")
-        ip_result = self.sync_device_ip(
-            job=job,
-            instance=instance,
-            dry_run=dry_run,
-            timeout=timeout,
-            devices=list(devices),
-            branch=branch,
-            with_approval=with_approval,
-            anycast_ranges=ip_anycast_ranges,
-            ignore_ranges=ip_ignore_ranges,
-            create_prefixes=ip_create_prefixes,
-            ignore_vrf=ip_ignore_vrf,
-            filter_by_name=ip_filter_by_name,
-            filter_by_description=ip_filter_by_description,
-            filter_by_prefix=ip_filter_by_prefix,
-            filter_by_ip=ip_filter_by_ip,
-        )
-        if ip_result.errors:
-            job.event("IP address sync completed with errors", severity="WARNING")
-            ret.errors.extend(ip_result.errors)
-        for device, data in ip_result.result.items():
-            ret.result.setdefault(device, {})["ip_addresses"] = data
-        if ip_result.status == "skipped" and ip_result.dry_run:
-            ret.status = "skipped"
-            ret.dry_run = True
-            job.event("sync all stopped because IP address review was declined")
-            return ret
+            # --- sync device inventory ---
+            job.event("SYNCING device inventory")
+            inventory_result = self.sync_device_inventory(
+                job=job,
+                instance=instance,
+                dry_run=dry_run,
+                timeout=timeout,
+                devices=list(devices),
+                branch=branch,
+                with_approval=with_approval,
+                process_deletions=process_deletions,
+                create_module_types=inventory_create_module_types,
+                create_module_bays=inventory_create_module_bays,
+                inventory_map=inventory_map,
+                inventory_transform=inventory_transform,
+                filter_by_module=inventory_filter_by_module,
+                filter_by_slot=inventory_filter_by_slot,
+                ignore_modules=inventory_ignore_modules,
+                ignore_slots=inventory_ignore_slots,
+                message=message,
+            )
+            if inventory_result.errors:
+                job.event("inventory sync completed with errors", severity="WARNING")
+                ret.errors.extend(inventory_result.errors)
+            for device, data in inventory_result.result.items():
+                ret.result.setdefault(device, {})["inventory"] = data
+            if inventory_result.status == "skipped" and inventory_result.dry_run:
+                ret.status = "skipped"
+                ret.dry_run = True
+                job.event(
+                    "sync all stopped because device inventory review was declined"
+                )
+                return ret
 
-        # --- sync BGP peerings ---
-        job.event("SYNCING BGP peerings")
-        bgp_result = self.sync_bgp_peerings(
-            job=job,
-            instance=instance,
-            status=bgp_status,
-            dry_run=dry_run,
-            timeout=timeout,
-            devices=list(devices),
-            branch=branch,
-            process_deletions=process_deletions,
-            with_approval=with_approval,
-            rir=bgp_rir,
-            message=message,
-            name_template=bgp_name_template,
-            filter_by_remote_as=bgp_filter_by_remote_as,
-            filter_by_peer_group=bgp_filter_by_peer_group,
-            filter_by_description=bgp_filter_by_description,
-            ignore_peer_ranges=bgp_ignore_peer_ranges,
-            vrf_custom_field=bgp_vrf_custom_field,
-        )
-        if bgp_result.errors:
-            job.event("BGP peerings sync completed with errors", severity="WARNING")
-            ret.errors.extend(bgp_result.errors)
-        for device, data in bgp_result.result.items():
-            ret.result.setdefault(device, {})["bgp_peerings"] = data
-        if bgp_result.status == "skipped" and bgp_result.dry_run:
-            ret.status = "skipped"
-            ret.dry_run = True
-            job.event("sync all stopped because BGP peerings review was declined")
-            return ret
+            # --- sync interfaces ---
+            job.event("SYNCING interfaces")
+            intf_result = self.sync_device_interfaces(
+                job=job,
+                instance=instance,
+                dry_run=dry_run,
+                timeout=timeout,
+                devices=list(devices),
+                branch=branch,
+                process_deletions=process_deletions,
+                with_approval=with_approval,
+                filter_by_name=interfaces_filter_by_name,
+                filter_by_description=interfaces_filter_by_description,
+                update_type=interfaces_update_type,
+                vlan_group=interfaces_vlan_group,
+            )
+            if intf_result.errors:
+                job.event("interface sync completed with errors", severity="WARNING")
+                ret.errors.extend(intf_result.errors)
+            for device, data in intf_result.result.items():
+                ret.result.setdefault(device, {})["interfaces"] = data
+            if intf_result.status == "skipped" and intf_result.dry_run:
+                ret.status = "skipped"
+                ret.dry_run = True
+                job.event("sync all stopped because interface review was declined")
+                return ret
+
+            # --- sync MAC addresses ---
+            job.event("SYNCING MAC addresses")
+            mac_result = self.sync_mac_addresses(
+                job=job,
+                instance=instance,
+                dry_run=dry_run,
+                timeout=timeout,
+                devices=list(devices),
+                branch=branch,
+                with_approval=with_approval,
+                filter_by_name=mac_filter_by_name,
+                filter_by_description=mac_filter_by_description,
+                filter_by_mac=mac_filter_by_mac,
+            )
+            if mac_result.errors:
+                job.event("MAC address sync completed with errors", severity="WARNING")
+                ret.errors.extend(mac_result.errors)
+            for device, data in mac_result.result.items():
+                ret.result.setdefault(device, {})["mac_addresses"] = data
+            if mac_result.status == "skipped" and mac_result.dry_run:
+                ret.status = "skipped"
+                ret.dry_run = True
+                job.event("sync all stopped because MAC address review was declined")
+                return ret
+
+            # --- sync IP addresses ---
+            job.event("SYNCING IP addresses")
+            ip_result = self.sync_device_ip(
+                job=job,
+                instance=instance,
+                dry_run=dry_run,
+                timeout=timeout,
+                devices=list(devices),
+                branch=branch,
+                with_approval=with_approval,
+                anycast_ranges=ip_anycast_ranges,
+                ignore_ranges=ip_ignore_ranges,
+                create_prefixes=ip_create_prefixes,
+                ignore_vrf=ip_ignore_vrf,
+                filter_by_name=ip_filter_by_name,
+                filter_by_description=ip_filter_by_description,
+                filter_by_prefix=ip_filter_by_prefix,
+                filter_by_ip=ip_filter_by_ip,
+            )
+            if ip_result.errors:
+                job.event("IP address sync completed with errors", severity="WARNING")
+                ret.errors.extend(ip_result.errors)
+            for device, data in ip_result.result.items():
+                ret.result.setdefault(device, {})["ip_addresses"] = data
+            if ip_result.status == "skipped" and ip_result.dry_run:
+                ret.status = "skipped"
+                ret.dry_run = True
+                job.event("sync all stopped because IP address review was declined")
+                return ret
+
+            # --- sync BGP peerings ---
+            job.event("SYNCING BGP peerings")
+            bgp_result = self.sync_bgp_peerings(
+                job=job,
+                instance=instance,
+                status=bgp_status,
+                dry_run=dry_run,
+                timeout=timeout,
+                devices=list(devices),
+                branch=branch,
+                process_deletions=process_deletions,
+                with_approval=with_approval,
+                rir=bgp_rir,
+                message=message,
+                name_template=bgp_name_template,
+                filter_by_remote_as=bgp_filter_by_remote_as,
+                filter_by_peer_group=bgp_filter_by_peer_group,
+                filter_by_description=bgp_filter_by_description,
+                ignore_peer_ranges=bgp_ignore_peer_ranges,
+                vrf_custom_field=bgp_vrf_custom_field,
+            )
+            if bgp_result.errors:
+                job.event("BGP peerings sync completed with errors", severity="WARNING")
+                ret.errors.extend(bgp_result.errors)
+            for device, data in bgp_result.result.items():
+                ret.result.setdefault(device, {})["bgp_peerings"] = data
+            if bgp_result.status == "skipped" and bgp_result.dry_run:
+                ret.status = "skipped"
+                ret.dry_run = True
+                job.event("sync all stopped because BGP peerings review was declined")
+                return ret
+
+        finally:
+            self.release_device_state(job)
 
         log.info(f"{self.name} - Sync all complete for {len(ret.result)} device(s)")
         job.event(f"sync all complete for {len(ret.result)} device(s)")
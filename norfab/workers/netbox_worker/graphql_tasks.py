@@ -1,6 +1,7 @@
 import concurrent.futures
 import json
 import logging
+import time
 from typing import Any, Union
 
 import requests
@@ -68,7 +69,7 @@ def _form_query_v4(obj, filters, fields, alias=None) -> str:
 
 
 def graphql_fetch_page(
-    token: str,
+    session: requests.Session,
     nb_url: str,
     ssl_verify: bool,
     query: str,
@@ -76,14 +77,14 @@ def graphql_fetch_page(
     connect_timeout: int,
     read_timeout: int,
     worker_name: str,
-) -> dict[str, Any]:
+) -> tuple[dict[str, Any], int]:
     """Execute a single paginated GraphQL POST request and return the ``data`` payload.
 
-    Each call creates its own :class:`requests.Session` so it is safe to call
-    concurrently from multiple threads.
+    Requests sent using given :class:`requests.Session` connections pool, session
+    can be shared by multiple threads to fetch pages concurrently.
 
     Args:
-        token: NetBox API token used in the ``Authorization`` header.
+        session: Requests session with NetBox ``Authorization`` header set.
         nb_url: Base URL of the NetBox instance (e.g. ``https://netbox.example.com``).
         ssl_verify: Whether to verify TLS certificates.
         query: GraphQL query string.
@@ -93,50 +94,106 @@ def graphql_fetch_page(
         worker_name: Worker name used in error messages.
 
     Returns:
-        The ``data`` section of the GraphQL JSON response.
+        Tuple of the ``data`` section of the GraphQL JSON response and response size in bytes.
 
     Raises:
         requests.HTTPError: If the HTTP response status indicates an error.
         RuntimeError: If the GraphQL response body contains an ``errors`` field.
     """
-    retry = Retry(
-        total=3,
-        connect=3,
-        read=3,
-        backoff_factor=0.5,
-        status_forcelist=(429, 500, 502, 503, 504),
-        allowed_methods={"POST"},
+    response = session.post(
+        url=f"{nb_url}/graphql/",
+        json={"query": query, "variables": variables},
+        verify=ssl_verify,
+        timeout=(connect_timeout, read_timeout),
     )
-    adapter = HTTPAdapter(max_retries=retry)
-    session = requests.Session()
-    session.mount("http://", adapter)
-    session.mount("https://", adapter)
-    session.headers.update(
-        {
-            "Content-Type": "application/json",
-            "Accept": "application/json",
-            "Authorization": f"Token {token}",
-        }
-    )
-    try:
-        response = session.post(
-            url=f"{nb_url}/graphql/",
-            json={"query": query, "variables": variables},
-            verify=ssl_verify,
-            timeout=(connect_timeout, read_timeout),
+    response.raise_for_status()
+    response_payload = response.json()
+    if response_payload.get("errors"):
+        raise RuntimeError(
+            f"{worker_name} - GraphQL query returned errors: {response_payload['errors']}"
         )
-        response.raise_for_status()
-        response_payload = response.json()
-        if response_payload.get("errors"):
-            raise RuntimeError(
-                f"{worker_name} - GraphQL query returned errors: {response_payload['errors']}"
-            )
-        return response_payload.get("data", {})
-    finally:
-        session.close()
+    return response_payload.get("data", {}), len(response.content)
 
 
 class NetboxGraphqlTasks:
+    def _get_graphql_session(self, instance: str) -> requests.Session:
+        """
+        Return worker-lifetime requests session for NetBox instance GraphQL API.
+
+        Session created on first use and reused by all subsequent GraphQL queries,
+        its connections pool sized to keep ``grapqhl_max_workers`` connections open.
+
+        Args:
+            instance: NetBox instance name.
+
+        Returns:
+            requests.Session: Session with ``Authorization`` header set.
+        """
+        with self.graphql_lock:
+            if instance not in self.graphql_sessions:
+                nb_params = self._get_instance_params(instance)
+                adapter = HTTPAdapter(
+                    pool_connections=1,
+                    pool_maxsize=self.grapqhl_max_workers,
+                    max_retries=Retry(
+                        total=3,
+                        connect=3,
+                        read=3,
+                        backoff_factor=0.5,
+                        status_forcelist=(429, 500, 502, 503, 504),
+                        allowed_methods={"POST"},
+                    ),
+                )
+                session = requests.Session()
+                session.mount("http://", adapter)
+                session.mount("https://", adapter)
+                session.headers.update(
+                    {
+                        "Content-Type": "application/json",
+                        "Accept": "application/json",
+                        "Authorization": f"Token {nb_params['token']}",
+                    }
+                )
+                self.graphql_sessions[instance] = session
+            return self.graphql_sessions[instance]
+
+    def graphql_stats_update(
+        self,
+        instance: str,
+        requests_count: int,
+        bytes_count: int,
+        errors_count: int,
+        elapsed: float,
+    ) -> None:
+        """
+        Update NetBox instance GraphQL requests metrics.
+
+        Args:
+            instance: NetBox instance name.
+            requests_count: Number of requests completed.
+            bytes_count: Number of response bytes received.
+            errors_count: Number of failed requests.
+            elapsed: Time spent to complete the requests in seconds.
+        """
+        with self.graphql_lock:
+            stats = self.graphql_stats.setdefault(
+                instance, {"requests": 0, "bytes": 0, "errors": 0, "elapsed": 0.0}
+            )
+            stats["requests"] += requests_count
+            stats["bytes"] += bytes_count
+            stats["errors"] += errors_count
+            stats["elapsed"] += elapsed
+            stats["requests_per_second"] = round(
+                stats["requests"] / max(stats["elapsed"], 0.001), 2
+            )
+            stats["bytes_per_second"] = round(
+                stats["bytes"] / max(stats["elapsed"], 0.001), 2
+            )
+        log.debug(
+            f"{self.name} - '{instance}' GraphQL {requests_count} request(s), "
+            f"{bytes_count} bytes, {errors_count} error(s) in {elapsed:.2f}s"
+        )
+
     @Task(
         input=NetboxGraphqlInput,
         output=NetboxGraphqlResult,
@@ -164,7 +221,9 @@ class NetboxGraphqlTasks:
         """
         Execute a paginated GraphQL query against a NetBox instance, fetching all pages in parallel.
 
-        Pages are fetched in parallel batches of up to ``grapqhl_max_workers`` concurrent requests.
+        Pages are fetched using sliding window of ``grapqhl_max_workers`` concurrent requests
+        sent over worker's persistent connections pool for the instance, next page requested
+        as soon as any of the in-flight pages fetched.
         Results across all pages are merged into a single ``aggregated_data`` dict where list
         fields are extended and scalar fields are overwritten.
 
@@ -182,6 +241,7 @@ class NetboxGraphqlTasks:
             :class:`Result` whose ``result`` field holds the merged GraphQL ``data`` dict.
             On failure ``failed`` is ``True`` and ``errors`` lists the exception messages.
         """
+        instance = instance or self.default_instance
         nb_params = self._get_instance_params(instance)
         ret = Result(task=f"{self.name}:graphql", resources=[instance])
 
@@ -203,46 +263,53 @@ class NetboxGraphqlTasks:
         aggregated_data: dict[str, Any] = {}
         ssl_verify = nb_params.get("ssl_verify", True)
         nb_url = nb_params["url"]
+        variables = variables or {}
+        session = self._get_graphql_session(instance)
         job.event(
             f"executing paginated GraphQL query against '{instance}' "
             f"with page size {limit}"
         )
 
-        # paginate through all results, fetching grapqhl_max_workers pages per iteration
+        # keep grapqhl_max_workers page requests in flight, submitting next page
+        # as soon as any page fetched until last page found
+        in_flight: dict[concurrent.futures.Future, int] = {}
+        pages: dict[int, dict[str, Any]] = {}
+        next_offset = merge_offset = offset
+        last_page = False
+        requests_count = bytes_count = 0
+        start_time = time.time()
         while True:
-            batch_offsets = [
-                offset + (i * limit) for i in range(self.grapqhl_max_workers)
-            ]
-            pages: list[tuple[int, dict[str, Any]]] = []
-
-            with concurrent.futures.ThreadPoolExecutor(
-                max_workers=self.grapqhl_max_workers
-            ) as pool:
-                futures: dict[concurrent.futures.Future, int] = {
-                    pool.submit(
-                        graphql_fetch_page,
-                        nb_params["token"],
-                        nb_url,
-                        ssl_verify,
-                        query,
-                        {**variables, "offset": page_offset, "limit": limit},
-                        self.netbox_connect_timeout,
-                        self.netbox_read_timeout,
-                        self.name,
-                    ): page_offset
-                    for page_offset in batch_offsets
-                }
-                for future in concurrent.futures.as_completed(futures):
-                    page_offset = futures[future]
-                    try:
-                        pages.append((page_offset, future.result()))
-                    except Exception as exc:
-                        error_msg = (
-                            f"Failed to fetch page at offset {page_offset}: {exc}"
-                        )
-                        log.error(f"{self.name} - {error_msg}")
-                        ret.errors.append(error_msg)
-                        ret.failed = True
+            while not last_page and len(in_flight) < self.grapqhl_max_workers:
+                future = self.graphql_executor.submit(
+                    graphql_fetch_page,
+                    session,
+                    nb_url,
+                    ssl_verify,
+                    query,
+                    {**variables, "offset": next_offset, "limit": limit},
+                    self.netbox_connect_timeout,
+                    self.netbox_read_timeout,
+                    self.name,
+                )
+                in_flight[future] = next_offset
+                next_offset += limit
+            if not in_flight:
+                break
+
+            done, _ = concurrent.futures.wait(
+                in_flight, return_when=concurrent.futures.FIRST_COMPLETED
+            )
+            for future in done:
+                page_offset = in_flight.pop(future)
+                try:
+                    pages[page_offset], page_bytes = future.result()
+                    requests_count += 1
+                    bytes_count += page_bytes
+                except Exception as exc:
+                    error_msg = f"Failed to fetch page at offset {page_offset}: {exc}"
+                    log.error(f"{self.name} - {error_msg}")
+                    ret.errors.append(error_msg)
+                    ret.failed = True
 
             # stop immediately if any page fetch failed — results would be incomplete
             if ret.failed:
@@ -251,30 +318,33 @@ class NetboxGraphqlTasks:
                 )
                 break
 
-            any_data_returned = False
-            has_full_page = False
-
             # merge pages in offset order to maintain consistent result ordering
-            for _, data in sorted(pages, key=lambda item: item[0]):
+            while not last_page and merge_offset in pages:
+                data = pages.pop(merge_offset)
+                merge_offset += limit
                 page_sizes: list[int] = []
                 for key, value in data.items():
                     if isinstance(value, list):
-                        if value:
-                            any_data_returned = True
                         aggregated_data.setdefault(key, [])
                         aggregated_data[key].extend(value)
                         page_sizes.append(len(value))
                     else:
                         aggregated_data[key] = value
-                # a full page means there may be more data to fetch
-                if page_sizes and any(size == limit for size in page_sizes):
-                    has_full_page = True
+                # no data returned or no list fully filled means no more data to fetch
+                if not any(page_sizes) or limit not in page_sizes:
+                    last_page = True
 
-            # stop when no data was returned or no page was fully filled
-            if not any_data_returned or not has_full_page:
+            if last_page:
                 break
 
-            offset += self.grapqhl_max_workers * limit
+        # discard requests for pages past the last page
+        for future in in_flight:
+            future.cancel()
+
+        elapsed = time.time() - start_time
+        self.graphql_stats_update(
+            instance, requests_count, bytes_count, len(ret.errors), elapsed
+        )
 
         if not ret.failed:
             ret.result = aggregated_data
@@ -283,7 +353,11 @@ class NetboxGraphqlTasks:
                 for value in aggregated_data.values()
                 if isinstance(value, list)
             )
-            job.event(f"GraphQL query complete: {total_items} list item(s) retrieved")
+            job.event(
+                f"GraphQL query complete: {total_items} list item(s) retrieved "
+                f"using {requests_count} request(s), {bytes_count} bytes, "
+                f"{requests_count / max(elapsed, 0.001):.1f} requests/s"
+            )
 
         return ret
 
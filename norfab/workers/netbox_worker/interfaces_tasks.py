@@ -1,5 +1,6 @@
 import fnmatch
 import logging
+import time
 from typing import Any, Union
 
 from norfab.core.worker import Job, Task
@@ -353,8 +354,41 @@ class NetboxInterfacesTasks:
         job.event(f"retrieving interfaces for {len(devices)} device(s)")
 
         devices_to_fetch = list(devices)
+        cache_scope = {
+            name
+            for name, included in [
+                ("ip_addresses", ip_addresses),
+                ("inventory_items", inventory_items),
+            ]
+            if included
+        }
+        # only complete devices interfaces data from main branch is watched
+        cache_watched = (
+            self.cache_watcher is not None
+            and not interface_list
+            and not interface_regex
+            and branch is None
+        )
 
-        if cache == True or cache == "force":
+        # serve devices interfaces from cache if changelog watcher reports
+        # no changes for them, without querying NetBox
+        if cache == True and cache_watched and devices:
+            for device_name in devices:
+                device_cache_key = f"get_interfaces::{device_name}"
+                if self.cache_watcher.is_valid(instance, device_cache_key, cache_scope):
+                    device_interfaces = self.cache.get(device_cache_key)
+                    if device_interfaces is not None:
+                        ret.result[device_name] = device_interfaces
+                        devices_to_fetch.remove(device_name)
+            if len(devices_to_fetch) < len(devices):
+                job.event(
+                    f"serving {len(devices) - len(devices_to_fetch)} device(s) "
+                    f"interfaces from cache, no changes reported by NetBox changelog"
+                )
+            filter_params["device"] = list(devices_to_fetch)
+
+        fetch_started = time.time()
+        if (cache == True or cache == "force") and (devices_to_fetch or not devices):
             job.event(f"checking cache for {len(devices)} device(s)")
             # quick REST call to get current last_updated for all matching interfaces
             result = self.bulk_filter(
@@ -476,6 +510,19 @@ class NetboxInterfacesTasks:
                         ret.result[device_name],
                         expire=self.cache_ttl,
                     )
+                    if cache_watched and ret.result[device_name]:
+                        device_interfaces = list(ret.result[device_name].values())
+                        self.cache_watcher.register(
+                            instance,
+                            cache_key,
+                            fetch_started,
+                            device=device_name,
+                            device_id=device_interfaces[0]["device"]["id"],
+                            interface_ids=[i["id"] for i in device_interfaces],
+                            scope=cache_scope,
+                        )
+                    elif self.cache_watcher:
+                        self.cache_watcher.unregister(cache_key)
 
         if brief:
             ret.result = make_interfaces_brief(ret.result)
@@ -1160,13 +1207,7 @@ class NetboxInterfacesTasks:
 
         # Gather live source of truth from Nornir parse_ttp.
         job.event(f"retrieving live interfaces for {len(devices)} devices")
-        parse_data = self.client.run_job(
-            "nornir",
-            "parse_ttp",
-            kwargs={"get": "interfaces", "FL": devices},
-            workers="all",
-            timeout=timeout,
-        )
+        parse_data = self.get_device_state(job, devices, timeout, get="interfaces")
         # Normalize live interface data per device.
         job.event("normalising live interface data")
         normalised_live_all = {}
@@ -1702,13 +1743,7 @@ class NetboxInterfacesTasks:
 
         # gather live interface data from Nornir parse_ttp
         job.event(f"retrieving live interfaces for {len(devices)} devices")
-        parse_data = self.client.run_job(
-            "nornir",
-            "parse_ttp",
-            kwargs={"get": "interfaces", "FL": devices},
-            workers="all",
-            timeout=timeout,
-        )
+        parse_data = self.get_device_state(job, devices, timeout, get="interfaces")
 
         # collect all discovered MAC addresses applying interface and MAC filters
         job.event("collecting live MAC address candidates")
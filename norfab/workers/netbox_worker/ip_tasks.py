@@ -782,13 +782,7 @@ class NetboxIpTasks:
 
         # gather live interface data from Nornir parse_ttp
         job.event(f"retrieving live interfaces for {len(devices)} devices")
-        parse_data = self.client.run_job(
-            "nornir",
-            "parse_ttp",
-            kwargs={"get": "interfaces", "FL": devices},
-            workers="all",
-            timeout=timeout,
-        )
+        parse_data = self.get_device_state(job, devices, timeout, get="interfaces")
 
         # normalise live data from Nornir parse_ttp results into {device: {intf: intf_data}}
         # applying interface name and description filters at collection phase
@@ -0,0 +1,258 @@
+"""
+NetBox worker cache changelog watcher - tails NetBox object changes and
+removes cached devices and interfaces data affected by them.
+"""
+
+import logging
+import threading
+import time
+from typing import Any, Union
+
+log = logging.getLogger(__name__)
+
+
+class NetboxCacheWatcher:
+    """
+    Background thread that polls NetBox ``core/object-changes`` endpoint of
+    each NetBox instance for changes made since previous poll and removes
+    ``get_devices`` and ``get_interfaces`` cache entries of devices affected
+    by these changes.
+
+    Cache entries written while watcher is running registered with it using
+    ``register`` method. Registered entries are guaranteed to be removed once
+    NetBox changelog reports changes for their devices, as a result ``is_valid``
+    method reports them as up to date without querying NetBox, provided that
+    instance changelog was polled within ``max_staleness`` seconds.
+
+    Args:
+        worker: NetBox worker object.
+        interval (int): Interval in seconds between changelog polls.
+        max_staleness (int): Maximum number of seconds since last successful
+            changelog poll to consider registered cache entries up to date.
+    """
+
+    page_size = 1000
+    invalidated_ttl = 86400  # seconds to remember invalidated cache keys for
+
+    def __init__(self, worker: object, interval: int, max_staleness: int) -> None:
+        self.worker = worker
+        self.interval = interval
+        self.max_staleness = max_staleness
+        self.lock = threading.Lock()
+        self.entries = {}  # cache key -> {"instance": str, "scope": frozenset}
+        self.invalidated = {}  # cache key -> invalidation timestamp
+        self.device_ids = {}  # (instance, device ID) -> device name
+        self.interface_ids = {}  # (instance, interface ID) -> device name
+        self.last_change_id = {}  # instance -> last processed change ID
+        self.last_poll = {}  # instance -> last successful poll start timestamp
+        self.stop_event = threading.Event()
+        self.thread = threading.Thread(
+            target=self.run, daemon=True, name=f"{worker.name}_cache_watcher"
+        )
+
+    def start(self) -> None:
+        self.thread.start()
+        log.info(
+            f"{self.worker.name} - Started NetBox changelog cache watcher, "
+            f"interval {self.interval}s, max staleness {self.max_staleness}s"
+        )
+
+    def stop(self) -> None:
+        self.stop_event.set()
+
+    def run(self) -> None:
+        while not (self.stop_event.is_set() or self.worker.exit_event.is_set()):
+            for instance in self.worker.netbox_inventory["instances"]:
+                try:
+                    self.poll(instance)
+                except Exception as e:
+                    log.error(
+                        f"{self.worker.name} - '{instance}' changelog poll failed: {e}"
+                    )
+            self.prune()
+            self.stop_event.wait(self.interval)
+
+    def get_changes_page(self, url: str, params: Union[None, dict], nb_params: dict):
+        response = self.worker.netbox_http_session.get(
+            url,
+            params=params,
+            verify=nb_params.get("ssl_verify", True),
+            timeout=(
+                self.worker.netbox_connect_timeout,
+                self.worker.netbox_read_timeout,
+            ),
+            headers={
+                "Accept": "application/json",
+                "Authorization": f"Token {nb_params['token']}",
+            },
+        )
+        response.raise_for_status()
+        return response.json()
+
+    def poll(self, instance: str) -> None:
+        """
+        Fetch instance changelog entries created since previous poll and
+        invalidate cache entries affected by them. First poll only records
+        latest changelog entry ID.
+
+        Args:
+            instance (str): NetBox instance name.
+        """
+        nb_params = self.worker._get_instance_params(instance)
+        url = f"{nb_params['url']}/api/core/object-changes/"
+        poll_start = time.time()
+
+        if instance not in self.last_change_id:
+            page = self.get_changes_page(
+                url, {"ordering": "-id", "limit": 1}, nb_params
+            )
+            results = page.get("results") or []
+            self.last_change_id[instance] = results[0]["id"] if results else 0
+        else:
+            params = {
+                "id__gt": self.last_change_id[instance],
+                "ordering": "id",
+                "limit": self.page_size,
+            }
+            while url:
+                page = self.get_changes_page(url, params, nb_params)
+                for change in page.get("results") or []:
+                    self.process(instance, change)
+                    self.last_change_id[instance] = change["id"]
+                url, params = page.get("next"), None
+
+        self.last_poll[instance] = poll_start
+
+    def process(self, instance: str, change: dict) -> None:
+        """
+        Invalidate cache entries of devices affected by changelog entry.
+
+        Args:
+            instance (str): NetBox instance name.
+            change (dict): NetBox object change data.
+        """
+        obj_type = change.get("changed_object_type")
+        obj_id = change.get("changed_object_id")
+        states = [
+            change.get("prechange_data") or {},
+            change.get("postchange_data") or {},
+        ]
+        devices = set()
+
+        if obj_type == "dcim.device":
+            devices.add(self.device_ids.get((instance, obj_id)))
+            devices.add(change.get("object_repr"))
+            devices.update(state.get("name") for state in states)
+        elif obj_type == "ipam.ipaddress":
+            # changelog data stores assigned object type as content type ID,
+            # match assigned object ID against known interfaces IDs only
+            devices.update(
+                self.interface_ids.get((instance, state.get("assigned_object_id")))
+                for state in states
+            )
+        else:
+            # device components e.g. interfaces or inventory items
+            devices.update(
+                self.device_ids.get((instance, state.get("device"))) for state in states
+            )
+            if obj_type == "dcim.interface":
+                devices.add(self.interface_ids.get((instance, obj_id)))
+
+        devices.discard(None)
+        if devices:
+            self.invalidate(devices)
+
+    def invalidate(self, devices: set) -> None:
+        """
+        Remove devices data from cache.
+
+        Args:
+            devices (set): Names of devices to remove cached data for.
+        """
+        now = time.time()
+        for device_name in devices:
+            for cache_key in [
+                f"get_devices::{device_name}",
+                f"get_interfaces::{device_name}",
+            ]:
+                with self.lock:
+                    self.entries.pop(cache_key, None)
+                    self.invalidated[cache_key] = now
+                self.worker.cache.delete(cache_key)
+            log.debug(
+                f"{self.worker.name} - Removed '{device_name}' cache, "
+                f"NetBox changelog reports device changes"
+            )
+
+    def prune(self) -> None:
+        now = time.time()
+        with self.lock:
+            for cache_key, timestamp in list(self.invalidated.items()):
+                if now - timestamp > self.invalidated_ttl:
+                    self.invalidated.pop(cache_key)
+
+    def register(
+        self,
+        instance: str,
+        cache_key: str,
+        started: float,
+        device: str,
+        device_id: Any = None,
+        interface_ids: Union[None, list] = None,
+        scope: Union[None, set] = None,
+    ) -> None:
+        """
+        Register cache entry written with data fetched from NetBox.
+
+        Entry not registered if its device data was invalidated after data
+        fetching started, as fetched data might predate that change.
+
+        Args:
+            instance (str): NetBox instance name data fetched from.
+            cache_key (str): Cache key.
+            started (float): Timestamp of when data fetching started.
+            device (str): Device name.
+            device_id (int): Device NetBox ID.
+            interface_ids (list): Device interfaces NetBox IDs.
+            scope (set): Names of additional data included in cached entry.
+        """
+        with self.lock:
+            if self.invalidated.get(cache_key, 0) >= started:
+                self.entries.pop(cache_key, None)
+                return
+            self.entries[cache_key] = {
+                "instance": instance,
+                "scope": frozenset(scope or []),
+            }
+            if device_id is not None:
+                self.device_ids[(instance, device_id)] = device
+            for interface_id in interface_ids or []:
+                self.interface_ids[(instance, interface_id)] = device
+
+    def unregister(self, cache_key: str) -> None:
+        with self.lock:
+            self.entries.pop(cache_key, None)
+
+    def is_valid(
+        self, instance: str, cache_key: str, scope: Union[None, set] = None
+    ) -> bool:
+        """
+        Check if cache entry is up to date according to NetBox changelog.
+
+        Args:
+            instance (str): NetBox instance name.
+            cache_key (str): Cache key.
+            scope (set): Names of additional data cached entry must include.
+
+        Returns:
+            bool: True if entry is up to date, False otherwise.
+        """
+        if time.time() - self.last_poll.get(instance, 0) > self.max_staleness:
+            return False
+        with self.lock:
+            entry = self.entries.get(cache_key)
+            return (
+                entry is not None
+                and entry["instance"] == instance
+                and frozenset(scope or []) <= entry["scope"]
+            )
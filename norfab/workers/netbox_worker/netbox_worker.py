@@ -1,7 +1,9 @@
+import concurrent.futures
 import importlib.metadata
 import logging
 import os
 import sys
+import threading
 import time
 import urllib.parse
 from datetime import datetime, timedelta
@@ -29,6 +31,7 @@ from .devices_tasks import NetboxDevicesTasks
 from .graphql_tasks import NetboxGraphqlTasks
 from .interfaces_tasks import NetboxInterfacesTasks
 from .ip_tasks import NetboxIpTasks
+from .netbox_cache_watcher import NetboxCacheWatcher
 from .netbox_crud import NetboxCrudTasks
 from .netbox_models import (
     CacheClearInput,
@@ -100,6 +103,7 @@ class NetboxWorker(
 
     default_instance = None
     inventory = None
+    cache_watcher = None
     nb_version = {}  # dict keyed by instance name and version
     compatible_ge_v4 = (
         4,
@@ -159,6 +163,22 @@ class NetboxWorker(
             "branch_create_timeout", 120
         )
         self.grapqhl_max_workers = self.netbox_inventory.get("grapqhl_max_workers", 4)
+        self.pynetbox_cache_idle = self.netbox_inventory.get("pynetbox_cache_idle", 600)
+        self.pynetbox_branch_ttl = self.netbox_inventory.get("pynetbox_branch_ttl", 60)
+        # pynetbox threading fetches pages concurrently, allow extra connections
+        self.pynetbox_pool_size = self.netbox_inventory.get(
+            "pynetbox_pool_size", self.max_concurrent_jobs * 2
+        )
+        self.pynetbox_cache = {}  # keyed by (instance, branch, ssl_verify) tuple
+        self.pynetbox_lock = threading.Lock()
+        self.graphql_executor = concurrent.futures.ThreadPoolExecutor(
+            max_workers=self.grapqhl_max_workers,
+            thread_name_prefix=f"{self.name}-graphql",
+        )
+        self.graphql_sessions = {}  # GraphQL requests sessions keyed by instance
+        self.graphql_stats = {}  # GraphQL requests metrics keyed by instance
+        self.graphql_lock = threading.Lock()
+        self.device_state = {}  # per-job live devices state snapshots
 
         # find default instance
         for name, params in self.netbox_inventory["instances"].items():
@@ -178,6 +198,20 @@ class NetboxWorker(
         os.makedirs(self.cache_dir, exist_ok=True)
         self.cache = self._get_diskcache()
 
+        # start NetBox changelog cache watcher
+        cache_changelog_interval = self.netbox_inventory.get(
+            "cache_changelog_interval", 0
+        )
+        if cache_changelog_interval and self.cache_use is not False:
+            self.cache_watcher = NetboxCacheWatcher(
+                self,
+                interval=cache_changelog_interval,
+                max_staleness=self.netbox_inventory.get(
+                    "cache_changelog_max_staleness", cache_changelog_interval * 3
+                ),
+            )
+            self.cache_watcher.start()
+
         self.init_done_event.set()
         log.info(f"{self.name} - Started")
 
@@ -189,10 +223,18 @@ class NetboxWorker(
         If the cache exists, it closes the cache to release any resources
         associated with it.
         """
+        if self.cache_watcher:
+            self.cache_watcher.stop()
         if self.cache:
             self.cache.close()
         if getattr(self, "netbox_http_session", None):
             self.netbox_http_session.close()
+        if getattr(self, "graphql_executor", None):
+            self.graphql_executor.shutdown(wait=False, cancel_futures=True)
+        for session in getattr(self, "graphql_sessions", {}).values():
+            session.close()
+        for cached in getattr(self, "pynetbox_cache", {}).values():
+            cached["adapter"].close()
 
     # ----------------------------------------------------------------------
     # Netbox Service Functions that exposed for calling
@@ -441,6 +483,7 @@ class NetboxWorker(
 
                 - "error" (str or None): Error message if the query failed, otherwise None.
                 - "status" (bool): True if the query was successful, False otherwise.
+                - "graphql_stats" (dict): Worker GraphQL requests count, bytes, errors and rates for this instance.
                 - Additional keys from the Netbox API response if the query was successful.
 
         Raises:
@@ -451,6 +494,7 @@ class NetboxWorker(
         ret = {
             "error": None,
             "status": True,
+            "graphql_stats": dict(self.graphql_stats.get(name, {})),
         }
 
         try:
@@ -510,6 +554,14 @@ class NetboxWorker(
         """
         Helper function to instantiate a pynetbox API object.
 
+        Connections pool and branch schema ID cached per instance, branch and SSL
+        verification settings and reused by subsequent calls, each call returns
+        new pynetbox API object with its own HTTP session headers mounted on
+        cached connections pool. Cached entries not used for ``pynetbox_cache_idle``
+        seconds evicted, next call for them queries branching plugin again. Cached
+        branch schema ID re-validated once older than ``pynetbox_branch_ttl``
+        seconds to detect branches merged or deleted outside of this worker.
+
         Args:
             instance (str): The instance name for which to get the pynetbox API object.
             branch (str, optional): Branch name to use, need to have branching plugin installed.
@@ -525,67 +577,45 @@ class NetboxWorker(
         If SSL verification is disabled in the instance parameters,
         this function will disable warnings for insecure requests.
         """
+        instance = instance or self.default_instance
         params = self._get_instance_params(instance)
+        ssl_verify = params.get("ssl_verify", True)
+        cache_key = (instance, branch, ssl_verify)
+
+        with self.pynetbox_lock:
+            self._evict_idle_pynetbox()
+            cached = self.pynetbox_cache.get(cache_key)
+            if cached is None:
+                cached = {
+                    "adapter": HTTPAdapter(
+                        max_retries=self.netbox_retry,
+                        pool_maxsize=self.pynetbox_pool_size,
+                    ),
+                    "branch_schema_id": None,
+                    "branch_validated": 0,
+                }
+                self.pynetbox_cache[cache_key] = cached
+            cached["last_used"] = time.time()
+
         nb = pynetbox.api(url=params["url"], token=params["token"], threading=True)
-        adapter = HTTPAdapter(max_retries=self.netbox_retry)
-        nb.http_session.mount("http://", adapter)
-        nb.http_session.mount("https://", adapter)
+        nb.http_session.mount("http://", cached["adapter"])
+        nb.http_session.mount("https://", cached["adapter"])
 
-        if params.get("ssl_verify") == False:
+        if ssl_verify == False:
             nb.http_session.verify = False
 
-        # add branch
-        if branch is not None and self.has_plugin(
-            "netbox_branching", instance, strict=True
+        # add branch, re-validating cached branch schema ID once it expires
+        if branch is not None and (
+            cached["branch_schema_id"] is None
+            or time.time() - cached["branch_validated"] > self.pynetbox_branch_ttl
         ):
-            try:
-                nb_branch = nb.plugins.branching.branches.get(name=branch)
-            except Exception:
-                msg = f"Failed to retrieve branch '{branch}' from Netbox"
-                raise RuntimeError(msg)
-
-            # create new branch
-            if not nb_branch:
-                log.info(
-                    f"{self.name} - Creating new branch '{branch}' in instance '{instance}'"
-                )
-                nb_branch = nb.plugins.branching.branches.create(name=branch)
-            else:
-                log.info(
-                    f"{self.name} - Using existing branch '{branch}' in instance '{instance}'"
+            if self.has_plugin("netbox_branching", instance, strict=True):
+                cached["branch_schema_id"] = self._get_branch_schema_id(
+                    nb, instance, branch, job
                 )
-
-            if nb_branch.status.value.lower() == "merged":
-                msg = f"'{instance}' NetBox branch '{branch}' is merged and cannot be used."
-                log.error(f"{self.name} - {msg}")
-                if job is not None:
-                    job.event(msg, severity="ERROR")
-                raise RuntimeError(msg)
-
-            # wait for branch provisioning to complete
-            if not nb_branch.status.value.lower() == "ready":
-                msg = (
-                    f"provisioning branch '{branch}' in instance '{instance}' "
-                    f"(timeout: {self.branch_create_timeout}s)"
-                )
-                log.info(f"{self.name} - {msg}")
-                if job is not None:
-                    job.event(msg)
-                retries = 0
-                while retries < self.branch_create_timeout:
-                    nb_branch = nb.plugins.branching.branches.get(name=branch)
-                    if nb_branch.status.value.lower() == "ready":
-                        break
-                    time.sleep(1)
-                    retries += 1
-                else:
-                    raise TimeoutError(f"Branch '{branch}' was created but not ready")
-                msg = f"branch provisioning finished for '{branch}' in instance '{instance}'"
-                log.info(f"{self.name} - {msg}")
-                if job is not None:
-                    job.event(msg)
-
-            nb.http_session.headers["X-NetBox-Branch"] = nb_branch.schema_id
+                cached["branch_validated"] = time.time()
+        if branch is not None and cached["branch_schema_id"]:
+            nb.http_session.headers["X-NetBox-Branch"] = cached["branch_schema_id"]
 
             log.info(
                 f"{self.name} - Instantiated pynetbox for instance '{instance}' with branch '{branch}'"
@@ -593,6 +623,112 @@ class NetboxWorker(
 
         return nb
 
+    def _get_branch_schema_id(
+        self, nb, instance: str, branch: str, job: Job = None
+    ) -> str:
+        """
+        Helper function to retrieve NetBox branch schema ID, creating the branch
+        and waiting for its provisioning to complete if branch does not exist.
+
+        Args:
+            nb (pynetbox.core.api.Api): Pynetbox API object.
+            instance (str): NetBox instance name.
+            branch (str): Branch name.
+            job (Job, optional): NorFab Job object for progress events.
+
+        Returns:
+            str: Branch schema ID.
+
+        Raises:
+            RuntimeError: If failed to retrieve branch or branch is merged.
+            TimeoutError: If branch provisioning did not complete in time.
+        """
+        try:
+            nb_branch = nb.plugins.branching.branches.get(name=branch)
+        except Exception:
+            msg = f"Failed to retrieve branch '{branch}' from Netbox"
+            raise RuntimeError(msg)
+
+        # create new branch
+        if not nb_branch:
+            log.info(
+                f"{self.name} - Creating new branch '{branch}' in instance '{instance}'"
+            )
+            nb_branch = nb.plugins.branching.branches.create(name=branch)
+        else:
+            log.info(
+                f"{self.name} - Using existing branch '{branch}' in instance '{instance}'"
+            )
+
+        if nb_branch.status.value.lower() == "merged":
+            msg = f"'{instance}' NetBox branch '{branch}' is merged and cannot be used."
+            log.error(f"{self.name} - {msg}")
+            if job is not None:
+                job.event(msg, severity="ERROR")
+            self.pynetbox_cache_invalidate(instance, branch)
+            raise RuntimeError(msg)
+
+        # wait for branch provisioning to complete
+        if not nb_branch.status.value.lower() == "ready":
+            msg = (
+                f"provisioning branch '{branch}' in instance '{instance}' "
+                f"(timeout: {self.branch_create_timeout}s)"
+            )
+            log.info(f"{self.name} - {msg}")
+            if job is not None:
+                job.event(msg)
+            retries = 0
+            while retries < self.branch_create_timeout:
+                nb_branch = nb.plugins.branching.branches.get(name=branch)
+                if nb_branch.status.value.lower() == "ready":
+                    break
+                time.sleep(1)
+                retries += 1
+            else:
+                raise TimeoutError(f"Branch '{branch}' was created but not ready")
+            msg = (
+                f"branch provisioning finished for '{branch}' in instance '{instance}'"
+            )
+            log.info(f"{self.name} - {msg}")
+            if job is not None:
+                job.event(msg)
+
+        return nb_branch.schema_id
+
+    def _evict_idle_pynetbox(self) -> None:
+        """
+        Helper function to remove pynetbox cache entries not used for more than
+        ``pynetbox_cache_idle`` seconds, must be called with ``pynetbox_lock``
+        acquired. Connections pools not closed as jobs still running may use
+        them, pools closed once garbage collected.
+        """
+        now = time.time()
+        for cache_key, cached in list(self.pynetbox_cache.items()):
+            if now - cached["last_used"] > self.pynetbox_cache_idle:
+                self.pynetbox_cache.pop(cache_key)
+
+    def pynetbox_cache_invalidate(
+        self, instance: str = None, branch: str = None
+    ) -> None:
+        """
+        Remove cached pynetbox connections pools and branch schema IDs, removed
+        connections pools left for garbage collection as jobs still running may
+        use them.
+
+        Args:
+            instance (str, optional): NetBox instance name to remove entries for,
+                removes entries for all instances if not provided.
+            branch (str, optional): Branch name to remove entries for, removes
+                entries for all branches of the instance if not provided.
+        """
+        with self.pynetbox_lock:
+            for cache_key in list(self.pynetbox_cache):
+                if instance is not None and cache_key[0] != instance:
+                    continue
+                if branch is not None and cache_key[1] != branch:
+                    continue
+                self.pynetbox_cache.pop(cache_key)
+
     def _get_diskcache(self) -> FanoutCache:
         """
         Creates and returns a FanoutCache object.
@@ -1223,3 +1359,109 @@ class NetboxWorker(
         unique_hosts = list(sorted(set(ret)))
         log.info(f"{self.name} - get_nornir_hosts resolved {len(unique_hosts)} host(s)")
         return unique_hosts
+
+    def collect_device_state(
+        self, job: Job, getters: dict, devices: List[str], timeout: int
+    ) -> None:
+        """
+        Collects live devices state for several parsers in one fan-out.
+
+        Submits Nornir ``parse_ttp`` job for each getter at once, waits for all
+        of them to complete and stores results in per-job devices state snapshot.
+        Sync tasks running within the same job retrieve data from snapshot using
+        ``get_device_state`` method instead of querying devices again. Getters
+        that returned no data not stored, ``get_device_state`` runs ``parse_ttp``
+        job for them instead.
+
+        Args:
+            job (Job): NorFab Job object, snapshot is bound to this job.
+            getters (dict): Dictionary keyed by getter name with ``parse_ttp``
+                arguments as values e.g. ``{"interfaces": {"get": "interfaces"}}``
+            devices (list): List of devices to collect state for.
+            timeout (int): Timeout value (in seconds) for the job execution.
+        """
+        futures = {
+            name: (
+                parse_kwargs,
+                self.client.submit_job(
+                    "nornir",
+                    "parse_ttp",
+                    kwargs={**parse_kwargs, "FL": devices},
+                    workers="all",
+                    timeout=timeout,
+                ),
+            )
+            for name, parse_kwargs in getters.items()
+        }
+        log.info(
+            f"{self.name} - collecting {', '.join(futures)} state for "
+            f"{len(devices)} device(s) in one pass"
+        )
+        snapshot = self.device_state.setdefault(job.juuid, [])
+        for name, (parse_kwargs, future) in futures.items():
+            data = future.result(timeout=timeout)
+            if data is None:
+                msg = f"failed to collect live {name} state, nornir parse_ttp returned no data"
+                log.warning(f"{self.name} - {msg}")
+                job.event(msg, severity="WARNING")
+                continue
+            snapshot.append(
+                {
+                    "kwargs": parse_kwargs,
+                    "devices": set(devices),
+                    "data": data,
+                }
+            )
+            job.event(f"collected live {name} state for {len(devices)} device(s)")
+
+    def get_device_state(
+        self, job: Job, devices: List[str], timeout: int, **parse_kwargs: Any
+    ) -> Union[None, dict]:
+        """
+        Retrieves live devices state using Nornir ``parse_ttp`` task.
+
+        Returns data from this job devices state snapshot if it was collected
+        beforehand by ``collect_device_state`` for the same ``parse_kwargs`` and
+        for all of the given devices, runs ``parse_ttp`` job otherwise.
+
+        Args:
+            job (Job): NorFab Job object.
+            devices (list): List of devices to retrieve state for.
+            timeout (int): Timeout value (in seconds) for the job execution.
+            **parse_kwargs: Nornir ``parse_ttp`` task arguments.
+
+        Returns:
+            dict: Nornir ``parse_ttp`` results keyed by Nornir worker name.
+        """
+        for entry in self.device_state.get(job.juuid, []):
+            if entry["kwargs"] != parse_kwargs or not entry["devices"].issuperset(
+                devices
+            ):
+                continue
+            ret = {}
+            for worker_name, worker_data in entry["data"].items():
+                ret[worker_name] = dict(worker_data)
+                if isinstance(worker_data.get("result"), dict):
+                    ret[worker_name]["result"] = {
+                        host: data
+                        for host, data in worker_data["result"].items()
+                        if host in devices
+                    }
+            return ret
+
+        return self.client.run_job(
+            "nornir",
+            "parse_ttp",
+            kwargs={**parse_kwargs, "FL": devices},
+            workers="all",
+            timeout=timeout,
+        )
+
+    def release_device_state(self, job: Job) -> None:
+        """
+        Deletes devices state snapshot collected for given job.
+
+        Args:
+            job (Job): NorFab Job object.
+        """
+        self.device_state.pop(job.juuid, None)
@@ -1,5 +1,7 @@
+import concurrent.futures
 import logging
-from typing import Union
+import time
+from typing import Any, Callable, Tuple, Union
 
 from norfab.core.worker import Job, Task
 from norfab.models import Result
@@ -14,6 +16,10 @@ log = logging.getLogger(__name__)
 
 
 class NetboxNornirInventoryTasks:
+    def _timed_fetch(self, getter: Callable, **kwargs: Any) -> Tuple[Result, float]:
+        """Run getter task with given arguments returning its result and duration"""
+        start_time = time.time()
+        return getter(**kwargs), time.time() - start_time
 
     @Task(
         input=GetNornirInventoryInput,
@@ -46,6 +52,9 @@ class NetboxNornirInventoryTasks:
         """
         Retrieve and construct Nornir inventory from NetBox data.
 
+        Interfaces, connections, circuits and BGP peerings data fetched concurrently
+        once devices retrieved, per-phase fetch durations reported in result messages.
+
         Args:
             job: NorFab Job object containing relevant metadata
             filters (list, optional): List of filters to apply when retrieving devices from NetBox.
@@ -75,10 +84,14 @@ class NetboxNornirInventoryTasks:
         devices = devices or []
         inventory = {"hosts": hosts}
         ret = Result(task=f"{self.name}:get_nornir_inventory", result=inventory)
+        timings = {}  # per-phase durations in seconds
+        start_time = time.time()
 
         # check Netbox status
         job.event(f"checking NetBox status for '{instance or self.default_instance}'")
-        netbox_status = self.get_netbox_status(job=job, instance=instance)
+        netbox_status, timings["status"] = self._timed_fetch(
+            self.get_netbox_status, job=job, instance=instance
+        )
         if netbox_status.result[instance or self.default_instance]["status"] is False:
             job.event(
                 "NetBox status check failed for Nornir inventory", severity="ERROR"
@@ -87,8 +100,13 @@ class NetboxNornirInventoryTasks:
 
         # retrieve devices data
         job.event("fetching devices data for Nornir inventory")
-        nb_devices = self.get_devices(
-            job=job, filters=filters, devices=devices, instance=instance, cache=cache
+        nb_devices, timings["devices"] = self._timed_fetch(
+            self.get_devices,
+            job=job,
+            filters=filters,
+            devices=devices,
+            instance=instance,
+            cache=cache,
         )
         if nb_devices.errors:
             job.event("failed to fetch devices for Nornir inventory", severity="ERROR")
@@ -127,95 +145,53 @@ class NetboxNornirInventoryTasks:
             job.event("no viable Nornir hosts returned by NetBox")
             return ret
 
-        # add interfaces data
-        if interfaces:
-            job.event(f"fetching interfaces for {len(hosts)} Nornir host(s)")
-            # decide on get_interfaces arguments
-            kwargs = interfaces if isinstance(interfaces, dict) else {}
-            kwargs.setdefault("cache", cache)
-            # add 'interfaces' key to all hosts' data
-            for host in hosts.values():
-                host["data"].setdefault("interfaces", {})
-            # query interfaces data from netbox
-            nb_interfaces = self.get_interfaces(
-                job=job, devices=list(hosts), instance=instance, **kwargs
-            )
-            if nb_interfaces.errors:
-                job.event(
-                    "interface retrieval completed with errors", severity="WARNING"
-                )
-                ret.errors.extend(nb_interfaces.errors)
-            # save interfaces data to hosts' inventory
-            while nb_interfaces.result:
-                device, device_interfaces = nb_interfaces.result.popitem()
-                hosts[device]["data"]["interfaces"] = device_interfaces
-
-        # add connections data
-        if connections:
-            job.event(f"fetching connections for {len(hosts)} Nornir host(s)")
-            # decide on get_interfaces arguments
-            kwargs = connections if isinstance(connections, dict) else {}
-            kwargs.setdefault("cache", cache)
-            # add 'connections' key to all hosts' data
-            for host in hosts.values():
-                host["data"].setdefault("connections", {})
-            # query connections data from netbox
-            nb_connections = self.get_connections(
-                job=job, devices=list(hosts), instance=instance, **kwargs
-            )
-            if nb_connections.errors:
-                job.event(
-                    "connection retrieval completed with errors", severity="WARNING"
-                )
-                ret.errors.extend(nb_connections.errors)
-            # save connections data to hosts' inventory
-            while nb_connections.result:
-                device, device_connections = nb_connections.result.popitem()
-                hosts[device]["data"]["connections"] = device_connections
-
-        # add circuits data
-        if circuits:
-            job.event(f"fetching circuits for {len(hosts)} Nornir host(s)")
-            # decide on get_interfaces arguments
-            kwargs = circuits if isinstance(circuits, dict) else {}
-            kwargs.setdefault("cache", cache)
-            # add 'circuits' key to all hosts' data
-            for host in hosts.values():
-                host["data"].setdefault("circuits", {})
-            # query circuits data from netbox
-            nb_circuits = self.get_circuits(
-                job=job, devices=list(hosts), instance=instance, **kwargs
-            )
-            if nb_circuits.errors:
-                job.event("circuit retrieval completed with errors", severity="WARNING")
-                ret.errors.extend(nb_circuits.errors)
-            # save circuits data to hosts' inventory
-            while nb_circuits.result:
-                device, device_circuits = nb_circuits.result.popitem()
-                hosts[device]["data"]["circuits"] = device_circuits
-
-        # add bgp peerings data
-        if bgp_peerings:
-            job.event(f"fetching BGP peerings for {len(hosts)} Nornir host(s)")
-            # decide on get_interfaces arguments
-            kwargs = bgp_peerings if isinstance(bgp_peerings, dict) else {}
-            kwargs.setdefault("cache", cache)
-            # add 'bgp_peerings' key to all hosts' data
-            for host in hosts.values():
-                host["data"].setdefault("bgp_peerings", {})
-            # query bgp_peerings data from netbox
-            nb_bgp_peerings = self.get_bgp_peerings(
-                job=job, devices=list(hosts), instance=instance, **kwargs
+        # fetch interfaces, connections, circuits and bgp peerings data concurrently
+        sub_fetches = {
+            name: (getter, params if isinstance(params, dict) else {})
+            for name, getter, params in [
+                ("interfaces", self.get_interfaces, interfaces),
+                ("connections", self.get_connections, connections),
+                ("circuits", self.get_circuits, circuits),
+                ("bgp_peerings", self.get_bgp_peerings, bgp_peerings),
+            ]
+            if params
+        }
+        if sub_fetches:
+            job.event(
+                f"fetching {', '.join(sub_fetches)} for {len(hosts)} Nornir host(s)"
             )
-            if nb_bgp_peerings.errors:
-                job.event(
-                    "BGP peering retrieval completed with errors", severity="WARNING"
-                )
-                ret.errors.extend(nb_bgp_peerings.errors)
-            # save circuits data to hosts' inventory
-            while nb_bgp_peerings.result:
-                device, device_bgp_peerings = nb_bgp_peerings.result.popitem()
-                hosts[device]["data"]["bgp_peerings"] = device_bgp_peerings
-
+            with concurrent.futures.ThreadPoolExecutor(
+                max_workers=len(sub_fetches)
+            ) as executor:
+                futures = {}
+                for name, (getter, kwargs) in sub_fetches.items():
+                    kwargs.setdefault("cache", cache)
+                    # add data key to all hosts' data
+                    for host in hosts.values():
+                        host["data"].setdefault(name, {})
+                    futures[name] = executor.submit(
+                        self._timed_fetch,
+                        getter,
+                        job=job,
+                        devices=list(hosts),
+                        instance=instance,
+                        **kwargs,
+                    )
+                for name, future in futures.items():
+                    sub_result, timings[name] = future.result()
+                    if sub_result.errors:
+                        job.event(
+                            f"{name} retrieval completed with errors",
+                            severity="WARNING",
+                        )
+                        ret.errors.extend(sub_result.errors)
+                    # save data to hosts' inventory
+                    for device, device_data in sub_result.result.items():
+                        hosts[device]["data"][name] = device_data
+
+        timings["total"] = time.time() - start_time
+        timings_msg = ", ".join(f"{k} {v:.2f}s" for k, v in timings.items())
+        ret.messages.append(f"timings: {timings_msg}")
+        log.info(f"{self.name} - get_nornir_inventory timings: {timings_msg}")
         job.event(f"Nornir inventory build complete: {len(hosts)} host(s)")
         return ret
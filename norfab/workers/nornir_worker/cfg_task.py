@@ -148,22 +148,11 @@ class CfgTask:
         nr = self._add_processors(filtered_nornir, kwargs, job)  # add processors
 
         # render config using Jinja2 on a per-host basis
-        jinja2_filters = self.add_jinja2_filters()
-        jinja2_netbox = self.add_jinja2_netbox()
-        jinja2_template_cache = {}
-        for host in nr.inventory.hosts.values():
-            rendered = self.jinja2_render_templates(
-                templates=config,
-                context={
-                    "host": host,
-                    "norfab": self.client,
-                    "job_data": job_data,
-                    "netbox": jinja2_netbox,
-                },
-                filters=jinja2_filters,
-                template_cache=jinja2_template_cache,
-            )
-            host.data["__task__"] = {"config": rendered}
+        rendered = self.jinja2_render_hosts(
+            nr.inventory.hosts.values(), templates=config, job_data=job_data
+        )
+        for host_name, host in nr.inventory.hosts.items():
+            host.data["__task__"] = {"config": rendered[host_name]}
 
         # run task
         log.debug(
@@ -175,7 +164,7 @@ class CfgTask:
             )
             ret.dry_run = True
         else:
-            with self.connections_lock:
+            with self.connections_lock.hosts(nr.inventory.hosts):
                 result = nr.run(task=task_plugin, **kwargs)
 
         ret.failed = result.failed  # failed is true if any of the hosts failed
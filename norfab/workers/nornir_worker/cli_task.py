@@ -394,22 +394,11 @@ class CliTask:
         # render commands using Jinja2 on a per-host basis
         if commands:
             commands = commands if isinstance(commands, list) else [commands]
-            jinja2_filters = self.add_jinja2_filters()
-            jinja2_netbox = self.add_jinja2_netbox()
-            jinja2_template_cache = {}
-            for host in nr.inventory.hosts.values():
-                rendered = self.jinja2_render_templates(
-                    templates=commands,
-                    context={
-                        "host": host,
-                        "norfab": self.client,
-                        "job_data": job_data,
-                        "netbox": jinja2_netbox,
-                    },
-                    filters=jinja2_filters,
-                    template_cache=jinja2_template_cache,
-                )
-                host.data["__task__"] = {"commands": rendered}
+            rendered = self.jinja2_render_hosts(
+                nr.inventory.hosts.values(), templates=commands, job_data=job_data
+            )
+            for host_name, host in nr.inventory.hosts.items():
+                host.data["__task__"] = {"commands": rendered[host_name]}
 
         # run task
         log.debug(
@@ -421,7 +410,7 @@ class CliTask:
             )
             ret.dry_run = True
         else:
-            with self.connections_lock:
+            with self.connections_lock.hosts(nr.inventory.hosts):
                 result = nr.run(task=task_plugin, **kwargs)
 
         ret.failed = result.failed  # failed is true if any of the hosts failed
@@ -102,7 +102,7 @@ class FileCopyTask:
             result = nr.run(task=nr_test, name="file_copy_dry_run", **kwargs)
             ret.dry_run = True
         else:
-            with self.connections_lock:
+            with self.connections_lock.hosts(nr.inventory.hosts):
                 result = nr.run(task=task_plugin, **kwargs)
 
         ret.failed = result.failed  # failed is true if any of the hosts failed
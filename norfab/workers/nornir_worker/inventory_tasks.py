@@ -170,6 +170,7 @@ class InventoryTasks:
             InventoryFun(
                 self.nr, call="delete_host", name=list(self.nr.inventory.hosts)
             )
+            self.hosts_index.rebuild()
 
         # Runtime inventory load calls create_host once for each returned NetBox host.
         inventory_actions = [
@@ -513,4 +514,6 @@ class InventoryTasks:
         # clean up kwargs
         _ = kwargs.pop("progress", None)
         job.event(f"performing '{action}' action")
-        return Result(result=InventoryFun(self.nr, call=action, **kwargs))
+        ret = Result(result=InventoryFun(self.nr, call=action, **kwargs))
+        self.hosts_index.apply(action, kwargs)
+        return ret
@@ -0,0 +1,261 @@
+"""
+Nornir worker hosts index - inverted index of Nornir inventory hosts used to
+narrow down hosts that Nornir-Salt ``FFun`` filters need to evaluate.
+"""
+
+import bisect
+import copy
+import fnmatch
+import ipaddress
+import logging
+import threading
+from typing import Any, Union
+
+from nornir.core.inventory import Hosts
+
+log = logging.getLogger(__name__)
+
+
+def _as_list(value: Any) -> list:
+    """Return filter value as a list of stripped strings, splitting strings by comma"""
+    if isinstance(value, str):
+        return [value] + [i.strip() for i in value.split(",") if i.strip()]
+    if isinstance(value, (list, tuple, set)):
+        return [str(i) for i in value]
+    return [str(value)]
+
+
+def _glob_prefix(pattern: str) -> str:
+    """Return literal prefix of glob pattern up to the first wildcard character"""
+    for index, char in enumerate(pattern):
+        if char in "*?[":
+            return pattern[:index]
+    return pattern
+
+
+class NornirHostsIndex:
+    """
+    Inverted index of Nornir inventory hosts by name, hostname, IP address,
+    platform and groups.
+
+    Index used to select candidate hosts for ``FL``, ``FB``, ``FH``, ``FM``,
+    ``FG`` and ``FP`` filters without iterating over all inventory hosts.
+    Candidates always is a superset of hosts matched by the filters, final
+    match done by Nornir-Salt ``FFun`` applied to Nornir view that contains
+    candidate hosts only, so that filtering results stay the same as when
+    filtering full inventory.
+
+    Filters evaluated against hosts' data, such as ``FO``, and negated
+    filters, ``FN``, are not indexed and leave candidates unchanged.
+
+    Args:
+        nr: Nornir object to index hosts of.
+    """
+
+    indexed_filters = ["FL", "FB", "FH", "FM", "FG", "FP"]
+    host_actions = [
+        "create_host",
+        "create",
+        "update_host",
+        "update",
+        "delete_host",
+        "delete",
+    ]
+    read_actions = [
+        "read_host",
+        "read",
+        "read_inventory",
+        "read_host_data",
+        "list_hosts",
+        "list_hosts_platforms",
+    ]
+
+    def __init__(self, nr: object) -> None:
+        self.nr = nr
+        self.lock = threading.Lock()
+        self.rebuild()
+
+    def rebuild(self) -> None:
+        """Index all Nornir inventory hosts"""
+        with self.lock:
+            self.hosts = {}  # host name -> indexed host attributes
+            self.names = []  # sorted list of (lowercased name, name)
+            self.hostnames = []  # sorted list of (lowercased hostname, name)
+            self.ips = {4: [], 6: []}  # sorted lists of (IP as integer, name)
+            self.not_ip = set()  # names of hosts with non IP address hostname
+            self.platforms = {}  # lowercased platform -> set of names
+            self.groups = {}  # group name -> set of names
+            for name, host in self.nr.inventory.hosts.items():
+                self._add(name, host)
+        log.debug(f"Indexed {len(self.hosts)} Nornir hosts")
+
+    def update(self, names: list) -> None:
+        """
+        Re-index given hosts, removing hosts that no longer exist in inventory.
+
+        Args:
+            names (list): Names of hosts to re-index.
+        """
+        with self.lock:
+            for name in names:
+                self._remove(name)
+                host = self.nr.inventory.hosts.get(name)
+                if host is not None:
+                    self._add(name, host)
+
+    def apply(self, action: str, kwargs: dict) -> None:
+        """
+        Update index after Nornir-Salt ``InventoryFun`` runtime inventory action.
+
+        Host actions re-index affected hosts only, actions that can change
+        other inventory objects, such as ``update_defaults``, rebuild index.
+
+        Args:
+            action (str): ``InventoryFun`` action name.
+            kwargs (dict): ``InventoryFun`` action arguments.
+        """
+        if action in self.read_actions:
+            return
+        if action == "load":
+            for item in kwargs.get("data") or []:
+                self.apply(item.get("call"), item)
+        elif action in self.host_actions and kwargs.get("name"):
+            names = kwargs["name"]
+            self.update([names] if isinstance(names, str) else names)
+        else:
+            self.rebuild()
+
+    def _add(self, name: str, host: object) -> None:
+        hostname = str(host.hostname or "")
+        platform = str(host.platform or "").lower()
+        groups = {g.name for g in host.extended_groups()}
+        self.hosts[name] = {
+            "hostname": hostname,
+            "platform": platform,
+            "groups": groups,
+            "ip": None,
+        }
+        bisect.insort(self.names, (name.lower(), name))
+        bisect.insort(self.hostnames, (hostname.lower(), name))
+        try:
+            ip = ipaddress.ip_address(hostname)
+            self.hosts[name]["ip"] = (ip.version, int(ip))
+            bisect.insort(self.ips[ip.version], (int(ip), name))
+        except ValueError:
+            self.not_ip.add(name)
+        self.platforms.setdefault(platform, set()).add(name)
+        for group in groups:
+            self.groups.setdefault(group, set()).add(name)
+
+    def _remove(self, name: str) -> None:
+        entry = self.hosts.pop(name, None)
+        if entry is None:
+            return
+        self._discard(self.names, (name.lower(), name))
+        self._discard(self.hostnames, (entry["hostname"].lower(), name))
+        if entry["ip"]:
+            version, ip = entry["ip"]
+            self._discard(self.ips[version], (ip, name))
+        self.not_ip.discard(name)
+        self.platforms.get(entry["platform"], set()).discard(name)
+        for group in entry["groups"]:
+            self.groups.get(group, set()).discard(name)
+
+    @staticmethod
+    def _discard(items: list, item: tuple) -> None:
+        index = bisect.bisect_left(items, item)
+        if index < len(items) and items[index] == item:
+            del items[index]
+
+    @staticmethod
+    def _prefix_match(items: list, patterns: list) -> Union[None, set]:
+        """Return names of sorted items that start with patterns' literal prefix"""
+        ret = set()
+        for pattern in patterns:
+            prefix = _glob_prefix(pattern).lower()
+            if not prefix:
+                return None
+            index = bisect.bisect_left(items, (prefix,))
+            while index < len(items) and items[index][0].startswith(prefix):
+                ret.add(items[index][1])
+                index += 1
+        return ret
+
+    def _ip_match(self, prefixes: list) -> Union[None, set]:
+        """Return names of hosts with IP address hostname within any of prefixes"""
+        ret = set(self.not_ip)
+        for prefix in prefixes:
+            try:
+                net = ipaddress.ip_network(prefix, strict=False)
+            except ValueError:
+                return None
+            items = self.ips[net.version]
+            start = bisect.bisect_left(items, (int(net[0]),))
+            end = bisect.bisect_right(items, (int(net[-1]), chr(0x10FFFF)))
+            ret.update(host_name for _, host_name in items[start:end])
+        return ret
+
+    def candidates(self, filters: dict) -> Union[None, set]:
+        """
+        Return names of hosts that can match given filters.
+
+        Args:
+            filters (dict): Nornir-Salt ``FFun`` filters.
+
+        Returns:
+            set of candidate host names or None if filters are not indexed.
+        """
+        if filters.get("FN") or not any(filters.get(f) for f in self.indexed_filters):
+            return None
+
+        ret = None
+        with self.lock:
+            for name, value in filters.items():
+                if not value or name not in self.indexed_filters:
+                    continue
+                values = _as_list(value)
+                if name == "FL":
+                    # FL "_all_" value matches all hosts
+                    if "_all_" in values:
+                        continue
+                    matched = {i for i in values if i in self.hosts}
+                elif name == "FB":
+                    matched = self._prefix_match(self.names, values)
+                elif name == "FH":
+                    matched = self._prefix_match(self.hostnames, values)
+                elif name == "FM":
+                    matched = set()
+                    for platform, hosts in self.platforms.items():
+                        if any(fnmatch.fnmatch(platform, v.lower()) for v in values):
+                            matched.update(hosts)
+                elif name == "FG":
+                    matched = set()
+                    for group in values:
+                        matched.update(self.groups.get(group, set()))
+                elif name == "FP":
+                    matched = self._ip_match(values)
+                if matched is None:
+                    continue
+                ret = matched if ret is None else ret & matched
+                if not ret:
+                    break
+
+        return ret
+
+    def view(self, names: set) -> object:
+        """
+        Return Nornir object that contains given hosts only.
+
+        Args:
+            names (set): Names of hosts to include.
+
+        Returns:
+            Nornir object sharing data, runner and processors with indexed
+            Nornir object.
+        """
+        hosts = self.nr.inventory.hosts
+        inventory = copy.copy(self.nr.inventory)
+        inventory.hosts = Hosts({n: hosts[n] for n in names if n in hosts})
+        nr = copy.copy(self.nr)
+        nr.inventory = inventory
+        return nr
@@ -1,14 +1,19 @@
+import concurrent.futures
+import copy
 import importlib.metadata
 import ipaddress
 import logging
 import os
 import sys
 import time
-from threading import Lock
-from typing import Any, Dict, Tuple
+from contextlib import contextmanager
+from threading import Condition, Lock
+from typing import Any, Dict, Iterable, Tuple
 
 import yaml
 from nornir import InitNornir
+from nornir.core.inventory import Hosts
+from nornir.core.state import GlobalState
 from nornir_salt.plugins.functions import (
     FFun,
     FFun_functions,
@@ -35,6 +40,7 @@ from .file_copy_task import FileCopyTask
 from .inventory_tasks import InventoryTasks
 from .netconf_task import NetconfTask
 from .network_task import NetworkTask
+from .nornir_hosts_index import NornirHostsIndex
 from .nornir_models import (
     GetVersionInput,
     GetVersionResult,
@@ -43,7 +49,7 @@ from .nornir_models import (
     RefreshNornirInput,
     RefreshNornirResult,
 )
-from .parse_task import ParseTask
+from .parse_task import TTP_TEMPLATES, ParseTask
 from .snmp_task import SnmpTask
 from .task_task import TaskTask
 from .test_task import TestTask
@@ -58,6 +64,91 @@ log = logging.getLogger(__name__)
 # --------------------------------------------------------------------------
 
 
+# ----------------------------------------------------------------------
+# Nornir Service connections lock class
+# -----------------------------------------------------------------------
+
+
+class ConnectionsLock:
+    """
+    Lock to coordinate access to Nornir hosts connections.
+
+    Jobs use ``hosts`` context manager to access connections of given hosts,
+    serializing access to the same host connections only, jobs that work with
+    different hosts run in parallel. Watchdog and Nornir re-initialization
+    acquire the lock exclusively using ``acquire`` and ``release`` methods or
+    ``with`` statement, waiting for running jobs to complete.
+    """
+
+    def __init__(self) -> None:
+        self.condition = Condition()
+        self.jobs = 0  # number of jobs accessing hosts connections
+        self.exclusive = False
+        self.exclusive_waiting = 0
+        self.hosts_locks = {}
+
+    def acquire(self, blocking: bool = True) -> bool:
+        """
+        Acquire the lock exclusively.
+
+        Args:
+            blocking (bool): If False, return immediately if lock is in use.
+
+        Returns:
+            bool: True if lock acquired, False otherwise.
+        """
+        with self.condition:
+            if not blocking and (self.exclusive or self.jobs):
+                return False
+            self.exclusive_waiting += 1
+            while self.exclusive or self.jobs:
+                self.condition.wait()
+            self.exclusive_waiting -= 1
+            self.exclusive = True
+            # no jobs running, safe to drop locks of hosts that might be gone
+            self.hosts_locks.clear()
+            return True
+
+    def release(self) -> None:
+        with self.condition:
+            self.exclusive = False
+            self.condition.notify_all()
+
+    def __enter__(self) -> "ConnectionsLock":
+        self.acquire()
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        self.release()
+
+    @contextmanager
+    def hosts(self, names: Iterable[str]):
+        """
+        Context manager to access connections of given hosts.
+
+        Args:
+            names (list): Names of hosts to access connections of.
+        """
+        with self.condition:
+            while self.exclusive or self.exclusive_waiting:
+                self.condition.wait()
+            self.jobs += 1
+            # sort hosts to always acquire their locks in the same order
+            locks = [self.hosts_locks.setdefault(n, Lock()) for n in sorted(names)]
+        acquired = []
+        try:
+            for lock in locks:
+                lock.acquire()
+                acquired.append(lock)
+            yield
+        finally:
+            for lock in acquired:
+                lock.release()
+            with self.condition:
+                self.jobs -= 1
+                self.condition.notify_all()
+
+
 # ----------------------------------------------------------------------
 # Nornir Service watchdog class
 # -----------------------------------------------------------------------
@@ -327,14 +418,19 @@ class NornirWorker(
     Attributes:
         init_done_event (threading.Event): Event to signal initialization completion.
         tf_base_path (str): Base path for files folder saved using `tf` processor.
-        connections_lock (threading.Lock): Lock for managing connections.
+        connections_lock (ConnectionsLock): Lock for managing connections.
         nornir_inventory (dict): Inventory data for Nornir.
         watchdog (WatchDog): Watchdog instance for monitoring.
+        ttp_pool (ProcessPoolExecutor): TTP parsing processes pool, started on first use.
+        ttp_pool_lock (Lock): Lock to start TTP parsing processes pool only once.
+        hosts_index (NornirHostsIndex): Nornir hosts index used to speed up hosts filtering.
     """
 
     nr = None
+    hosts_index = None
     nornir_inventory = {}
     autostart_watchdog = False
+    ttp_pool = None
 
     def __init__(
         self,
@@ -356,10 +452,12 @@ class NornirWorker(
         )
 
         # misc attributes
-        self.connections_lock = Lock()
+        self.connections_lock = ConnectionsLock()
+        self.ttp_pool_lock = Lock()
 
         # initiate Nornir
         self.refresh_nornir(job=Job())
+        TTP_TEMPLATES.maxsize = self.nornir_worker_inventory.get("ttp_cache_size", 64)
 
         # initiate watchdog
         self.watchdog = WatchDog(self)
@@ -383,11 +481,15 @@ class NornirWorker(
 
         For each hook, it calls the function specified in the hook, passing the current
         instance (`self`) as the first argument, followed by any additional positional
-        and keyword arguments specified in the hook.
+        and keyword arguments specified in the hook. Stops TTP parsing
+        processes pool if it was started.
         """
         # run exit hooks
         for f in self.inventory.hooks.get("nornir-exit", []):
             f["function"](self, *f.get("args", []), **f.get("kwargs", {}))
+        # stop TTP parsing processes
+        if self.ttp_pool is not None:
+            self.ttp_pool.shutdown(wait=False, cancel_futures=True)
 
     def init_nornir(self, inventory: dict) -> None:
         """
@@ -419,6 +521,7 @@ class NornirWorker(
                 },
                 user_defined=inventory.get("user_defined", {}),
             )
+            self.hosts_index = NornirHostsIndex(self.nr)
 
     def filter_hosts_and_validate(
         self, kwargs: Dict[str, Any], ret: Result
@@ -426,13 +529,28 @@ class NornirWorker(
         """
         Helper method to filter hosts and validate results.
 
+        Hosts index used to narrow down hosts that filters need to evaluate,
+        index rebuilt if it is out of sync with Nornir inventory. Filtered
+        Nornir is a per-job view of worker Nornir object produced by
+        ``nornir_job_view`` method.
+
         Returns:
             tuple: (filtered_nornir, Result) where Result status set to
                 `no_match` if no hosts matched.
         """
-        self.nr.data.reset_failed_hosts()  # reset failed hosts before filtering
         filters = {k: kwargs.pop(k) for k in list(kwargs.keys()) if k in FFun_functions}
-        filtered_nornir = FFun(self.nr, **filters)
+        if (
+            self.hosts_index is None
+            or self.hosts_index.nr is not self.nr
+            or len(self.hosts_index.hosts) != len(self.nr.inventory.hosts)
+        ):
+            self.hosts_index = NornirHostsIndex(self.nr)
+        candidates = self.hosts_index.candidates(filters)
+        if candidates is None:
+            filtered_nornir = FFun(self.nr, **filters)
+        else:
+            filtered_nornir = FFun(self.hosts_index.view(candidates), **filters)
+        filtered_nornir = self.nornir_job_view(filtered_nornir)
 
         if not filtered_nornir.inventory.hosts:
             msg = (
@@ -444,6 +562,34 @@ class NornirWorker(
 
         return filtered_nornir, ret
 
+    def nornir_job_view(self, nr: Any) -> Any:
+        """
+        Create copy-on-write view of Nornir object for a job to run tasks with.
+
+        View has its own runner, failed hosts state and copies of hosts with
+        their own data dictionaries, so that concurrent jobs do not share
+        runner job binding, failed hosts or per-job hosts data. Hosts copies
+        share connections with worker Nornir object hosts.
+
+        Args:
+            nr (Nornir): Nornir object to create view for.
+
+        Returns:
+            Nornir: Nornir object view.
+        """
+        hosts = Hosts()
+        for name, host in nr.inventory.hosts.items():
+            job_host = copy.copy(host)
+            job_host.data = dict(host.data)
+            hosts[name] = job_host
+        inventory = copy.copy(nr.inventory)
+        inventory.hosts = hosts
+        job_nr = copy.copy(nr)
+        job_nr.inventory = inventory
+        job_nr.data = GlobalState(dry_run=nr.data.dry_run)
+        job_nr.runner = copy.copy(nr.runner)
+        return job_nr
+
     def _add_processors(self, nr: Any, kwargs: Dict[str, Any], job: Job) -> Any:
         """
         Add various processors to the Nornir object based on the provided keyword arguments.
@@ -774,6 +920,59 @@ class NornirWorker(
             "network_hosts": self.jinja2_network_hosts,
         }
 
+    def jinja2_render_hosts(
+        self, hosts: Iterable, templates: list, job_data: Any = None
+    ) -> Dict:
+        """
+        Renders Jinja2 templates on a per-host basis.
+
+        Templates downloaded and compiled once and shared by all hosts. Hosts
+        rendered one by one unless ``jinja2_render_workers`` set to more than
+        one, in which case hosts rendered concurrently, this speeds up
+        rendering of templates that call NetBox or other services for large
+        number of hosts but renders hosts in no particular order.
+
+        Args:
+            hosts (Iterable): Nornir host objects to render templates for.
+            templates (list): Jinja2 templates or NorFab file URLs to render.
+            job_data (Any): Job data available in templates as ``job_data``.
+
+        Returns:
+            dict: Rendered templates keyed by host name.
+        """
+        hosts = list(hosts)
+        filters = self.add_jinja2_filters()
+        netbox = self.add_jinja2_netbox()
+        template_cache = {}
+
+        def render(host: object) -> str:
+            return self.jinja2_render_templates(
+                templates=templates,
+                context={
+                    "host": host,
+                    "norfab": self.client,
+                    "job_data": job_data,
+                    "netbox": netbox,
+                },
+                filters=filters,
+                template_cache=template_cache,
+            )
+
+        ret = {}
+        render_workers = self.nornir_worker_inventory.get("jinja2_render_workers", 1)
+        if render_workers < 2 or len(hosts) < 3:
+            for host in hosts:
+                ret[host.name] = render(host)
+            return ret
+
+        # render first host to download and compile templates only once
+        ret[hosts[0].name] = render(hosts[0])
+        with concurrent.futures.ThreadPoolExecutor(render_workers) as executor:
+            for host, rendered in zip(hosts[1:], executor.map(render, hosts[1:])):
+                ret[host.name] = rendered
+
+        return ret
+
     # ----------------------------------------------------------------------
     # Nornir Service Functions that exposed for calling
     # ----------------------------------------------------------------------
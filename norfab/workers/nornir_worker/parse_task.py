@@ -1,4 +1,10 @@
+import concurrent.futures
+import copy
+import hashlib
 import logging
+import multiprocessing
+import threading
+from collections import OrderedDict
 from typing import Any, Union
 
 from nornir_salt.plugins.functions import FFun_functions
@@ -21,10 +27,88 @@ log = logging.getLogger(__name__)
 
 
 # --------------------------------------------------------------------------
-# PARSE TASK MODELS
+# TTP TEMPLATES CACHE
 # --------------------------------------------------------------------------
 
 
+class TTPTemplatesCache:
+    """
+    LRU cache of TTP templates inputs load.
+
+    Templates keyed by template content hash, cached inputs load used to
+    collect commands to run on devices without compiling template for every
+    job. Each host output parsed by a fresh TTP parser object, so no template
+    variables or results carried over between hosts.
+
+    Args:
+        maxsize: Maximum number of cached templates.
+    """
+
+    def __init__(self, maxsize: int = 64) -> None:
+        self.maxsize = maxsize
+        self.templates = OrderedDict()
+        self.lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, template: str) -> dict:
+        """Return cached template entry, compiling template on cache miss."""
+        key = hashlib.sha256(template.encode(encoding="utf-8")).hexdigest()
+        with self.lock:
+            if key in self.templates:
+                self.templates.move_to_end(key)
+                self.hits += 1
+                return self.templates[key]
+        parser = ttp(template=template, log_level="ERROR")
+        entry = {
+            "template": template,
+            "input_load": copy.deepcopy(parser.get_input_load()),
+        }
+        with self.lock:
+            self.misses += 1
+            entry = self.templates.setdefault(key, entry)
+            while len(self.templates) > self.maxsize:
+                self.templates.popitem(last=False)
+        return entry
+
+    def parse(
+        self,
+        template: str,
+        data: str,
+        input_name: str,
+        template_name: str,
+        structure: str,
+    ) -> Any:
+        """Parse data using fresh TTP parser and return results."""
+        parser = ttp(template=self.get(template)["template"], log_level="ERROR")
+        parser.add_input(data=data, input_name=input_name, template_name=template_name)
+        # run parsing in single process
+        parser.parse(one=True)
+        return parser.result(structure=structure, templates=template_name)
+
+
+TTP_TEMPLATES = TTPTemplatesCache()
+
+
+def ttp_parse_init(maxsize: int) -> None:
+    """TTP parsing process pool initializer to size templates cache."""
+    TTP_TEMPLATES.maxsize = maxsize
+
+
+def ttp_parse(
+    hname: str,
+    template: str,
+    data: str,
+    input_name: str,
+    template_name: str,
+    structure: str,
+) -> tuple:
+    """Parse single host output, runs in TTP parsing process pool."""
+    return hname, TTP_TEMPLATES.parse(
+        template, data, input_name, template_name, structure
+    )
+
+
 # --------------------------------------------------------------------------------------
 # PARSE TASKS
 # --------------------------------------------------------------------------------------
@@ -215,8 +299,8 @@ class ParseTask:
 
         # go over template's inputs and collect commands to fetch from devices
         cli_runs = []
-        parser = ttp(template=template, log_level="ERROR")
-        for template_name, inputs in parser.get_input_load().items():
+        input_load = TTP_TEMPLATES.get(template)["input_load"]
+        for template_name, inputs in copy.deepcopy(input_load).items():
             inputs = inputs or {"Default_Input": {}}
             for input_name, input_params in inputs.items():
                 cli_runs.append(
@@ -259,7 +343,9 @@ class ParseTask:
                 if not result.result or not isinstance(result.result, dict):
                     continue
             # parse commands output for each host
-            for hname, hres in result.result.items():
+            parse_inputs = []
+            while result.result:
+                hname, hres = result.result.popitem()
                 input_data = []
                 for cmdname, cmdres in hres.items():
                     if cmdres["failed"]:
@@ -269,19 +355,8 @@ class ParseTask:
                         job.event(msg, severity="ERROR")
                         continue
                     input_data.append(cmdres["result"])
-                # parse command results
                 if input_data:
-                    parser = ttp(template=template, log_level="ERROR")
-                    parser.add_input(
-                        data="\n\n".join(input_data),
-                        input_name=cli_run["input_name"],
-                        template_name=cli_run["template_name"],
-                    )
-                    # run parsing in single process
-                    parser.parse(one=True)
-                    ret.result[hname] = parser.result(
-                        structure=structure, templates=cli_run["template_name"]
-                    )
+                    parse_inputs.append((hname, "\n\n".join(input_data)))
                 else:
                     msg = f"No input data collected for '{hname}' device"
                     log.error(msg)
@@ -289,6 +364,11 @@ class ParseTask:
                     job.event(msg, severity="ERROR")
                     if strict:
                         raise RuntimeError(msg)
+            # parse command results
+            for hname, hresult in self.ttp_parse_hosts(
+                parse_inputs, template, cli_run, structure
+            ):
+                ret.result[hname] = hresult
 
         # if strict - check hosts parsing results and raise error if empty
         if strict:
@@ -301,3 +381,55 @@ class ParseTask:
             ret.failed = True
 
         return ret
+
+    def ttp_parse_hosts(
+        self, parse_inputs: list, template: str, cli_run: dict, structure: str
+    ) -> Any:
+        """
+        Parse hosts output with TTP template, yielding ``(hname, result)`` tuples.
+
+        Output parsed in the job thread unless nornir worker inventory
+        ``ttp_processes`` is a positive number and there is more than one host
+        to parse, in which case hosts output parsed in a pool of worker
+        processes keeping at most two hosts per process in flight.
+
+        Args:
+            parse_inputs: List of ``(hname, data)`` tuples, consumed while parsing.
+            template: TTP template content.
+            cli_run: TTP template input details.
+            structure: TTP results structure.
+        """
+        params = {
+            "template": template,
+            "input_name": cli_run["input_name"],
+            "template_name": cli_run["template_name"],
+            "structure": structure,
+        }
+        processes = self.nornir_worker_inventory.get("ttp_processes", 0)
+        if not processes or len(parse_inputs) < 2:
+            while parse_inputs:
+                hname, data = parse_inputs.pop()
+                yield ttp_parse(hname, data=data, **params)
+            return
+
+        if self.ttp_pool is None:
+            with self.ttp_pool_lock:
+                if self.ttp_pool is None:
+                    self.ttp_pool = concurrent.futures.ProcessPoolExecutor(
+                        max_workers=processes,
+                        mp_context=multiprocessing.get_context("spawn"),
+                        initializer=ttp_parse_init,
+                        initargs=(TTP_TEMPLATES.maxsize,),
+                    )
+        in_flight = set()
+        while parse_inputs or in_flight:
+            while parse_inputs and len(in_flight) < processes * 2:
+                hname, data = parse_inputs.pop()
+                in_flight.add(
+                    self.ttp_pool.submit(ttp_parse, hname, data=data, **params)
+                )
+            done, in_flight = concurrent.futures.wait(
+                in_flight, return_when=concurrent.futures.FIRST_COMPLETED
+            )
+            for future in done:
+                yield future.result()
@@ -93,7 +93,7 @@ class SnmpTask:
 
         nr = self._add_processors(filtered_nornir, kwargs, job)
 
-        with self.connections_lock:
+        with self.connections_lock.hosts(nr.inventory.hosts):
             result = nr.run(task=puresnmp_call, call=call, **kwargs)
 
         ret.failed = result.failed
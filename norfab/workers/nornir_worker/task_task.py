@@ -113,7 +113,7 @@ class TaskTask:
 
         # run task
         log.debug(f"{self.name} - running Nornir task '{plugin}', kwargs '{kwargs}'")
-        with self.connections_lock:
+        with self.connections_lock.hosts(nr.inventory.hosts):
             result = nr.run(task=task_function, **kwargs)
 
         ret.failed = result.failed  # failed is true if any of the hosts failed
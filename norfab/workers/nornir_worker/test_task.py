@@ -114,26 +114,16 @@ class TestTask:
         job_data = self.load_job_data(job_data)
 
         # generate per-host test suites
-        jinja2_filters = self.add_jinja2_filters()
-        jinja2_netbox = self.add_jinja2_netbox()
-        jinja2_template_cache = {}
-        for host_name, host in filtered_nornir.inventory.hosts.items():
-            # render suite using Jinja2
-            try:
-                rendered_suite = self.jinja2_render_templates(
-                    templates=[suite],
-                    context={
-                        "host": host,
-                        "norfab": self.client,
-                        "job_data": job_data,
-                        "netbox": jinja2_netbox,
-                    },
-                    filters=jinja2_filters,
-                    template_cache=jinja2_template_cache,
-                )
-            except Exception as e:
-                msg = f"{self.name} - '{suite}' Jinja2 rendering failed: '{type(e).__name__}:{e}'"
-                raise RuntimeError(msg) from e
+        try:
+            rendered_suites = self.jinja2_render_hosts(
+                filtered_nornir.inventory.hosts.values(),
+                templates=[suite],
+                job_data=job_data,
+            )
+        except Exception as e:
+            msg = f"{self.name} - '{suite}' Jinja2 rendering failed: '{type(e).__name__}:{e}'"
+            raise RuntimeError(msg) from e
+        for host_name, rendered_suite in rendered_suites.items():
             # load suit using YAML
             try:
                 tests[host_name] = yaml.safe_load(rendered_suite) or []
@@ -6,6 +6,7 @@ from typing import Any, Dict, Tuple, Union
 
 import yaml
 
+from norfab.core.client import JobStatus
 from norfab.core.worker import Job, NFPWorker, Task
 from norfab.models import Result
 
@@ -287,6 +288,57 @@ class WorkflowWorker(NFPWorker):
                     return True  # stop the workflow since a failure occurred
         return False
 
+    def missing_results_check(
+        self, future: object, result: dict, step: str, data: dict
+    ) -> dict:
+        """
+        Forms failed results for step job workers that did not return results
+        because job timed out or failed.
+
+        Args:
+            future (NFPJobFuture): Step job future object.
+            result (dict): The results dictionary for given step collected so far.
+            step (str): The name of the step.
+            data (dict): A dictionary containing step data.
+
+        Returns:
+            dict: Failed results keyed by worker name, ``all-workers`` key used
+                if job was not dispatched to any of the workers, empty dictionary
+                if all workers returned results.
+        """
+        job_info = self.client.job_db.get_job(future.uuid, include_results=False)
+        if job_info and job_info["status"] == JobStatus.COMPLETED:
+            return {}
+
+        if future.done_event.is_set():
+            status = job_info["status"].lower() if job_info else "failed"
+            reason = "; ".join(str(e) for e in (job_info or {}).get("errors", []))
+            reason = reason or f"job {status}"
+        else:
+            status = "timeout"
+            reason = f"{data.get('timeout', 600)}s timeout exceeded"
+
+        dispatched = (job_info or {}).get("workers_dispatched") or []
+        missing = [w for w in dispatched if w not in result]
+        if not dispatched and not result:
+            missing = ["all-workers"]
+
+        return {
+            worker_name: {
+                "failed": True,
+                "result": None,
+                "status": status,
+                "task": data["task"],
+                "errors": [
+                    f"workflow step '{step}' worker '{worker_name}' returned "
+                    f"no results, {reason}"
+                ],
+                "messages": [],
+                "juuid": future.uuid,
+            }
+            for worker_name in missing
+        }
+
     @Task(
         input=RunInput,
         output=RunResult,
@@ -376,7 +428,8 @@ class WorkflowWorker(NFPWorker):
 
             job.event(f"doing workflow step '{step}'")
 
-            ret.result[workflow_name][step] = self.client.run_job(
+            ret.result[workflow_name][step] = {}
+            future = self.client.submit_job(
                 service=data["service"],
                 task=data["task"],
                 workers=data.get("workers", "all"),
@@ -384,6 +437,23 @@ class WorkflowWorker(NFPWorker):
                 args=data.get("args", []),
                 timeout=data.get("timeout", 600),
             )
+            for worker_name, worker_result in future.iter_results(
+                timeout=data.get("timeout", 600)
+            ):
+                ret.result[workflow_name][step][worker_name] = worker_result
+                job.event(
+                    f"workflow step '{step}' worker '{worker_name}' completed",
+                    severity="ERROR" if worker_result.get("failed") else "INFO",
+                )
+
+            # record workers that did not return results as failed
+            missing_results = self.missing_results_check(
+                future, ret.result[workflow_name][step], step, data
+            )
+            for worker_name, worker_result in missing_results.items():
+                ret.result[workflow_name][step][worker_name] = worker_result
+                job.event(worker_result["errors"][0], severity="ERROR")
+                log.error(f"{self.name} - {worker_result['errors'][0]}")
 
             # check if need to stop workflow based on stop_if_fail flag
             if (
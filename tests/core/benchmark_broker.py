@@ -0,0 +1,173 @@
+"""
+NorFab broker routing benchmark.
+
+Starts broker process in ``classic`` and ``threaded`` modes, connects a
+number of emulated workers and clients to it and measures how many jobs and
+messages per second broker can route. Each job is five broker messages -
+client POST, 202 DISPATCHED to client, POST to worker, worker RESPONSE and
+RESPONSE to client.
+
+Usage:
+
+    python benchmark_broker.py --workers 150 --clients 4 --duration 10
+"""
+
+import argparse
+import multiprocessing
+import tempfile
+import time
+import uuid
+
+import zmq
+
+from norfab.core import NFP
+from norfab.core.inventory import NorFabInventory
+from norfab.core.nfapi import start_broker_process
+
+MESSAGES_PER_JOB = 5
+
+
+def run_workers(endpoint: str, count: int, exit_event) -> None:
+    """Emulate workers that reply to every POST with 200 RESPONSE"""
+    ctx = zmq.Context()
+    poller = zmq.Poller()
+    workers = []
+    for i in range(count):
+        socket = ctx.socket(zmq.DEALER)
+        socket.identity = f"bench-worker-{i}".encode()
+        socket.connect(endpoint)
+        socket.send_multipart(NFP.MessageBuilder.worker_to_broker_ready(b"bench"))
+        poller.register(socket, zmq.POLLIN)
+        workers.append(socket)
+
+    keepalive_at = 0
+    while not exit_event.is_set():
+        if time.time() > keepalive_at:
+            for socket in workers:
+                socket.send_multipart(
+                    NFP.MessageBuilder.worker_to_broker_keepalive(b"bench")
+                )
+            keepalive_at = time.time() + 1
+        for socket, _ in poller.poll(100):
+            while True:
+                try:
+                    msg = socket.recv_multipart(zmq.NOBLOCK)
+                except zmq.Again:
+                    break
+                # empty, header, command, sender, empty, uuid, data
+                if msg[2] == NFP.POST:
+                    socket.send_multipart(
+                        NFP.MessageBuilder.worker_to_broker_response(
+                            [msg[3], b"", msg[5], b"200", b"{}"]
+                        )
+                    )
+    ctx.destroy(0)
+
+
+def run_client(endpoint: str, duration: float, window: int, results) -> None:
+    """Submit jobs keeping ``window`` jobs in flight, count completed jobs"""
+    ctx = zmq.Context()
+    socket = ctx.socket(zmq.DEALER)
+    socket.identity = f"bench-client-{uuid.uuid4().hex}".encode()
+    socket.connect(endpoint)
+    in_flight = 0
+    completed = 0
+    deadline = time.time() + duration
+    while time.time() < deadline:
+        while in_flight < window:
+            socket.send_multipart(
+                NFP.MessageBuilder.client_to_broker_post(
+                    NFP.POST, b"bench", b"any", uuid.uuid4().hex.encode(), b"{}"
+                )
+            )
+            in_flight += 1
+        if socket.poll(100):
+            while True:
+                try:
+                    msg = socket.recv_multipart(zmq.NOBLOCK)
+                except zmq.Again:
+                    break
+                # empty, header, command, service, uuid, status, data
+                if msg[5] == b"200":
+                    completed += 1
+                    in_flight -= 1
+                elif msg[5] != b"202":
+                    in_flight -= 1
+    results.put(completed)
+    ctx.destroy(0)
+
+
+def benchmark(mode: str, args) -> float:
+    base_dir = tempfile.mkdtemp(prefix=f"norfab-bench-{mode}-")
+    endpoint = f"tcp://127.0.0.1:{args.port}"
+    inventory = NorFabInventory(
+        data={
+            "broker": {"endpoint": endpoint, "zmq_auth": False, "mode": mode},
+            "logging": {"handlers": {"terminal": {"level": "ERROR"}}},
+        },
+        base_dir=base_dir,
+    )
+    exit_event = multiprocessing.Event()
+    workers_exit_event = multiprocessing.Event()
+    init_done_event = multiprocessing.Event()
+    results = multiprocessing.Queue()
+
+    broker = multiprocessing.Process(
+        target=start_broker_process,
+        kwargs={
+            "endpoint": endpoint,
+            "exit_event": exit_event,
+            "inventory": inventory,
+            "log_level": "ERROR",
+            "init_done_event": init_done_event,
+        },
+    )
+    broker.start()
+    init_done_event.wait(timeout=30)
+
+    workers = multiprocessing.Process(
+        target=run_workers, args=(endpoint, args.workers, workers_exit_event)
+    )
+    workers.start()
+    time.sleep(2)  # let workers register with broker
+
+    clients = [
+        multiprocessing.Process(
+            target=run_client, args=(endpoint, args.duration, args.window, results)
+        )
+        for _ in range(args.clients)
+    ]
+    for client in clients:
+        client.start()
+    completed = sum(results.get() for _ in clients)
+    for client in clients:
+        client.join()
+
+    workers_exit_event.set()
+    workers.join()
+    exit_event.set()
+    broker.join()
+
+    jobs_per_second = completed / args.duration
+    print(
+        f"{mode:>8} mode: {completed} jobs, {jobs_per_second:.0f} jobs/s, "
+        f"{jobs_per_second * MESSAGES_PER_JOB:.0f} messages/s"
+    )
+    return jobs_per_second
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="NorFab broker benchmark")
+    parser.add_argument("--workers", type=int, default=150)
+    parser.add_argument("--clients", type=int, default=4)
+    parser.add_argument("--duration", type=float, default=10)
+    parser.add_argument("--window", type=int, default=100)
+    parser.add_argument("--port", type=int, default=5599)
+    parser.add_argument(
+        "--modes", nargs="+", default=["classic", "threaded"], help="broker modes"
+    )
+    args = parser.parse_args()
+
+    ret = {mode: benchmark(mode, args) for mode in args.modes}
+    if "classic" in ret and "threaded" in ret and ret["classic"]:
+        print(f"threaded / classic: {ret['threaded'] / ret['classic']:.2f}x")
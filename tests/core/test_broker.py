@@ -1,9 +1,13 @@
 import threading
+import time
 
 import pytest
+import zmq
 
 from norfab.core import NFP
 from norfab.core.broker import NFPBroker
+from norfab.core.inventory import NorFabInventory
+from norfab.core.keepalives import KeepAliver, KeepAliveScheduler
 
 pytestmark = pytest.mark.core
 
@@ -19,7 +23,11 @@ class DummySocket:
 def make_broker():
     broker = NFPBroker.__new__(NFPBroker)
     broker.socket = DummySocket()
+    broker.tx_socket = broker.socket
     broker.socket_lock = threading.Lock()
+    broker.state_lock = threading.RLock()
+    broker.mode = "classic"
+    broker.keepalive_scheduler = None
     broker.multiplier = 6
     broker.keepalive = 2500
     broker.workers = {}
@@ -36,3 +44,134 @@ def test_require_worker_handles_binary_address():
 
     assert worker.address == address
     assert broker.workers[address] is worker
+
+
+def test_keepalive_scheduler_sends_keepalives_and_expires():
+    expired = []
+    socket = DummySocket()
+    scheduler = KeepAliveScheduler(
+        exit_event=threading.Event(), name="test", on_expire=expired.append
+    )
+    keepaliver = KeepAliver(
+        address=b"worker-1",
+        socket=socket,
+        multiplier=4,
+        keepalive=50,
+        exit_event=None,
+        service=b"bench",
+        whoami=NFP.BROKER,
+        name="test",
+        socket_lock=threading.Lock(),
+        scheduler=scheduler,
+    )
+    scheduler.start()
+    try:
+        keepaliver.start()
+        assert keepaliver.keepalive_thread is None
+        time.sleep(0.15)
+        keepaliver.received_heartbeat([b"worker-1"])
+        assert keepaliver.is_alive()
+        assert expired == []
+        time.sleep(0.4)
+    finally:
+        scheduler.stop()
+
+    assert expired == [keepaliver]
+    assert not keepaliver.is_alive()
+    assert keepaliver.keepalives_send >= 3
+    assert socket.sent[0] == [b"worker-1", b"", NFP.BROKER, NFP.KEEPALIVE, b"bench"]
+    assert keepaliver not in scheduler.keepalivers
+
+
+def test_keepalive_scheduler_remove_stops_keepalives():
+    socket = DummySocket()
+    scheduler = KeepAliveScheduler(exit_event=threading.Event(), name="test")
+    keepaliver = KeepAliver(
+        address=b"worker-1",
+        socket=socket,
+        multiplier=4,
+        keepalive=20,
+        exit_event=None,
+        service=b"bench",
+        whoami=NFP.BROKER,
+        name="test",
+        socket_lock=threading.Lock(),
+        scheduler=scheduler,
+    )
+    scheduler.start()
+    try:
+        keepaliver.start()
+        time.sleep(0.1)
+        keepaliver.stop()
+        sent = len(socket.sent)
+        time.sleep(0.1)
+    finally:
+        scheduler.stop()
+
+    assert sent > 0
+    assert len(socket.sent) == sent
+
+
+def test_threaded_mode_routes_clients_and_workers(tmp_path):
+    exit_event = threading.Event()
+    inventory = NorFabInventory(
+        data={
+            "broker": {
+                "endpoint": "tcp://127.0.0.1:*",
+                "zmq_auth": False,
+                "mode": "threaded",
+            }
+        },
+        base_dir=str(tmp_path),
+    )
+    broker = NFPBroker(
+        endpoint=inventory.broker["endpoint"],
+        exit_event=exit_event,
+        inventory=inventory,
+    )
+    broker_thread = threading.Thread(target=broker.mediate, daemon=True)
+    broker_thread.start()
+
+    ctx = zmq.Context()
+    worker = ctx.socket(zmq.DEALER)
+    worker.identity = b"worker-1"
+    worker.connect(broker.endpoint)
+    client = ctx.socket(zmq.DEALER)
+    client.identity = b"client-1"
+    client.connect(broker.endpoint)
+    try:
+        worker.send_multipart(NFP.MessageBuilder.worker_to_broker_ready(b"bench"))
+        deadline = time.time() + 5
+        while b"worker-1" not in broker.workers and time.time() < deadline:
+            time.sleep(0.01)
+
+        client.send_multipart(
+            NFP.MessageBuilder.client_to_broker_post(
+                NFP.POST, b"bench", b"any", b"uuid-1", b"{}"
+            )
+        )
+        assert client.poll(5000)
+        dispatched = client.recv_multipart()
+        assert dispatched[2] == NFP.RESPONSE
+        assert dispatched[5] == b"202"
+
+        assert worker.poll(5000)
+        post = worker.recv_multipart()
+        assert post[2] == NFP.POST
+        assert post[3] == b"client-1"
+
+        worker.send_multipart(
+            NFP.MessageBuilder.worker_to_broker_response(
+                [b"client-1", b"", b"uuid-1", b"200", b"{}"]
+            )
+        )
+        assert client.poll(5000)
+        response = client.recv_multipart()
+        assert response[2] == NFP.RESPONSE
+        assert response[4:] == [b"uuid-1", b"200", b"{}"]
+    finally:
+        exit_event.set()
+        broker_thread.join(timeout=5)
+        ctx.destroy(0)
+
+    assert not broker_thread.is_alive()
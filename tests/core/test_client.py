@@ -1,12 +1,15 @@
+import asyncio
 import pprint
 import shutil
+import threading
 import time
 from pathlib import Path
 from uuid import uuid4
 
 import pytest
 
-from norfab.core.client import JobStatus
+from norfab.core.async_client import AsyncNFPClient, AsyncNFPJob
+from norfab.core.client import JobStatus, NFPJobFuture, adjust_transfer_window
 from norfab.core.nfapi import NorFab
 
 pytestmark = pytest.mark.core
@@ -200,6 +203,49 @@ class TestClientRunJob:
         assert "Worker:" in ret
         assert "Results" in ret
 
+    def test_job_result_pushed_by_worker(self, nfclient):
+        start = time.time()
+        ret = nfclient.run_job(
+            "nornir",
+            "echo",
+            kwargs={"foo": "bar"},
+            workers="nornir-worker-1",
+        )
+        elapsed = time.time() - start
+        pprint.pprint(ret)
+        assert ret["nornir-worker-1"]["failed"] is False
+        assert elapsed < nfclient.poll_interval, "Result was not pushed by worker"
+
+    def test_future_iter_results(self, nfclient):
+        future = nfclient.submit_job(
+            "nornir",
+            "echo",
+            kwargs={"foo": "bar"},
+            workers="all",
+        )
+        results = dict(future.iter_results(timeout=30))
+        pprint.pprint(results)
+        assert results
+        assert all(r["failed"] is False for r in results.values())
+        assert results == future.result(timeout=1)
+
+    def test_future_aiter_results(self, nfclient):
+        future = nfclient.submit_job(
+            "nornir",
+            "echo",
+            kwargs={"foo": "bar"},
+            workers="all",
+        )
+
+        async def collect():
+            return [item async for item in future.aiter_results(timeout=30)]
+
+        results = dict(asyncio.run(collect()))
+        pprint.pprint(results)
+        assert results
+        assert all(r["failed"] is False for r in results.values())
+        assert results == future.result(timeout=1)
+
     def test_future_input_request_response(self, nfclient):
         future = nfclient.submit_job(
             "DummyService",
@@ -313,6 +359,44 @@ class TestClientRunJob:
         )
 
 
+class TestAsyncClient:
+    def test_async_run_job(self, nfclient):
+        async def run():
+            client = AsyncNFPClient(
+                nfclient.inventory, nfclient.broker, name="test-async-client"
+            )
+            try:
+                results = await asyncio.gather(
+                    *[
+                        client.run_job("nornir", "echo", kwargs={"i": i}, timeout=30)
+                        for i in range(10)
+                    ]
+                )
+                job = await client.submit_job("nornir", "echo", timeout=30)
+                streamed = {w: r async for w, r in job.iter_results(timeout=30)}
+                return results, streamed, await job.result(timeout=1)
+            finally:
+                await client.close()
+
+        results, streamed, result = asyncio.run(run())
+        pprint.pprint(results)
+        assert len(results) == 10
+        assert all(r and all(i["failed"] is False for i in r.values()) for r in results)
+        assert streamed == result
+
+    def test_async_run_job_unknown_service(self, nfclient):
+        async def run():
+            client = AsyncNFPClient(
+                nfclient.inventory, nfclient.broker, name="test-async-client-2"
+            )
+            try:
+                return await client.run_job("non_existing_service", "echo", timeout=10)
+            finally:
+                await client.close()
+
+        assert asyncio.run(run()) is None
+
+
 class TestAddJobDb:
     """Test suite for ClientJobDatabase.add_job method"""
 
@@ -526,6 +610,39 @@ class TestUpdateJobDb:
         job = nfclient.job_db.get_job(job_uuid)
         assert job["result_data"] == result_data
 
+    def test_update_job_worker_results(self, nfclient):
+        """Test storing job results per worker"""
+        job_uuid = uuid4().hex
+        nfclient.job_db.add_job(
+            uuid=job_uuid,
+            service="nornir",
+            task="echo",
+            workers="all",
+            args=[],
+            kwargs={},
+            timeout=600,
+            deadline=time.time() + 600,
+        )
+
+        nfclient.job_db.update_job(
+            job_uuid, worker_results={"nornir-worker-1": {"result": 1}}
+        )
+        nfclient.job_db.update_job(
+            job_uuid, worker_results={"nornir-worker-2": {"result": 2}}
+        )
+
+        assert nfclient.job_db.get_job(job_uuid)["result_data"] == {
+            "nornir-worker-1": {"result": 1},
+            "nornir-worker-2": {"result": 2},
+        }
+        assert nfclient.job_db.get_job_results(job_uuid, ["nornir-worker-2"]) == {
+            "nornir-worker-2": {"result": 2}
+        }
+        assert (
+            nfclient.job_db.get_job(job_uuid, include_results=False)["result_data"]
+            is None
+        )
+
     def test_update_job_errors(self, nfclient):
         """Test updating job errors"""
         job_uuid = uuid4().hex
@@ -1098,3 +1215,120 @@ class TestJobStatusTransitions:
 
         job = nfclient.job_db.get_job(job_uuid)
         assert len(job["workers_completed"]) == 2
+
+
+class TestFileTransferWindow:
+    def make_transfer(self, window=10, max_window=64):
+        return {
+            "window": window,
+            "max_window": max_window,
+            "min_rtt": None,
+            "srtt": None,
+        }
+
+    def test_window_grows_while_rtt_stable(self):
+        file_transfer = self.make_transfer()
+        for _ in range(100):
+            adjust_transfer_window(file_transfer, 0.01)
+        assert file_transfer["window"] == 64
+
+    def test_window_limited_when_rtt_grows_with_window(self):
+        file_transfer = self.make_transfer(window=1)
+        for _ in range(200):
+            adjust_transfer_window(
+                file_transfer, 0.01 * (1 + file_transfer["window"] / 16)
+            )
+        assert 1 < file_transfer["window"] < 16
+
+
+class FakeJobDb:
+    def __init__(self):
+        self.results = {}
+
+    def get_job(self, uuid, include_results=True):
+        return {"workers_completed": list(self.results)}
+
+    def get_job_results(self, uuid, workers):
+        return {w: self.results[w] for w in workers}
+
+
+class FakeClient:
+    def __init__(self):
+        self.exit_event = threading.Event()
+        self.destroy_event = threading.Event()
+        self.job_db = FakeJobDb()
+
+
+class TestJobFutureAiterResults:
+    def test_results_yielded_as_they_arrive(self):
+        client = FakeClient()
+        future = NFPJobFuture(client, "job-1", "nornir", "echo", "all", 30, {})
+
+        def complete(worker):
+            client.job_db.results[worker] = {"failed": False, "result": worker}
+            future.add_results([worker])
+
+        async def collect():
+            ticks = 0
+            results = []
+
+            async def ticker():
+                nonlocal ticks
+                while True:
+                    ticks += 1
+                    await asyncio.sleep(0.01)
+
+            ticker_task = asyncio.create_task(ticker())
+            loop = asyncio.get_running_loop()
+            loop.call_later(0.3, complete, "nornir-worker-1")
+            loop.call_later(0.6, complete, "nornir-worker-2")
+            loop.call_later(0.7, future.mark_done)
+            async for worker_name, result in future.aiter_results(timeout=5):
+                results.append((worker_name, time.time()))
+            ticker_task.cancel()
+            return results, ticks
+
+        started = time.time()
+        results, ticks = asyncio.run(collect())
+
+        assert [r[0] for r in results] == ["nornir-worker-1", "nornir-worker-2"]
+        assert results[0][1] - started < 0.4, "result not yielded once arrived"
+        assert ticks > 30, "event loop blocked while waiting for results"
+
+
+class TestAsyncNFPJobSubscribers:
+    def make_job(self):
+        client = FakeClient()
+        client.name = "test-async-client"
+        return AsyncNFPJob(client, "job-1", "nornir", "echo", "all", [], {}, 30)
+
+    def test_subscribers_get_all_events_and_results(self):
+        async def run():
+            job = self.make_job()
+            job.publish("event", {"message": "first"})
+            early = asyncio.gather(
+                job.result(timeout=5),
+                collect(job.events()),
+                collect(job.events()),
+                collect(job.iter_results(timeout=5)),
+            )
+            await asyncio.sleep(0)
+            job.publish("event", {"message": "second"})
+            job.workers_dispatched = {"nornir-worker-1"}
+            job.add_results({"nornir-worker-1": {"failed": False}})
+            _, events_1, events_2, results = await early
+            # subscriber joining after job completed gets full history
+            late_events = await collect(job.events())
+            late_results = await collect(job.iter_results(timeout=5))
+            return events_1, events_2, results, late_events, late_results, job
+
+        async def collect(source):
+            return [item async for item in source]
+
+        events_1, events_2, results, late_events, late_results, job = asyncio.run(run())
+        expected = [{"message": "first"}, {"message": "second"}]
+
+        assert events_1 == events_2 == late_events == expected
+        assert results == late_results == [("nornir-worker-1", {"failed": False})]
+        assert job.subscribers == [], "subscribers not removed"
+        assert job.completed_time is not None
@@ -1,6 +1,7 @@
 import json
 import logging
 import pprint
+import time
 
 import pytest
 
@@ -341,6 +342,28 @@ class TestNfApi:
         assert records[0]["log_file"] == "worker-nornir-worker-1.jsonl"
         assert records[1]["message"].startswith("Malformed log record:")
 
+    def test_start_workers_unresolvable_dependencies(self):
+        nf = NorFab(
+            inventory="./nf_tests_inventory/inventory.yaml",
+            run_broker=False,
+            run_workers=False,
+        )
+        start = time.time()
+        nf.start_workers(
+            {
+                "worker-a": {"depends_on": ["worker-b"]},
+                "worker-b": {"depends_on": ["worker-a"]},
+                "worker-c": {"depends_on": ["worker-not-in-topology"]},
+                "worker-d": {"depends_on": ["worker-c"]},
+            }
+        )
+
+        assert time.time() - start < 5, "workers start did not fail fast"
+        assert not any(
+            w in nf.workers_processes
+            for w in ["worker-a", "worker-b", "worker-c", "worker-d"]
+        )
+
     def test_load_inventory_from_dictionary(self, nfclient_dict_inventory):
         # test that NorFab started and workers are started as well
         reply = nfclient_dict_inventory.mmi("mmi.service.broker", "show_workers")
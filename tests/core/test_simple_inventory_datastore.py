@@ -1,8 +1,9 @@
 import os
+import pickle
 
 import pytest
 
-from norfab.core.inventory import NorFabInventory
+from norfab.core.inventory import NorFabInventory, WorkersInventory, merge_recursively
 from norfab.core.worker import NFPWorker
 
 pytestmark = pytest.mark.core
@@ -106,6 +107,75 @@ class TestWorkersInventory:
         assert nornir_worker_1["defaults"]["password"] == "password"
 
 
+class TestWorkersInventoryCache:
+    def make_inventory(self, tmp_path):
+        (tmp_path / "common.yaml").write_text("service: nornir\nhosts: {R1: {}}\n")
+        (tmp_path / "worker.yaml").write_text("hosts: {R2: {}}\nlist: [1, 2]\n")
+        return WorkersInventory(
+            path=str(tmp_path),
+            data={"nornir-*": ["common.yaml", "worker.yaml", {"list": [2, 3]}]},
+        )
+
+    def test_results_cached(self, tmp_path):
+        inventory = self.make_inventory(tmp_path)
+        first = inventory["nornir-worker-1"]
+        second = inventory["nornir-worker-1"]
+
+        assert first == second
+        assert first is not second, "cached inventory returned without copy"
+        assert "nornir-worker-1" in inventory.results_cache
+        assert first["list"] == [1, 2, 3]
+        assert sorted(first["hosts"]) == ["R1", "R2"]
+        assert inventory.data["nornir-*"][2] == {"list": [2, 3]}
+
+    def test_returned_data_modification(self, tmp_path):
+        inventory = self.make_inventory(tmp_path)
+        first = inventory["nornir-worker-1"]
+        first["hosts"]["R4"] = {}
+        first["list"].append(4)
+        second = inventory["nornir-worker-1"]
+
+        assert sorted(second["hosts"]) == ["R1", "R2"], "cached data modified"
+        assert second["list"] == [1, 2, 3]
+
+    def test_file_change_invalidates_cache(self, tmp_path):
+        inventory = self.make_inventory(tmp_path)
+        first = inventory["nornir-worker-1"]
+        common = inventory.files_cache[str(tmp_path / "common.yaml")]["data"]
+
+        (tmp_path / "worker.yaml").write_text("hosts: {R3: {}}\n")
+        second = inventory["nornir-worker-1"]
+
+        assert sorted(first["hosts"]) == ["R1", "R2"]
+        assert sorted(second["hosts"]) == ["R1", "R3"]
+        assert (
+            inventory.files_cache[str(tmp_path / "common.yaml")]["data"] is common
+        ), "unchanged file parsed again"
+        assert common == {"service": "nornir", "hosts": {"R1": {}}}
+
+    def test_env_change_invalidates_cache(self, tmp_path, monkeypatch):
+        (tmp_path / "env.yaml").write_text("username: {{ env.get('NF_CACHE_TEST') }}")
+        inventory = WorkersInventory(path=str(tmp_path), data={"*": ["env.yaml"]})
+        monkeypatch.setenv("NF_CACHE_TEST", "foo")
+        assert inventory["worker"]["username"] == "foo"
+        monkeypatch.setenv("NF_CACHE_TEST", "bar")
+        assert inventory["worker"]["username"] == "bar"
+
+    def test_pickle_drops_cache(self, tmp_path):
+        inventory = self.make_inventory(tmp_path)
+        _ = inventory["nornir-worker-1"]
+        restored = pickle.loads(pickle.dumps(inventory))
+
+        assert restored.results_cache == {} and restored.files_cache == {}
+        assert restored["nornir-worker-1"]["list"] == [1, 2, 3]
+
+    def test_merge_lists_dedup(self):
+        data = {"a": [1, "x", {"k": 1}]}
+        merge_recursively(data, {"a": [1, 2, 2, {"k": 1}, {"k": 2}, "x", [1]]})
+
+        assert data["a"] == [1, "x", {"k": 1}, 2, {"k": 2}, [1]]
+
+
 class TestInventoryLoadFromDictionary:
     data = {
         "broker": {
@@ -1,12 +1,17 @@
 import copy
+import gzip
 import pprint
+import queue
 import sys
 import time
 
 import pytest
+import orjson
 from pydantic import ValidationError
 
-from norfab.core.worker import Task
+from norfab.core.worker import FairJobQueue, JobDatabase, JobEventsRateLimiter, Task
+from norfab.utils.jinja2_templates import Jinja2Templates
+from norfab.utils.jobs_retention import JobsArchive
 
 pytestmark = pytest.mark.core
 
@@ -424,3 +429,244 @@ class TestWorkerJobsApi:
             assert results["failed"] is False, f"{worker} failed to run the task"
             assert results["result"]["result_data"] == None
             assert results["result"]["job_events"] == []
+
+
+class TestJobDatabase:
+    def add_jobs(self, db, count):
+        for i in range(count):
+            db.add_job(
+                uuid=f"job-{i}",
+                client_address="client-1",
+                task="echo",
+                args=[],
+                kwargs={},
+                timeout=60,
+                timestamp=time.ctime(),
+            )
+
+    def test_get_pending_jobs(self, tmp_path):
+        db = JobDatabase(str(tmp_path / "jobs.db"))
+        self.add_jobs(db, 3)
+
+        assert [job["uuid"] for job in db.get_pending_jobs()] == [
+            "job-0",
+            "job-1",
+            "job-2",
+        ]
+        db.close()
+
+    def test_claim_job(self, tmp_path):
+        db = JobDatabase(str(tmp_path / "jobs.db"))
+        self.add_jobs(db, 2)
+
+        assert db.claim_job("job-1") is True
+        assert db.claim_job("job-1") is False, "Job claimed twice"
+        assert db.claim_job("job-unknown") is False
+        assert [job["uuid"] for job in db.get_pending_jobs()] == ["job-0"]
+        assert db.get_job_info("job-1")["status"] == "STARTED"
+        db.close()
+
+    def test_add_job_priority(self, tmp_path):
+        db = JobDatabase(str(tmp_path / "jobs.db"))
+        db.add_job(
+            uuid="job-1",
+            client_address="client-1",
+            task="echo",
+            args=[],
+            kwargs={},
+            timeout=60,
+            timestamp=time.ctime(),
+            priority=5,
+        )
+
+        assert db.get_pending_jobs() == [
+            {"uuid": "job-1", "client_address": "client-1", "priority": 5}
+        ]
+        db.close()
+
+    def test_add_events(self, tmp_path):
+        db = JobDatabase(str(tmp_path / "jobs.db"))
+        self.add_jobs(db, 2)
+        db.add_events(
+            [
+                {"juuid": "job-0", "message": "one", "task": "echo"},
+                {"juuid": "job-1", "message": "two", "task": "echo"},
+                {"juuid": "job-0", "message": "three", "task": "echo"},
+            ]
+        )
+
+        assert [e["message"] for e in db.get_job_events("job-0")] == ["one", "three"]
+        assert [e["message"] for e in db.get_job_events("job-1")] == ["two"]
+        db.close()
+
+    def test_apply_retention_max_count(self, tmp_path):
+        db = JobDatabase(str(tmp_path / "jobs.db"))
+        self.add_jobs(db, 5)
+        for i in range(4):
+            db.complete_job(f"job-{i}", {"result": i})
+
+        ret = db.apply_retention(max_count=2)
+
+        assert ret == {"deleted_jobs": 2, "archived_jobs": 0}
+        assert db.get_job_info("job-0") is None
+        assert db.get_job_info("job-1") is None
+        assert db.get_job_info("job-3")["status"] == "COMPLETED"
+        assert db.get_job_info("job-4")["status"] == "PENDING", "Pending job deleted"
+        db.close()
+
+    def test_apply_retention_archive(self, tmp_path):
+        db = JobDatabase(str(tmp_path / "jobs.db"))
+        archive = JobsArchive(str(tmp_path / "archive"), prefix="worker")
+        assert not (tmp_path / "archive").exists(), "archive directory created"
+        self.add_jobs(db, 3)
+        for i in range(3):
+            db.add_event(f"job-{i}", "job started", "INFO", "echo", {})
+            db.complete_job(f"job-{i}", {"result": i})
+
+        ret = db.apply_retention(max_count=1, archive=archive)
+
+        assert ret == {"deleted_jobs": 2, "archived_jobs": 2}
+        segments = archive.segments()
+        assert len(segments) == 1
+        with gzip.open(segments[0], "rb") as f:
+            records = [orjson.loads(line) for line in f]
+        assert [r["uuid"] for r in records] == ["job-0", "job-1"]
+        assert records[0]["result_data"] == {"result": 0}
+        assert records[0]["job_events"][0]["message"] == "job started"
+        db.close()
+
+    def test_compact(self, tmp_path):
+        db = JobDatabase(str(tmp_path / "jobs.db"))
+        self.add_jobs(db, 50)
+        for i in range(50):
+            db.complete_job(f"job-{i}", {"result": "x" * 10000})
+        db.apply_retention(max_count=1)
+
+        ret = db.compact()
+
+        assert ret["vacuum"] == "incremental"
+        assert ret["db_size_after"] < ret["db_size_before"]
+        db.close()
+
+
+class TestFairJobQueue:
+    def test_priority_within_client(self):
+        jobs = FairJobQueue()
+        jobs.put("low", "client-1", 0)
+        jobs.put("high", "client-1", 5)
+
+        assert jobs.get(timeout=0) == "high"
+        assert jobs.get(timeout=0) == "low"
+
+    def test_fairness_across_clients(self):
+        jobs = FairJobQueue()
+        for i in range(100):
+            jobs.put(f"bulk-{i}", "bulk-client", 0)
+        jobs.put("interactive-1", "nfcli-client", 0)
+        jobs.put("interactive-2", "nfcli-client", 0)
+
+        order = [jobs.get(timeout=0) for _ in range(4)]
+
+        assert "interactive-1" in order
+        assert "interactive-2" in order
+        assert jobs.qsize() == 98
+
+    def test_priority_across_clients(self):
+        jobs = FairJobQueue()
+        for i in range(10):
+            jobs.put(f"bulk-{i}", "bulk-client", 0)
+            jobs.put(f"urgent-{i}", "urgent-client", 3)
+
+        order = [jobs.get(timeout=0) for _ in range(10)]
+
+        assert len([j for j in order if j.startswith("urgent")]) == 8
+
+    def test_get_empty_raises(self):
+        with pytest.raises(queue.Empty):
+            FairJobQueue().get(timeout=0.01)
+
+
+class TestJobEventsRateLimiter:
+    def event(self, message, juuid="job-1", **kwargs):
+        return {"juuid": juuid, "message": message, "task": "echo", **kwargs}
+
+    def test_no_rate_limit(self):
+        limiter = JobEventsRateLimiter(0)
+        events = [self.event(str(i)) for i in range(100)]
+
+        assert [e for event in events for e in limiter.add(event, now=0)] == events
+
+    def test_coalesce_progress_events(self):
+        limiter = JobEventsRateLimiter(2)
+        emitted = []
+        for i in range(10):
+            emitted.extend(limiter.add(self.event(str(i)), now=0))
+
+        assert [e["message"] for e in emitted] == ["0", "1"]
+        assert limiter.flush(now=0) == [], "Pending event emitted without tokens"
+        pending = limiter.flush(now=0.5)
+        assert [e["message"] for e in pending] == ["9"]
+        assert pending[0]["extras"] == {"coalesced": 7}
+
+    def test_other_events_flush_pending_event(self):
+        limiter = JobEventsRateLimiter(1)
+        limiter.add(self.event("0"), now=0)
+        limiter.add(self.event("1"), now=0)
+        emitted = limiter.add(self.event("failed", severity="ERROR"), now=0)
+
+        assert [e["message"] for e in emitted] == ["1", "failed"]
+
+    def test_rate_limit_per_job(self):
+        limiter = JobEventsRateLimiter(1)
+        limiter.add(self.event("0", juuid="job-1"), now=0)
+
+        assert limiter.add(self.event("0", juuid="job-2"), now=0) != []
+
+    def test_flush_job(self):
+        limiter = JobEventsRateLimiter(1)
+        limiter.add(self.event("0"), now=0)
+        limiter.add(self.event("1"), now=0)
+
+        assert [e["message"] for e in limiter.flush("job-1")] == ["1"]
+        assert limiter.flush("job-1") == []
+
+
+class TestJinja2Templates:
+    def test_from_string_compiled_once(self):
+        templates = Jinja2Templates()
+        first = templates.from_string("{{ x | up }}", {"up": str.upper})
+        second = templates.from_string("{{ x | up }}", {"up": str.upper})
+        assert first is second
+        assert first.render(x="a") == "A"
+        assert templates.stats()["hits"] == 1
+
+    def test_lru_eviction(self):
+        templates = Jinja2Templates(cache_size=2)
+        first = templates.from_string("{{ 1 }}")
+        templates.from_string("{{ 2 }}")
+        templates.from_string("{{ 3 }}")
+        assert templates.stats()["templates"] == 2
+        assert templates.from_string("{{ 1 }}") is not first
+
+    def test_get_template_recompiled_on_content_change(self, tmp_path):
+        (tmp_path / "inc.j2").write_text("inc {{ x }}")
+        (tmp_path / "main.j2").write_text("main {% include 'inc.j2' %}")
+        templates = Jinja2Templates()
+        first = templates.get_template(str(tmp_path / "main.j2"))
+        assert first.render(x=1) == "main inc 1"
+        assert templates.get_template(str(tmp_path / "main.j2")) is first
+
+        time.sleep(0.01)
+        (tmp_path / "main.j2").write_text("main2 {% include 'inc.j2' %}")
+        second = templates.get_template(str(tmp_path / "main.j2"))
+        assert second is not first
+        assert second.render(x=2) == "main2 inc 2"
+
+    def test_bytecode_cache(self, tmp_path):
+        cache_dir = tmp_path / "bytecode"
+        first = Jinja2Templates(bytecode_cache_dir=str(cache_dir))
+        assert first.from_string("{{ x }}").render(x="a") == "a"
+        assert len(list(cache_dir.iterdir())) == 1
+
+        second = Jinja2Templates(bytecode_cache_dir=str(cache_dir))
+        assert second.from_string("{{ x }}").render(x="b") == "b"
@@ -0,0 +1,84 @@
+"""
+NorFab FastAPI service load test.
+
+Sends requests to running NorFab FastAPI service from a number of
+concurrent HTTP clients and measures requests throughput and latency. Each
+request runs a job and waits for its results, or only submits the job if
+``--submit`` argument given.
+
+Before running, store bearer token for the test using nfcli:
+
+    fastapi auth create-token username bench token <token>
+
+Usage:
+
+    python benchmark_fastapi.py --token <token> --concurrency 50 --requests 500
+"""
+
+import argparse
+import statistics
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import requests
+
+
+def run_request(session: requests.Session, url: str, body: dict) -> float:
+    """Send single request and return its latency in seconds"""
+    start = time.time()
+    resp = session.post(url=url, json=body)
+    resp.raise_for_status()
+    return time.time() - start
+
+
+def benchmark(args) -> None:
+    url = f"{args.url}/api/jobs" if args.submit else f"{args.url}/api/job/run"
+    body = {
+        "service": args.service,
+        "task": args.task,
+        "workers": args.workers,
+        "timeout": args.timeout,
+    }
+    sessions = []
+    for _ in range(args.concurrency):
+        session = requests.Session()
+        session.headers["Authorization"] = f"Bearer {args.token}"
+        sessions.append(session)
+
+    start = time.time()
+    with ThreadPoolExecutor(max_workers=args.concurrency) as executor:
+        latencies = list(
+            executor.map(
+                lambda i: run_request(sessions[i % args.concurrency], url, body),
+                range(args.requests),
+            )
+        )
+    duration = time.time() - start
+    latencies.sort()
+
+    print(
+        f"{'submit' if args.submit else 'run':>6} mode: {args.requests} requests, "
+        f"concurrency {args.concurrency}, {duration:.2f}s, "
+        f"{args.requests / duration:.0f} requests/s, latency "
+        f"avg {statistics.mean(latencies) * 1000:.0f}ms, "
+        f"p95 {latencies[int(len(latencies) * 0.95) - 1] * 1000:.0f}ms, "
+        f"max {latencies[-1] * 1000:.0f}ms"
+    )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="NorFab FastAPI load test")
+    parser.add_argument("--url", default="http://127.0.0.1:8000")
+    parser.add_argument("--token", required=True)
+    parser.add_argument("--service", default="nornir")
+    parser.add_argument("--task", default="get_version")
+    parser.add_argument("--workers", default="any")
+    parser.add_argument("--timeout", type=int, default=60)
+    parser.add_argument("--concurrency", type=int, default=50)
+    parser.add_argument("--requests", type=int, default=500)
+    parser.add_argument(
+        "--submit", action="store_true", help="submit jobs without waiting results"
+    )
+    args = parser.parse_args()
+
+    benchmark(args)
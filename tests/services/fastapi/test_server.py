@@ -1,5 +1,6 @@
 import json
 import pprint
+import time
 import pytest
 
 import requests
@@ -201,3 +202,123 @@ class TestFastAPIServer:
             assert "ceos-spine-1" in wres["result"]
             assert "ceos-spine-2" in wres["result"]
             assert wres["status"] == "completed"
+
+    def test_jobs_submit_and_get(self, nfclient):
+        token = get_token(nfclient)
+        resp = requests.post(
+            url="http://127.0.0.1:8000/api/jobs",
+            headers={"Authorization": f"Bearer {token}"},
+            data=json.dumps({"service": "nornir", "task": "get_version"}),
+        )
+        assert resp.status_code == 202
+        res = resp.json()
+        pprint.pprint(res)
+        assert res["uuid"], f"Unexpected uuid value '{res['uuid']}'"
+
+        # poll job until completed
+        for _ in range(30):
+            get_resp = requests.get(
+                url=f"http://127.0.0.1:8000/api/jobs/{res['uuid']}",
+                headers={"Authorization": f"Bearer {token}"},
+            )
+            get_resp.raise_for_status()
+            job = get_resp.json()
+            if job["status"] == "COMPLETED":
+                break
+            time.sleep(1)
+        pprint.pprint(job)
+
+        assert job["status"] == "COMPLETED"
+        assert job["workers_completed"] == job["workers_dispatched"]
+        for wname, wres in job["result_data"].items():
+            assert wres["failed"] == False, f"{wname} failed to run job"
+
+    def test_jobs_get_unknown_job(self, nfclient):
+        token = get_token(nfclient)
+        resp = requests.get(
+            url="http://127.0.0.1:8000/api/jobs/does-not-exist",
+            headers={"Authorization": f"Bearer {token}"},
+        )
+        assert resp.status_code == 404
+
+    def test_jobs_events_stream(self, nfclient):
+        token = get_token(nfclient)
+        resp = requests.post(
+            url="http://127.0.0.1:8000/api/jobs",
+            headers={"Authorization": f"Bearer {token}"},
+            data=json.dumps(
+                {
+                    "service": "nornir",
+                    "task": "cli",
+                    "kwargs": {"commands": ["show clock"], "FC": "spine"},
+                }
+            ),
+        )
+        uuid = resp.json()["uuid"]
+
+        messages = []
+        with requests.get(
+            url=f"http://127.0.0.1:8000/api/jobs/{uuid}/events",
+            headers={"Authorization": f"Bearer {token}"},
+            stream=True,
+            timeout=60,
+        ) as stream:
+            assert stream.headers["content-type"].startswith("text/event-stream")
+            for line in stream.iter_lines(decode_unicode=True):
+                if line.startswith("event: "):
+                    messages.append(line[7:])
+        pprint.pprint(messages)
+
+        assert "result" in messages, "No workers results streamed"
+        assert messages[-1] == "done"
+
+    def test_jobs_events_stream_replay(self, nfclient):
+        token = get_token(nfclient)
+        resp = requests.post(
+            url="http://127.0.0.1:8000/api/jobs",
+            headers={"Authorization": f"Bearer {token}"},
+            data=json.dumps(
+                {
+                    "service": "nornir",
+                    "task": "cli",
+                    "kwargs": {"commands": ["show clock"], "FC": "spine"},
+                }
+            ),
+        )
+        uuid = resp.json()["uuid"]
+
+        streams = []
+        for _ in range(2):
+            messages = []
+            with requests.get(
+                url=f"http://127.0.0.1:8000/api/jobs/{uuid}/events",
+                headers={"Authorization": f"Bearer {token}"},
+                stream=True,
+                timeout=60,
+            ) as stream:
+                for line in stream.iter_lines(decode_unicode=True):
+                    if line.startswith("event: "):
+                        messages.append(line[7:])
+            streams.append(messages)
+        pprint.pprint(streams)
+
+        # second stream opened after job completed replays job history
+        assert streams[0] == streams[1]
+        assert "result" in streams[1], "No workers results replayed"
+
+    def test_api_task_submit(self, nfclient):
+        token = get_token(nfclient)
+
+        wait_for_endpoint(nfclient, "/api/nornir/", 30)
+
+        resp = requests.post(
+            "http://127.0.0.1:8000/api/nornir/cli/?submit=true",
+            headers={"Authorization": f"Bearer {token}"},
+            data=json.dumps({"commands": ["show clock"], "FC": "spine"}),
+        )
+        assert resp.status_code == 202
+        res = resp.json()
+        pprint.pprint(res)
+        assert res["uuid"]
+        assert res["service"] == "nornir"
+        assert res["task"] == "cli"
@@ -370,6 +370,16 @@ def test_limit_runs_in_authored_order():
     assert apply(raw, [replace, limit])["result"] == "Result is too large."
 
 
+def test_limit_measures_withheld_fields():
+    raw = {"worker": worker_result({"text": "unsafe " * 100})}
+    block = {"type": "regex", "match": "unsafe", "message": "Content blocked."}
+    delivered = apply(raw, [block])
+    limit = {"type": "limit", "limit": len(orjson.dumps(delivered))}
+
+    assert apply(raw, [block, limit]) == delivered
+    assert apply(raw, [limit, block])["result"] != "Content blocked."
+
+
 class TestFastMCPResultGuardrailsIntegration:
     tools_discovered = {}
 
@@ -5,6 +5,9 @@ from mcp import ClientSession
 from mcp.client.streamable_http import streamable_http_client
 from mcp.shared.exceptions import McpError
 
+from norfab.workers.fastmcp_worker.fastmcp_models import ToolsConcurrencyLimit
+from norfab.workers.fastmcp_worker.fastmcp_worker import FastMCPWorker
+
 try:
     from tests.services.fastmcp.common import (
         call_mcp_tool,
@@ -28,6 +31,41 @@ except ModuleNotFoundError as exc:
 pytestmark = pytest.mark.fastmcp
 
 
+class TestToolsCallConcurrency:
+    tools_discovered = {}
+
+    def test_tool_semaphore_first_matching_rule(self):
+        worker = FastMCPWorker.__new__(FastMCPWorker)
+        worker.tools_semaphores = {}
+        worker.tools_concurrency = [
+            ToolsConcurrencyLimit(service="nornir", task="cfg*", limit=1),
+            ToolsConcurrencyLimit(service="nornir", limit=5),
+        ]
+
+        cfg = worker.get_tool_semaphore("nornir", "cfg")
+        cfg_nb = worker.get_tool_semaphore("nornir", "cfg_netbox")
+        cli = worker.get_tool_semaphore("nornir", "cli")
+
+        assert cfg is cfg_nb
+        assert cfg._value == 1
+        assert cli is not cfg
+        assert cli._value == 5
+        assert worker.get_tool_semaphore("netbox", "rest") is None
+
+    def test_parallel_tool_calls(self, nfclient, mcp_url):
+        ensure_tool_discovered(self, nfclient, "nornir", "get_nornir_hosts")
+
+        async def run_test():
+            tool_name = "service_nornir__task_get_nornir_hosts"
+            results = await asyncio.gather(
+                *[call_mcp_tool(mcp_url, tool_name, {}) for _ in range(5)]
+            )
+            assert len(results) == 5
+            assert all(results)
+
+        asyncio.run(run_test())
+
+
 class TestToolsCallNornir:
     """Test MCP tool calls for Nornir service"""
 
@@ -1,3 +1,4 @@
+import hashlib
 import os
 import pprint
 
@@ -89,6 +90,84 @@ class TestFetchFile:
         assert ret["content"], "no file path returned"
         assert os.path.exists(ret["content"]), "file does not exist"
 
+    def test_fetch_file_restored_from_files_cache(self, nfclient):
+        """Test fetching a deleted file restores it from files content cache"""
+        ret = nfclient.fetch_file(url="nf://filesharing/test_file_2.txt")
+        assert ret["status"] == "200", "failed to fetch file"
+        os.remove(ret["content"])
+
+        ret = nfclient.fetch_file(url="nf://filesharing/test_file_2.txt", read=True)
+        pprint.pprint(ret)
+
+        assert ret["status"] == "200", "failed to fetch file"
+        with open(
+            os.path.join("nf_tests_inventory", "filesharing", "test_file_2.txt"),
+            encoding="utf-8",
+        ) as f:
+            assert ret["content"] == f.read(), "file content mismatch"
+
+    def test_fetch_file_resume_download(self, nfclient):
+        """Test fetching a file resumes download from partial file"""
+        source = os.path.join("nf_tests_inventory", "filesharing", "large_file.txt")
+        with open(source, "rb") as f:
+            content = f.read()
+        nfclient.delete_fetched_files(filepath="*")
+        destination = os.path.join(
+            nfclient.base_dir, "fetchedfiles", "filesharing", "large_file.txt"
+        )
+        os.makedirs(os.path.dirname(destination), exist_ok=True)
+        part = f"{destination}.{hashlib.md5(content).hexdigest()}.part"
+        with open(part, "wb") as f:
+            f.write(content[:100000])
+
+        ret = nfclient.fetch_file(
+            url="nf://filesharing/large_file.txt", chunk_size=25000
+        )
+        pprint.pprint(ret)
+
+        assert ret["status"] == "200", "failed to fetch file"
+        assert not os.path.exists(part), "partial file not removed"
+        with open(ret["content"], "rb") as f:
+            assert f.read() == content, "file content mismatch"
+
+    def test_fetch_file_parallel_ranges(self, nfclient, tmp_path):
+        """Test downloading a file in parallel ranges"""
+        url = "nf://filesharing/large_file.txt"
+        source = os.path.join("nf_tests_inventory", "filesharing", "large_file.txt")
+        with open(source, "rb") as f:
+            content = f.read()
+        reply = nfclient.run_job(
+            "filesharing", "file_details", workers="any", kwargs={"url": url}
+        )
+        w_name, w_res = next(iter(reply.items()))
+        part = str(tmp_path / "large_file.txt.part")
+
+        # download 3 ranges of 5 chunks each concurrently
+        error = nfclient.download_ranges(
+            url=url,
+            part=part,
+            file_details=w_res["result"],
+            sources=[w_name, w_name, w_name],
+            chunk_size=len(content) // 15 + 1,
+            pipeline=2,
+            max_pipeline=4,
+            timeout=60,
+        )
+
+        assert error is None, f"parallel download failed: {error}"
+        with open(part, "rb") as f:
+            downloaded = f.read()
+        assert downloaded == content, "file content mismatch"
+        assert hashlib.md5(downloaded).hexdigest() == w_res["result"]["md5hash"]
+
+    def test_fetch_file_locks_released(self, nfclient):
+        """Test fetch_file does not keep per-file locks once done"""
+        nfclient.delete_fetched_files(filepath="*test_file_1.txt")
+        ret = nfclient.fetch_file(url="nf://filesharing/test_file_1.txt")
+
+        assert ret["status"] == "200", "failed to fetch file"
+        assert len(nfclient.file_locks) == 0, "file lock not released"
+
     @pytest.mark.parametrize(
         "url",
         [
@@ -0,0 +1,86 @@
+import hashlib
+import os
+import pprint
+
+import pytest
+
+pytestmark = [
+    pytest.mark.filesharing,
+    pytest.mark.filesharing_file_manifest,
+]
+
+
+class TestFileManifest:
+    """Test file_manifest task functionality"""
+
+    def test_file_manifest(self, nfclient):
+        """Test getting details of all files in a directory"""
+        ret = nfclient.run_job(
+            "filesharing",
+            "file_manifest",
+            workers=["filesharing-worker-1"],
+            kwargs={"url": "nf://filesharing/"},
+        )
+        pprint.pprint(ret)
+
+        file_path = os.path.join("nf_tests_inventory", "filesharing", "test_file_1.txt")
+        with open(file_path, "rb") as f:
+            expected_md5 = hashlib.md5(f.read()).hexdigest()
+
+        for worker, results in ret.items():
+            assert results["failed"] is False, f"{worker} failed to get manifest"
+            files = {
+                nfclient.normalize_file_url(k): v for k, v in results["result"].items()
+            }
+            assert len(files) == 5, f"{worker} wrong number of files"
+            assert (
+                files["nf://filesharing/test_file_1.txt"]["md5hash"] == expected_md5
+            ), f"{worker} MD5 hash mismatch"
+            assert files["nf://filesharing/subdir1/nested_file.txt"][
+                "exists"
+            ], f"{worker} nested file missing"
+
+    def test_file_manifest_non_existent_directory(self, nfclient):
+        """Test getting manifest of a non-existent directory"""
+        ret = nfclient.run_job(
+            "filesharing",
+            "file_manifest",
+            workers=["filesharing-worker-1"],
+            kwargs={"url": "nf://filesharing/does_not_exist"},
+        )
+        pprint.pprint(ret)
+
+        for worker, results in ret.items():
+            assert results["failed"] is True, f"{worker} did not fail as expected"
+            assert results["errors"] == ["Directory Not Found"]
+
+    def test_file_manifest_rejects_path_traversal(self, nfclient):
+        """Worker should reject nf:// paths that escape base_dir."""
+        ret = nfclient.run_job(
+            "filesharing",
+            "file_manifest",
+            workers=["filesharing-worker-1"],
+            kwargs={"url": "nf://../"},
+        )
+        pprint.pprint(ret)
+
+        for worker, results in ret.items():
+            assert results["failed"] is True, f"{worker} did not fail as expected"
+            assert "invalid URL path" in results["errors"][0]
+
+    def test_fetch_manifest_and_files(self, nfclient):
+        """Test fetching files using client files manifest"""
+        nfclient.delete_fetched_files(filepath="*")
+        manifest = nfclient.fetch_manifest(url="nf://filesharing/subdir1")
+        pprint.pprint(manifest)
+
+        assert manifest["status"] == "200", "failed to fetch manifest"
+        file_details = manifest["content"]["nf://filesharing/subdir1/nested_file.txt"]
+        ret = nfclient.fetch_file(
+            url="nf://filesharing/subdir1/nested_file.txt",
+            file_details=file_details,
+        )
+        pprint.pprint(ret)
+
+        assert ret["status"] == "200", "failed to fetch file"
+        assert os.path.exists(ret["content"]), "file does not exist"
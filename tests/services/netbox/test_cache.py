@@ -1,7 +1,11 @@
 import pprint
+import threading
+import time
 
 import pytest
 
+from norfab.workers.netbox_worker.netbox_cache_watcher import NetboxCacheWatcher
+
 pytestmark = pytest.mark.netbox
 
 
@@ -409,3 +413,120 @@ class TestNetboxCache:
                 for item_1st in ret_list_1st[worker_2nd]["result"]:
                     if item_2nd["key"] == item_1st["key"]:
                         assert item_2nd["expires"] > item_1st["expires"]
+
+
+class FakeCache(dict):
+    def delete(self, key):
+        self.pop(key, None)
+
+
+class FakeWorker:
+    name = "netbox-worker-test"
+    exit_event = threading.Event()
+    netbox_inventory = {"instances": {"prod": {}}}
+
+    def __init__(self):
+        self.cache = FakeCache()
+
+
+class TestNetboxCacheWatcher:
+    def make_watcher(self):
+        worker = FakeWorker()
+        watcher = NetboxCacheWatcher(worker, interval=10, max_staleness=30)
+        watcher.last_poll["prod"] = time.time()
+        worker.cache["get_devices::ceos1"] = {"name": "ceos1"}
+        worker.cache["get_interfaces::ceos1"] = {"eth1": {"id": 11}}
+        watcher.register(
+            "prod", "get_devices::ceos1", time.time(), device="ceos1", device_id=1
+        )
+        watcher.register(
+            "prod",
+            "get_interfaces::ceos1",
+            time.time(),
+            device="ceos1",
+            device_id=1,
+            interface_ids=[11],
+            scope={"ip_addresses"},
+        )
+        return worker, watcher
+
+    def test_registered_entry_valid(self):
+        worker, watcher = self.make_watcher()
+        assert watcher.is_valid("prod", "get_devices::ceos1")
+        assert watcher.is_valid("prod", "get_interfaces::ceos1", {"ip_addresses"})
+        assert not watcher.is_valid(
+            "prod", "get_interfaces::ceos1", {"inventory_items"}
+        ), "entry cached without inventory items reported as valid"
+        assert not watcher.is_valid("dev", "get_devices::ceos1")
+        assert not watcher.is_valid("prod", "get_devices::ceos2")
+
+    def test_staleness_bound(self):
+        worker, watcher = self.make_watcher()
+        watcher.last_poll["prod"] = time.time() - 60
+        assert not watcher.is_valid("prod", "get_devices::ceos1")
+
+    @pytest.mark.parametrize(
+        "change",
+        [
+            {
+                "changed_object_type": "dcim.device",
+                "changed_object_id": 1,
+                "object_repr": "ceos1",
+                "postchange_data": {"name": "ceos1"},
+            },
+            {
+                "changed_object_type": "dcim.interface",
+                "changed_object_id": 11,
+                "object_repr": "eth1",
+                "postchange_data": {"device": 1, "name": "eth1"},
+            },
+            {
+                "changed_object_type": "dcim.interface",
+                "changed_object_id": 12,
+                "object_repr": "eth2",
+                "postchange_data": {"device": 1, "name": "eth2"},
+            },
+            {
+                "changed_object_type": "ipam.ipaddress",
+                "changed_object_id": 100,
+                "object_repr": "10.0.0.1/32",
+                "prechange_data": {"assigned_object_id": 11},
+            },
+            {
+                "changed_object_type": "dcim.inventoryitem",
+                "changed_object_id": 200,
+                "object_repr": "PSU1",
+                "prechange_data": {"device": 1},
+            },
+        ],
+    )
+    def test_change_invalidates_device(self, change):
+        worker, watcher = self.make_watcher()
+        watcher.process("prod", change)
+        assert "get_devices::ceos1" not in worker.cache
+        assert "get_interfaces::ceos1" not in worker.cache
+        assert not watcher.is_valid("prod", "get_devices::ceos1")
+        assert not watcher.is_valid("prod", "get_interfaces::ceos1")
+
+    def test_unrelated_change_keeps_cache(self):
+        worker, watcher = self.make_watcher()
+        watcher.process(
+            "prod",
+            {
+                "changed_object_type": "dcim.interface",
+                "changed_object_id": 31,
+                "object_repr": "eth1",
+                "postchange_data": {"device": 3, "name": "eth1"},
+            },
+        )
+        assert "get_devices::ceos1" in worker.cache
+        assert watcher.is_valid("prod", "get_devices::ceos1")
+
+    def test_register_after_invalidation_skipped(self):
+        worker, watcher = self.make_watcher()
+        fetch_started = time.time() - 1
+        watcher.invalidate({"ceos1"})
+        watcher.register(
+            "prod", "get_devices::ceos1", fetch_started, device="ceos1", device_id=1
+        )
+        assert not watcher.is_valid("prod", "get_devices::ceos1")
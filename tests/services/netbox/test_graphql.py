@@ -479,3 +479,48 @@ class TestNetboxGrapQL:
                 assert all(
                     k in res["result"] for k in ["devices", "interfaces", "addresses"]
                 ), f"{worker} - did not return some data"
+
+
+class TestNetboxGraphqlPagination:
+    def test_netbox_graphql_pagination(self, nfclient):
+        all_devices = nfclient.run_job(
+            "netbox",
+            "graphql",
+            workers="any",
+            kwargs={"query_string": "query { device_list { name } }"},
+        )
+        worker, res = list(all_devices.items())[0]
+        expected = sorted(d["name"] for d in res["result"]["device_list"])
+
+        ret = nfclient.run_job(
+            "netbox",
+            "netbox_graphql",
+            workers=[worker],
+            kwargs={
+                "instance": "prod",
+                "query": (
+                    "query DevicesQuery($offset: Int!, $limit: Int!) { "
+                    "device_list(pagination: {offset: $offset, limit: $limit}) "
+                    "{ name } }"
+                ),
+                "limit": 2,
+            },
+        )
+        pprint.pprint(ret)
+
+        assert not ret[worker]["errors"], f"{worker} - received error"
+        assert (
+            sorted(d["name"] for d in ret[worker]["result"]["device_list"]) == expected
+        ), f"{worker} - paginated results not matching full query results"
+
+        status = nfclient.run_job(
+            "netbox",
+            "get_netbox_status",
+            workers=[worker],
+            kwargs={"instance": "prod"},
+        )
+        pprint.pprint(status)
+        stats = status[worker]["result"]["prod"]["graphql_stats"]
+        assert stats["requests"] >= len(expected) // 2, "not all pages counted"
+        assert stats["bytes"] > 0, "no GraphQL bytes counted"
+        assert "requests_per_second" in stats
@@ -261,6 +261,35 @@ class TestGetNornirInventory:
                             "name",
                         ]
                     ), f"{worker}:{device}:{peering} not all peerings data returned"
+
+    def test_with_devices_add_all_data_concurrently(self, nfclient):
+        ret = nfclient.run_job(
+            "netbox",
+            "get_nornir_inventory",
+            workers="any",
+            kwargs={
+                "devices": ["fceos4", "fceos5"],
+                "interfaces": True,
+                "connections": True,
+                "circuits": True,
+                "bgp_peerings": True,
+            },
+        )
+        pprint.pprint(ret)
+
+        for worker, res in ret.items():
+            assert not res["errors"], f"{worker} - received error"
+            for device in ["fceos4", "fceos5"]:
+                assert all(
+                    k in res["result"]["hosts"][device]["data"]
+                    for k in ["interfaces", "connections", "circuits", "bgp_peerings"]
+                ), f"{worker}:{device} not all data returned"
+            timings = [m for m in res["messages"] if m.startswith("timings:")]
+            assert timings, f"{worker} - no timings reported"
+            assert all(
+                k in timings[0]
+                for k in ["devices", "interfaces", "connections", "circuits", "total"]
+            ), f"{worker} - not all phases timings reported"
 class TestInventoryPatternMap:
     def test_rejects_nested_inventory_map_wrapper(self):
         with pytest.raises(ValidationError):
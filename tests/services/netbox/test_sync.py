@@ -1,7 +1,10 @@
 import pprint
+from uuid import uuid4
 
 import pytest
 
+from norfab.workers.netbox_worker.netbox_worker import NetboxWorker
+
 try:
     from tests.services.netbox.common import (
         delete_all_mac_addresses,
@@ -679,6 +682,26 @@ class TestCheckDeviceSync:
                     res["diff"][category], dict
                 ), f"{worker} diff['{category}'] should be a dict"
 
+    def test_check_device_sync_collects_live_state_once(self, nfclient):
+        """Live devices state collected once per getter and shared by all checks."""
+        juuid = uuid4().hex
+        ret = nfclient.run_job(
+            "netbox",
+            "check_device_sync",
+            workers="any",
+            uuid=juuid,
+            kwargs={"devices": self.DEVICES},
+        )
+        pprint.pprint(ret, width=200)
+
+        messages = [e["message"] for e in nfclient.job_db.get_job_events(juuid)]
+        for worker, res in ret.items():
+            assert not res["failed"], f"{worker} failed - {res.get('errors')}"
+        for getter in ["inventory", "interfaces", "bgp_neighbors"]:
+            assert (
+                messages.count(f"collected live {getter} state for 2 device(s)") == 1
+            ), f"live {getter} state not collected exactly once"
+
     def test_check_device_sync_no_writes_to_netbox(self, nfclient):
         """check_device_sync must never write to NetBox."""
         pynb = get_pynetbox(nfclient)
@@ -980,6 +1003,26 @@ class TestSyncAll:
                         f"got {type(device_data[category])}"
                     )
 
+    def test_sync_all_collects_live_state_once(self, nfclient):
+        """Live devices state collected once per getter and shared by all stages."""
+        juuid = uuid4().hex
+        ret = nfclient.run_job(
+            "netbox",
+            "sync_all",
+            workers="any",
+            uuid=juuid,
+            kwargs={"devices": self.SPINE_DEVICES, "dry_run": True},
+        )
+        pprint.pprint(ret, width=200)
+
+        messages = [e["message"] for e in nfclient.job_db.get_job_events(juuid)]
+        for worker, res in ret.items():
+            assert not res["failed"], f"{worker} failed - {res.get('errors')}"
+        for getter in ["inventory", "interfaces", "bgp_neighbors"]:
+            assert (
+                messages.count(f"collected live {getter} state for 2 device(s)") == 1
+            ), f"live {getter} state not collected exactly once"
+
     def test_sync_all_dry_run_no_writes(self, nfclient):
         """dry_run=True must not write inventory, interfaces, MACs, or IPs."""
         self._sync(nfclient, self.SPINE_DEVICES, dry_run=True)
@@ -1182,3 +1225,121 @@ class TestSyncAll:
         for worker, res in ret.items():
             assert res["failed"], f"{worker} should fail when no devices specified"
             assert res["errors"], f"{worker} should report errors"
+
+
+class FakeJob:
+    juuid = "job-1"
+
+    def __init__(self):
+        self.events = []
+
+    def event(self, message, **kwargs):
+        self.events.append(message)
+
+
+class FakeFuture:
+    def __init__(self, data):
+        self.data = data
+
+    def result(self, timeout=None):
+        return self.data
+
+
+class FakeClient:
+    def __init__(self, data):
+        self.data = data
+        self.submitted = []
+        self.runs = []
+
+    def submit_job(self, service, task, kwargs=None, **params):
+        self.submitted.append(kwargs)
+        return FakeFuture(self.data.get(kwargs.get("get")))
+
+    def run_job(self, service, task, kwargs=None, **params):
+        self.runs.append(kwargs)
+        return {"nornir-worker-1": {"failed": False, "result": {}, "errors": []}}
+
+
+class FakeNetboxWorker:
+    name = "netbox-worker-test"
+
+    def __init__(self, data):
+        self.client = FakeClient(data)
+        self.device_state = {}
+
+
+class TestDeviceState:
+    DEVICES = ["ceos-spine-1", "ceos-spine-2"]
+    PARSE_DATA = {
+        "interfaces": {
+            "nornir-worker-1": {
+                "failed": False,
+                "errors": [],
+                "result": {
+                    "ceos-spine-1": {"Ethernet1": {}},
+                    "ceos-spine-2": {"Ethernet2": {}},
+                },
+            }
+        },
+        "inventory": None,
+    }
+
+    def collect(self):
+        worker = FakeNetboxWorker(self.PARSE_DATA)
+        job = FakeJob()
+        NetboxWorker.collect_device_state(
+            worker,
+            job,
+            {"interfaces": {"get": "interfaces"}, "inventory": {"get": "inventory"}},
+            self.DEVICES,
+            60,
+        )
+        return worker, job
+
+    def test_collect_device_state(self):
+        worker, job = self.collect()
+
+        assert len(worker.client.submitted) == 2, "not all getters submitted"
+        snapshot = worker.device_state[job.juuid]
+        assert len(snapshot) == 1, "getter without data stored in snapshot"
+        assert snapshot[0]["kwargs"] == {"get": "interfaces"}
+        assert snapshot[0]["devices"] == set(self.DEVICES)
+
+    def test_get_device_state_from_snapshot(self):
+        worker, job = self.collect()
+        ret = NetboxWorker.get_device_state(
+            worker, job, ["ceos-spine-1"], 60, get="interfaces"
+        )
+
+        assert worker.client.runs == [], "parse_ttp job run for collected state"
+        assert ret["nornir-worker-1"]["result"] == {"ceos-spine-1": {"Ethernet1": {}}}
+        assert self.PARSE_DATA["interfaces"]["nornir-worker-1"]["result"].keys() == {
+            "ceos-spine-1",
+            "ceos-spine-2",
+        }, "snapshot data modified"
+
+    @pytest.mark.parametrize(
+        "devices, parse_kwargs",
+        [
+            (["ceos-spine-1"], {"get": "inventory"}),
+            (["ceos-spine-1"], {"get": "bgp_neighbors"}),
+            (["ceos-spine-1", "ceos-leaf-1"], {"get": "interfaces"}),
+        ],
+    )
+    def test_get_device_state_fallback(self, devices, parse_kwargs):
+        worker, job = self.collect()
+        ret = NetboxWorker.get_device_state(worker, job, devices, 60, **parse_kwargs)
+
+        assert worker.client.runs == [{**parse_kwargs, "FL": devices}]
+        assert "nornir-worker-1" in ret
+
+    def test_release_device_state(self):
+        worker, job = self.collect()
+        NetboxWorker.release_device_state(worker, job)
+        NetboxWorker.release_device_state(worker, job)
+
+        assert worker.device_state == {}
+        NetboxWorker.get_device_state(
+            worker, job, ["ceos-spine-1"], 60, get="interfaces"
+        )
+        assert len(worker.client.runs) == 1, "released state still used"
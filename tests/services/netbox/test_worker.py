@@ -1,6 +1,12 @@
 import pprint
+import threading
+from types import SimpleNamespace
 
 import pytest
+import requests
+
+from norfab.workers.netbox_worker import netbox_worker
+from norfab.workers.netbox_worker.netbox_worker import NetboxWorker
 
 pytestmark = pytest.mark.netbox
 
@@ -79,3 +85,107 @@ class TestNetboxWorker:
             ), f"{worker} - not all netbox instances inventory data returned"
             for instance, compatible in res["result"].items():
                 assert compatible == True, f"{worker}:{instance} - not compatible"
+
+
+class FakeBranches:
+    def __init__(self):
+        self.status = "ready"
+        self.gets = 0
+
+    def get(self, name):
+        self.gets += 1
+        return SimpleNamespace(
+            status=SimpleNamespace(value=self.status), schema_id=f"{name}-schema"
+        )
+
+
+class FakePynetboxWorker:
+    name = "netbox-worker-test"
+    default_instance = "prod"
+    netbox_retry = 0
+    pynetbox_pool_size = 2
+    pynetbox_cache_idle = 600
+    pynetbox_branch_ttl = 60
+    _get_pynetbox = NetboxWorker._get_pynetbox
+    _get_branch_schema_id = NetboxWorker._get_branch_schema_id
+    _evict_idle_pynetbox = NetboxWorker._evict_idle_pynetbox
+    pynetbox_cache_invalidate = NetboxWorker.pynetbox_cache_invalidate
+
+    def __init__(self):
+        self.pynetbox_cache = {}
+        self.pynetbox_lock = threading.Lock()
+        self.branches = FakeBranches()
+
+    def _get_instance_params(self, name=None):
+        return {"url": f"http://{name}", "token": "token"}
+
+    def has_plugin(self, plugin_name, instance, strict=False):
+        return True
+
+
+class TestPynetboxCache:
+    @pytest.fixture
+    def worker(self, monkeypatch):
+        worker = FakePynetboxWorker()
+
+        def api(url, token, threading):
+            return SimpleNamespace(
+                http_session=requests.Session(),
+                plugins=SimpleNamespace(
+                    branching=SimpleNamespace(branches=worker.branches)
+                ),
+            )
+
+        monkeypatch.setattr(netbox_worker.pynetbox, "api", api)
+        return worker
+
+    def test_connections_pool_reused(self, worker):
+        nb1 = worker._get_pynetbox("prod", branch="b1")
+        nb2 = worker._get_pynetbox("prod", branch="b1")
+        worker._get_pynetbox("dev")
+
+        assert nb1 is not nb2, "pynetbox API object reused"
+        assert nb1.http_session.get_adapter("https://prod") is (
+            nb2.http_session.get_adapter("https://prod")
+        ), "connections pool not reused"
+        assert nb2.http_session.headers["X-NetBox-Branch"] == "b1-schema"
+        assert worker.branches.gets == 1, "cached branch schema ID not used"
+        assert set(worker.pynetbox_cache) == {("prod", "b1", True), ("dev", None, True)}
+
+    def test_branch_revalidated_after_ttl(self, worker):
+        worker._get_pynetbox("prod", branch="b1")
+        worker.pynetbox_cache[("prod", "b1", True)]["branch_validated"] -= 61
+        worker._get_pynetbox("prod", branch="b1")
+
+        assert worker.branches.gets == 2, "expired branch schema ID not re-validated"
+
+    def test_merged_branch_invalidated(self, worker):
+        worker._get_pynetbox("prod", branch="b1")
+        worker.branches.status = "merged"
+        worker.pynetbox_cache[("prod", "b1", True)]["branch_validated"] -= 61
+
+        with pytest.raises(RuntimeError):
+            worker._get_pynetbox("prod", branch="b1")
+        assert ("prod", "b1", True) not in worker.pynetbox_cache
+
+    def test_idle_entries_evicted(self, worker):
+        worker._get_pynetbox("prod")
+        worker.pynetbox_cache[("prod", None, True)]["last_used"] -= 601
+        worker._get_pynetbox("dev")
+
+        assert list(worker.pynetbox_cache) == [("dev", None, True)]
+
+    @pytest.mark.parametrize(
+        "instance, branch, remaining",
+        [
+            (None, None, set()),
+            ("prod", None, {("dev", "b1", True)}),
+            ("prod", "b1", {("prod", "b2", True), ("dev", "b1", True)}),
+        ],
+    )
+    def test_pynetbox_cache_invalidate(self, worker, instance, branch, remaining):
+        for key in [("prod", "b1"), ("prod", "b2"), ("dev", "b1")]:
+            worker._get_pynetbox(*key)
+        worker.pynetbox_cache_invalidate(instance, branch)
+
+        assert set(worker.pynetbox_cache) == remaining
@@ -1,12 +1,54 @@
 import pprint
 import pytest
 
+from norfab.workers.nornir_worker.parse_task import TTPTemplatesCache
+
 pytestmark = [
     pytest.mark.nornir,
     pytest.mark.nornir_parse,
 ]
 
 
+class TestTTPTemplatesCache:
+    template = """
+<group name="interfaces">
+interface {{ name }}
+ description {{ description | ORPHRASE }}
+</group>
+"""
+
+    def test_templates_reused_between_inputs(self):
+        cache = TTPTemplatesCache()
+        results = [
+            cache.parse(
+                self.template,
+                f"interface Eth{i}\n description port {i}",
+                "Default_Input",
+                "_root_template_",
+                "flat_list",
+            )
+            for i in range(3)
+        ]
+        pprint.pprint(results)
+
+        assert cache.misses == 1
+        assert cache.hits == 2
+        assert results == [
+            [{"interfaces": {"name": f"Eth{i}", "description": f"port {i}"}}]
+            for i in range(3)
+        ]
+
+    def test_templates_lru_eviction(self):
+        cache = TTPTemplatesCache(maxsize=2)
+        templates = [f"<group>interface {{{{ name }}}}{i}</group>" for i in range(3)]
+        for template in templates:
+            cache.get(template)
+        cache.get(templates[0])
+
+        assert len(cache.templates) == 2
+        assert cache.misses == 4
+
+
 class TestNornirParseTasks:
 
     def test_nornir_parse_napalm_get_facts(self, nfclient):
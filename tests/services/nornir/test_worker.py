@@ -1,6 +1,13 @@
 import pprint
+import threading
+import time
 
 import pytest
+from nornir import InitNornir
+from nornir_salt.plugins.functions import FFun, InventoryFun
+
+from norfab.workers.nornir_worker.nornir_hosts_index import NornirHostsIndex
+from norfab.workers.nornir_worker.nornir_worker import ConnectionsLock, NornirWorker
 
 pytestmark = pytest.mark.nornir
 
@@ -57,6 +64,133 @@ class TestNornirWorker:
         pass
 
 
+class TestNornirHostsIndex:
+    filters = [
+        {"FL": "ceos-spine-1,ceos-leaf-2"},
+        {"FL": ["ceos-spine-1", "nonexist"]},
+        {"FL": "_all_"},
+        {"FL": "_all_", "FB": "ceos-leaf-1*"},
+        {"FB": "ceos-spine-*"},
+        {"FB": "*-1"},
+        {"FH": "10.0.1.*"},
+        {"FM": "arista*"},
+        {"FG": "spines"},
+        {"FG": "dc1"},
+        {"FP": "10.0.1.0/24"},
+        {"FP": "10.0.0.0/8", "FM": "cisco_ios"},
+        {"FB": "ceos-*", "FN": True},
+        {"FG": "leafs", "FO": {"role": "leaf"}},
+    ]
+
+    def make_nornir(self):
+        hosts = {}
+        for i in range(1, 21):
+            hosts[f"ceos-spine-{i}"] = {
+                "hostname": f"10.0.1.{i}",
+                "platform": "arista_eos",
+                "groups": ["spines"],
+                "data": {"role": "spine"},
+            }
+            hosts[f"ceos-leaf-{i}"] = {
+                "hostname": f"10.0.2.{i}",
+                "platform": "arista_eos",
+                "groups": ["leafs"],
+                "data": {"role": "leaf" if i % 2 else "border"},
+            }
+            hosts[f"iosxe-{i}"] = {
+                "hostname": f"iosxe-{i}.lab.local",
+                "platform": "cisco_ios",
+            }
+        return InitNornir(
+            logging={"enabled": False},
+            inventory={
+                "plugin": "DictInventory",
+                "options": {
+                    "hosts": hosts,
+                    "groups": {
+                        "dc1": {},
+                        "spines": {"groups": ["dc1"]},
+                        "leafs": {"groups": ["dc1"]},
+                    },
+                    "defaults": {},
+                },
+            },
+        )
+
+    def filter_with_index(self, index, nr, filters):
+        candidates = index.candidates(filters)
+        if candidates is None:
+            return sorted(FFun(nr, **filters).inventory.hosts)
+        return sorted(FFun(index.view(candidates), **filters).inventory.hosts)
+
+    def test_hosts_index_filters(self):
+        nr = self.make_nornir()
+        index = NornirHostsIndex(nr)
+
+        for filters in self.filters:
+            expected = sorted(FFun(nr, **filters).inventory.hosts)
+            assert (
+                self.filter_with_index(index, nr, filters) == expected
+            ), f"filters {filters} results mismatch"
+
+    def test_hosts_index_runtime_inventory_update(self):
+        nr = self.make_nornir()
+        index = NornirHostsIndex(nr)
+        actions = [
+            {"call": "create_host", "name": "ceos-spine-99", "hostname": "10.0.1.99"},
+            {"call": "update_host", "name": "iosxe-1", "platform": "arista_eos"},
+            {"call": "delete_host", "name": "ceos-spine-1"},
+        ]
+        InventoryFun(nr, call="load", data=actions)
+        index.apply("load", {"data": actions})
+
+        assert len(index.hosts) == len(nr.inventory.hosts)
+        for filters in self.filters + [{"FP": "10.0.1.99/32"}, {"FL": "ceos-spine-1"}]:
+            expected = sorted(FFun(nr, **filters).inventory.hosts)
+            assert (
+                self.filter_with_index(index, nr, filters) == expected
+            ), f"filters {filters} results mismatch"
+
+
+class TestNornirJobView:
+    def test_nornir_job_view_isolation(self):
+        nr = TestNornirHostsIndex().make_nornir()
+        nr.data.failed_hosts.add("ceos-spine-1")
+        nr.inventory.hosts["ceos-spine-1"].connections["netmiko"] = "connection"
+
+        job_nr = NornirWorker.nornir_job_view(None, FFun(nr, FB="ceos-spine-*"))
+        job_host = job_nr.inventory.hosts["ceos-spine-1"]
+        job_host.data["__task__"] = {"commands": ["show clock"]}
+        job_nr.data.failed_hosts.add("ceos-spine-2")
+
+        assert len(job_nr.inventory.hosts) == 20
+        assert job_nr.data.failed_hosts == {"ceos-spine-2"}
+        assert nr.data.failed_hosts == {"ceos-spine-1"}
+        assert job_nr.runner is not nr.runner
+        assert "__task__" not in nr.inventory.hosts["ceos-spine-1"].data
+        assert job_host.connections["netmiko"] == "connection"
+
+    def test_connections_lock_hosts(self):
+        lock = ConnectionsLock()
+
+        def job(hosts):
+            with lock.hosts(hosts):
+                time.sleep(0.2)
+
+        start = time.time()
+        threads = [
+            threading.Thread(target=job, args=([f"host-{i}"],)) for i in range(5)
+        ]
+        [t.start() for t in threads]
+        time.sleep(0.05)
+        assert lock.acquire(blocking=False) is False, "jobs still running"
+        [t.join() for t in threads]
+
+        assert time.time() - start < 0.5, "jobs for different hosts not parallel"
+        assert lock.acquire(blocking=False) is True
+        lock.release()
+
+
 # ----------------------------------------------------------------------------
 # NORNIR.CLI FUNCTION TESTS
 # ----------------------------------------------------------------------------
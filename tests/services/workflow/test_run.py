@@ -203,6 +203,34 @@ class TestWorkflowRunTask:
             ]
         ), "step3 should be not in results"
 
+    def test_workflow_stop_on_no_results(self, nfclient):
+        ret = nfclient.run_job(
+            "workflow",
+            "run",
+            kwargs={
+                "workflow": "nf://workflow/test_workflow_stop_on_no_results.yaml",
+            },
+        )
+        pprint.pprint(ret)
+
+        step1 = ret["workflow-worker-1"]["result"]["test_workflow_stop_on_no_results"][
+            "step1_no_results"
+        ]
+        assert step1, "test_workflow_stop_on_no_results step1 has no results"
+        for worker_name, worker_result in step1.items():
+            assert (
+                worker_result["failed"] is True
+            ), f"test_workflow_stop_on_no_results step1 {worker_name} should be failed"
+            assert worker_result[
+                "errors"
+            ], f"test_workflow_stop_on_no_results step1 {worker_name} has no errors"
+        assert (
+            "step2-should-not-run"
+            not in ret["workflow-worker-1"]["result"][
+                "test_workflow_stop_on_no_results"
+            ]
+        ), "step2 should be not in results"
+
     def test_workflow_run_if_error(self, nfclient):
         ret = nfclient.run_job(
             "workflow",